@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""
+BrowserTool benchmark suite
+
+Runs every BrowserTool operation against a local headless Chromium, whose CDP
+endpoint stands in for the AgentCore ws_url/ws_headers, and fixture pages
+served from a local HTTP server (see benchmarks/fixture_site.py). Reports
+latency, counted CDP round trips, bytes returned by the page and memory per
+operation, and compares them against a stored baseline.
+
+Usage (from the agentcore-browser directory):
+    python -m benchmarks.browser_tool_suite --save-baseline benchmarks/baseline.json
+    python -m benchmarks.browser_tool_suite --baseline benchmarks/baseline.json --tolerance 0.15
+
+Exits with status 1 when --baseline is given and an operation regressed, and
+with status 2 before running anything when the baseline file is missing or
+unreadable. No baseline is checked in: latency depends on the machine, so
+record one with --save-baseline on the runner that will compare against it.
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from scripts.browser_tool import BrowserTool
+from scripts.instrumentation import HistogramExporter, Instrumentation
+from benchmarks.fixture_site import CRAWL_PAGE_COUNT, FixtureSite, form_values
+
+# Metrics compared against the baseline; round trips regress on any increase
+TIMING_METRICS = ("median_ms", "bytes_returned")
+MEMORY_METRICS = ("python_peak_kb", "js_heap_kb")
+
+
+class LocalChromium:
+    """Headless Chromium started as a subprocess with a CDP WebSocket endpoint."""
+
+    def __init__(self, executable: Optional[str] = None, startup_timeout: float = 30):
+        """
+        Args:
+            executable: Chromium binary (default: Playwright's bundled Chromium)
+            startup_timeout: Seconds to wait for the DevTools endpoint
+        """
+        self.executable = executable
+        self.startup_timeout = startup_timeout
+        self._process: Optional[subprocess.Popen] = None
+        self._profile_dir: Optional[str] = None
+
+    @staticmethod
+    def _playwright_executable() -> str:
+        from playwright.sync_api import sync_playwright
+
+        with sync_playwright() as p:
+            return p.chromium.executable_path
+
+    def start(self) -> str:
+        """Launch Chromium and return its browser-level CDP WebSocket URL."""
+        executable = self.executable or self._playwright_executable()
+        self._profile_dir = tempfile.mkdtemp(prefix="agentcore-bench-")
+        args = [
+            executable,
+            "--headless=new",
+            "--remote-debugging-port=0",
+            f"--user-data-dir={self._profile_dir}",
+            "--no-first-run",
+            "--no-default-browser-check",
+            "--disable-background-networking",
+            "--disable-extensions",
+            "--enable-precise-memory-info",
+            "--mute-audio",
+        ]
+        if hasattr(os, "geteuid") and os.geteuid() == 0:
+            args.append("--no-sandbox")
+        # The tool attaches to the first page of the default context, as on AgentCore
+        args.append("about:blank")
+        self._process = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        # Chromium writes the chosen port and browser path once the endpoint is up
+        port_file = os.path.join(self._profile_dir, "DevToolsActivePort")
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError(f"Chromium exited with status {self._process.returncode}")
+            try:
+                with open(port_file) as f:
+                    lines = f.read().split()
+                if len(lines) >= 2:
+                    return f"ws://127.0.0.1:{lines[0]}{lines[1]}"
+            except FileNotFoundError:
+                pass
+            time.sleep(0.05)
+        self.stop()
+        raise TimeoutError(f"Chromium did not open a DevTools endpoint within {self.startup_timeout}s")
+
+    def stop(self):
+        if self._process is not None:
+            self._process.terminate()
+            try:
+                self._process.wait(10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+            self._process = None
+        if self._profile_dir is not None:
+            shutil.rmtree(self._profile_dir, ignore_errors=True)
+            self._profile_dir = None
+
+    def __enter__(self) -> str:
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+def _all_succeeded(results: List[Dict[str, Any]]) -> Tuple[bool, Optional[str]]:
+    for result in results:
+        if not result.get("success"):
+            return False, result.get("error")
+    return True, None
+
+
+def _single(result: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    return _all_succeeded([result])
+
+
+def _stream(tool: BrowserTool, site: FixtureSite, args) -> Tuple[bool, Optional[str]]:
+    chunks = list(tool.stream_text_sync(site.url("/docs"), wait_time=args.wait_time))
+    ok, error = _all_succeeded(chunks)
+    if ok and not chunks[-1].get("done"):
+        return False, "stream ended before the last chunk"
+    return ok, error
+
+
+def _crawl_urls(site: FixtureSite) -> List[str]:
+    return [site.url(f"/crawl/{i}") for i in range(CRAWL_PAGE_COUNT)]
+
+
+# name -> callable(tool, site, args) returning (ok, error)
+CASES: Dict[str, Callable[[BrowserTool, FixtureSite, Any], Tuple[bool, Optional[str]]]] = {
+    "browse_url": lambda tool, site, args: _single(
+        tool.browse_url_sync(site.url("/docs"), wait_time=args.wait_time, use_cache=False)
+    ),
+    "extract_content": lambda tool, site, args: _single(
+        tool.extract_content_sync(site.url("/links"), wait_time=args.wait_time, use_cache=False)
+    ),
+    "extract_main_content": lambda tool, site, args: _single(
+        tool.extract_main_content_sync(site.url("/docs"), wait_time=args.wait_time, use_cache=False)
+    ),
+    "search_web": lambda tool, site, args: _single(
+        tool.search_web_sync("agentcore browser", wait_time=args.wait_time)
+    ),
+    "fill_form": lambda tool, site, args: _single(
+        tool.fill_form_sync(site.url("/form"), json.dumps(form_values()), wait_time=args.wait_time)
+    ),
+    "execute_script": lambda tool, site, args: _single(
+        tool.execute_script_sync(site.url("/docs"), "document.querySelectorAll('*').length",
+                                 wait_time=args.wait_time)
+    ),
+    "stream_text": _stream,
+    "run_actions": lambda tool, site, args: _single(tool.run_actions_sync([
+        {"action": "goto", "url": site.url("/form"), "wait_time": args.wait_time},
+        {"action": "fill", "fields": form_values()},
+        {"action": "evaluate", "script": "document.forms[0].elements.length"},
+        {"action": "extract", "mode": "text"},
+    ])),
+    "browse_many": lambda tool, site, args: _all_succeeded(list(
+        tool.browse_many_sync(_crawl_urls(site), args.concurrency, wait_time=args.wait_time, use_cache=False)
+    )),
+    "extract_many": lambda tool, site, args: _all_succeeded(list(
+        tool.extract_many_sync(_crawl_urls(site), args.concurrency, wait_time=args.wait_time, use_cache=False)
+    )),
+}
+
+
+def _js_heap_kb(tool: BrowserTool) -> Optional[float]:
+    result = tool.execute_script_sync(
+        script="performance.memory ? performance.memory.usedJSHeapSize : null"
+    ).get("result")
+    return round(result / 1024, 1) if result is not None else None
+
+
+def measure(name: str, tool: BrowserTool, site: FixtureSite, instrumentation: Instrumentation,
+            args) -> Dict[str, Any]:
+    """Time one case over args.runs runs after args.warmup unrecorded runs."""
+    case = CASES[name]
+    for _ in range(args.warmup):
+        case(tool, site, args)
+
+    timings, round_trips, bytes_returned, errors = [], [], [], []
+    for _ in range(args.runs):
+        before = instrumentation.totals()
+        start = time.perf_counter()
+        ok, error = case(tool, site, args)
+        timings.append((time.perf_counter() - start) * 1000)
+        after = instrumentation.totals()
+        round_trips.append(after.get("cdp_round_trips", 0) - before.get("cdp_round_trips", 0))
+        bytes_returned.append(after.get("cdp_bytes_returned", 0) - before.get("cdp_bytes_returned", 0))
+        if not ok:
+            errors.append(error)
+
+    # Separate pass: tracing allocations slows the call down
+    tracemalloc.start()
+    case(tool, site, args)
+    python_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    ordered = sorted(timings)
+    return {
+        "runs": args.runs,
+        "failures": len(errors),
+        "first_error": errors[0] if errors else None,
+        "median_ms": round(statistics.median(timings), 1),
+        "p95_ms": round(ordered[max(1, math.ceil(0.95 * len(ordered))) - 1], 1),
+        "min_ms": round(ordered[0], 1),
+        "stdev_ms": round(statistics.stdev(timings), 1) if len(timings) > 1 else 0.0,
+        "round_trips": int(statistics.median(round_trips)),
+        "bytes_returned": int(statistics.median(bytes_returned)),
+        "python_peak_kb": round(python_peak / 1024, 1),
+        "js_heap_kb": _js_heap_kb(tool),
+    }
+
+
+def run(args) -> Dict[str, Any]:
+    names = args.only.split(",") if args.only else list(CASES)
+    unknown = [name for name in names if name not in CASES]
+    if unknown:
+        raise SystemExit(f"Unknown operations: {', '.join(unknown)}; available: {', '.join(CASES)}")
+
+    histogram = HistogramExporter()
+    instrumentation = Instrumentation([histogram])
+    report: Dict[str, Any] = {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "settings": {
+            "runs": args.runs,
+            "warmup": args.warmup,
+            "readiness": args.readiness,
+            "network_profile": args.network_profile,
+            "wait_time": args.wait_time,
+            "concurrency": args.concurrency,
+        },
+        "operations": {},
+    }
+
+    with FixtureSite() as site, LocalChromium(args.chromium) as ws_url:
+        tool = BrowserTool(
+            session_id="local-benchmark",
+            ws_url=ws_url,
+            ws_headers={},
+            readiness=args.readiness,
+            network_profile=args.network_profile,
+            instrumentation=instrumentation,
+        )
+        tool.search_url = site.url("/search")
+        with tool:
+            report["environment"]["browser"] = tool.execute_script_sync(script="navigator.userAgent").get("result")
+            report["connect_ms"] = histogram.summary().get("connect", {}).get("mean_ms")
+            for name in names:
+                print(f"Running {name}...", file=sys.stderr)
+                report["operations"][name] = measure(name, tool, site, instrumentation, args)
+    return report
+
+
+def load_baseline(path: str) -> Dict[str, Any]:
+    """Read a report saved with --save-baseline; raises ValueError if it is missing or malformed."""
+    if not os.path.isfile(path):
+        raise ValueError(
+            f"Baseline {path} does not exist. Record one on this machine first with: "
+            f"python -m benchmarks.browser_tool_suite --save-baseline {path}"
+        )
+    try:
+        with open(path) as f:
+            baseline = json.load(f)
+    except ValueError as e:
+        raise ValueError(f"Baseline {path} is not valid JSON: {e}")
+    if not isinstance(baseline, dict) or not isinstance(baseline.get("operations"), dict):
+        raise ValueError(f"Baseline {path} has no 'operations'; was it written by --save-baseline?")
+    return baseline
+
+
+def environment_differences(report: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """Environment and settings fields that differ from the baseline's, which make timings incomparable."""
+    differences = []
+    for section in ("environment", "settings"):
+        current, previous = report.get(section, {}), baseline.get(section, {})
+        for key in sorted(set(current) | set(previous)):
+            if current.get(key) != previous.get(key):
+                differences.append(f"{section}.{key}: baseline {previous.get(key)!r}, current {current.get(key)!r}")
+    return differences
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[Dict[str, Any]]:
+    """Compare report against baseline; one row per operation and metric present in both."""
+    rows = []
+    for name, current in report["operations"].items():
+        previous = baseline.get("operations", {}).get(name)
+        if previous is None:
+            continue
+        for metric in ("round_trips",) + TIMING_METRICS + MEMORY_METRICS:
+            old, new = previous.get(metric), current.get(metric)
+            if old is None or new is None:
+                continue
+            change = (new - old) / old if old else (0.0 if new == old else float("inf"))
+            if metric == "round_trips":
+                regression = new > old
+            elif metric in TIMING_METRICS:
+                regression = change > tolerance
+            else:
+                # Memory is reported but too noisy to fail a run on
+                regression = False
+            rows.append({
+                "operation": name,
+                "metric": metric,
+                "baseline": old,
+                "current": new,
+                "change": round(change, 3),
+                "regression": regression,
+            })
+    return rows
+
+
+def print_report(report: Dict[str, Any]):
+    print(f"browser: {report['environment'].get('browser')}")
+    print(f"connect: {report.get('connect_ms')} ms")
+    header = f"{'operation':<16} {'median ms':>10} {'p95 ms':>8} {'stdev':>7} {'round trips':>11} " \
+             f"{'bytes':>9} {'py peak KB':>10} {'js heap KB':>10} {'fail':>5}"
+    print(header)
+    for name, r in report["operations"].items():
+        print(f"{name:<16} {r['median_ms']:>10} {r['p95_ms']:>8} {r['stdev_ms']:>7} {r['round_trips']:>11} "
+              f"{r['bytes_returned']:>9} {r['python_peak_kb']:>10} {str(r['js_heap_kb']):>10} {r['failures']:>5}")
+        if r["first_error"]:
+            print(f"  first error: {r['first_error']}")
+
+
+def print_comparison(rows: List[Dict[str, Any]], tolerance: float):
+    print(f"\nBaseline comparison (tolerance {tolerance:.0%}):")
+    print(f"{'operation':<16} {'metric':<15} {'baseline':>10} {'current':>10} {'change':>8}")
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(f"{row['operation']:<16} {row['metric']:<15} {row['baseline']:>10} {row['current']:>10} "
+              f"{row['change']:>+8.1%}{flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1, help="Unrecorded runs per operation")
+    parser.add_argument("--only", help=f"Comma-separated subset of: {', '.join(CASES)}")
+    parser.add_argument("--readiness", default="load", help="Readiness strategy for every navigation")
+    parser.add_argument("--network-profile", default="full")
+    parser.add_argument("--wait-time", type=float, default=3, help="Readiness upper bound in seconds")
+    parser.add_argument("--concurrency", type=int, default=4, help="Tabs used by browse_many/extract_many")
+    parser.add_argument("--chromium", help="Chromium executable (default: Playwright's bundled Chromium)")
+    parser.add_argument("--baseline", help="Compare against this saved report")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="Allowed relative increase in latency and bytes before flagging a regression")
+    parser.add_argument("--save-baseline", help="Write this run's report to a file")
+    parser.add_argument("--json", action="store_true", help="Print the raw JSON report")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        try:
+            baseline = load_baseline(args.baseline)
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            sys.exit(2)
+
+    report = run(args)
+    rows = []
+    if baseline is not None:
+        rows = compare(report, baseline, args.tolerance)
+        report["comparison"] = rows
+        for difference in environment_differences(report, baseline):
+            print(f"Warning: {difference}", file=sys.stderr)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+        if baseline is not None:
+            print_comparison(rows, args.tolerance)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump({k: v for k, v in report.items() if k != "comparison"}, f, indent=2)
+        print(f"Saved baseline to {args.save_baseline}", file=sys.stderr)
+
+    if any(row["regression"] for row in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
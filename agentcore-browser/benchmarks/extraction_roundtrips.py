@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Extraction round-trip benchmark
+
+Compares the legacy per-element locator extraction with the single evaluated
+scripts used by BrowserTool.extract_content and BrowserTool.search_web. Runs
+against a local headless Chromium and a generated fixture page. --rtt-ms adds
+simulated latency to every round trip to approximate a remote AgentCore
+WebSocket.
+
+Usage (from the agentcore-browser directory):
+    python -m benchmarks.extraction_roundtrips --rtt-ms 40 --runs 5
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+from playwright.async_api import async_playwright
+
+from scripts.browser_tool import MAX_IMAGES, MAX_LINKS, MAX_SEARCH_RESULTS, MAX_TEXT_CHARS
+from scripts.page_scripts import EXTRACT_CONTENT_SCRIPT, SEARCH_RESULTS_SCRIPT, TRUNCATION_MARKER
+
+
+class RoundTripCounter:
+    """Counts awaited browser calls and optionally delays each by a simulated RTT."""
+
+    def __init__(self, rtt_ms: float = 0):
+        self.count = 0
+        self.rtt = rtt_ms / 1000
+
+    async def __call__(self, awaitable: Awaitable[Any]) -> Any:
+        self.count += 1
+        if self.rtt:
+            await asyncio.sleep(self.rtt)
+        return await awaitable
+
+
+def build_fixture(headings: int, links: int, images: int, results: int) -> str:
+    """Generate a page with the requested number of headings, links, images and div.g results."""
+    parts = ["<html><head><title>Extraction fixture</title></head><body>"]
+    for i in range(headings):
+        level = i % 6 + 1
+        parts.append(f"<h{level}>Heading {i}</h{level}><p>Paragraph {i} " + "lorem ipsum " * 20 + "</p>")
+    for i in range(links):
+        parts.append(f'<a href="/page/{i}">Link {i}</a> ')
+    for i in range(images):
+        parts.append(f'<img src="/img/{i}.png" alt="Image {i}">')
+    for i in range(results):
+        parts.append(
+            f'<div class="g"><a href="https://example.com/{i}"><h3>Result {i}</h3></a>'
+            f"<span>Snippet for result {i}</span></div>"
+        )
+    parts.append("</body></html>")
+    return "".join(parts)
+
+
+async def legacy_extract_content(page, rt: RoundTripCounter) -> Dict[str, Any]:
+    """extract_content as implemented before the single-script extraction."""
+    content = {"title": await rt(page.title()), "url": page.url, "headings": [], "links": [], "images": []}
+    for i in range(1, 7):
+        for heading in await rt(page.locator(f"h{i}").all()):
+            text = (await rt(heading.inner_text())).strip()
+            if text:
+                content["headings"].append({"level": i, "text": text})
+    for link in (await rt(page.locator("a[href]").all()))[:MAX_LINKS]:
+        text = (await rt(link.inner_text())).strip()
+        href = await rt(link.get_attribute("href"))
+        if text and href:
+            content["links"].append({"text": text, "url": href})
+    for img in (await rt(page.locator("img[src]").all()))[:MAX_IMAGES]:
+        src = await rt(img.get_attribute("src"))
+        alt = await rt(img.get_attribute("alt")) or ""
+        if src:
+            content["images"].append({"src": src, "alt": alt})
+    text_content = await rt(page.inner_text("body"))
+    if len(text_content) > MAX_TEXT_CHARS:
+        text_content = text_content[:MAX_TEXT_CHARS] + TRUNCATION_MARKER
+    content["text_content"] = text_content
+    return content
+
+
+async def single_extract_content(page, rt: RoundTripCounter) -> Dict[str, Any]:
+    extracted = await rt(page.evaluate(
+        EXTRACT_CONTENT_SCRIPT, [MAX_LINKS, MAX_IMAGES, MAX_TEXT_CHARS, TRUNCATION_MARKER]
+    ))
+    return {"title": extracted.pop("title"), "url": page.url, **extracted}
+
+
+async def legacy_search_results(page, rt: RoundTripCounter) -> List[Dict[str, Any]]:
+    """search_web result parsing as implemented before the single-script extraction."""
+    results = []
+    for result in (await rt(page.locator("div.g").all()))[:MAX_SEARCH_RESULTS]:
+        title_element = result.locator("h3").first
+        link_element = result.locator("a").first
+        snippet_element = result.locator("span").first
+        if await rt(title_element.count()) > 0 and await rt(link_element.count()) > 0:
+            title = await rt(title_element.inner_text())
+            url = await rt(link_element.get_attribute("href"))
+            snippet = await rt(snippet_element.inner_text()) if await rt(snippet_element.count()) > 0 else ""
+            results.append({"title": title, "url": url, "snippet": snippet})
+    return results
+
+
+async def single_search_results(page, rt: RoundTripCounter) -> List[Dict[str, Any]]:
+    return await rt(page.evaluate(SEARCH_RESULTS_SCRIPT, [MAX_SEARCH_RESULTS]))
+
+
+async def measure(page, func: Callable, runs: int, rtt_ms: float) -> Dict[str, Any]:
+    timings = []
+    round_trips = 0
+    output = None
+    for _ in range(runs):
+        rt = RoundTripCounter(rtt_ms)
+        start = time.perf_counter()
+        output = await func(page, rt)
+        timings.append((time.perf_counter() - start) * 1000)
+        round_trips = rt.count
+    return {
+        "round_trips": round_trips,
+        "median_ms": round(statistics.median(timings), 1),
+        "min_ms": round(min(timings), 1),
+        "output": output
+    }
+
+
+async def run(args) -> Dict[str, Any]:
+    html = build_fixture(args.headings, args.links, args.images, args.results)
+    report = {}
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        page = await browser.new_page()
+        await page.set_content(html)
+
+        cases = {
+            "extract_content": (legacy_extract_content, single_extract_content),
+            "search_web": (legacy_search_results, single_search_results),
+        }
+        for name, (legacy, single) in cases.items():
+            before = await measure(page, legacy, args.runs, args.rtt_ms)
+            after = await measure(page, single, args.runs, args.rtt_ms)
+            report[name] = {
+                "legacy": {k: v for k, v in before.items() if k != "output"},
+                "single_script": {k: v for k, v in after.items() if k != "output"},
+                "speedup": round(before["median_ms"] / max(after["median_ms"], 0.001), 1),
+                "same_output": before["output"] == after["output"]
+            }
+        await browser.close()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--headings", type=int, default=60)
+    parser.add_argument("--links", type=int, default=200)
+    parser.add_argument("--images", type=int, default=40)
+    parser.add_argument("--results", type=int, default=10)
+    parser.add_argument("--rtt-ms", type=float, default=0, help="Simulated latency added per round trip")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="Print the raw JSON report")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"{'operation':<16} {'variant':<14} {'round trips':>11} {'median ms':>10} {'min ms':>8}")
+    for name, result in report.items():
+        for variant in ("legacy", "single_script"):
+            r = result[variant]
+            print(f"{name:<16} {variant:<14} {r['round_trips']:>11} {r['median_ms']:>10} {r['min_ms']:>8}")
+        print(f"{name:<16} speedup x{result['speedup']}, same output: {result['same_output']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Fixture site
+
+Deterministic pages served from a local HTTP server for the offline
+benchmarks: a large docs page, a link-heavy page, a 50-field form, a search
+page that renders Google-shaped div.g results and small pages for crawls.
+"""
+
+import html
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qs, urlsplit
+
+FORM_FIELD_COUNT = 50
+SEARCH_RESULT_COUNT = 10
+CRAWL_PAGE_COUNT = 16
+
+_LOREM = (
+    "AgentCore Browser runs a managed Chromium session that agents drive over the "
+    "Chrome DevTools Protocol. Each session is isolated and can be observed live. "
+)
+
+
+def _page(title: str, body: str) -> str:
+    return (
+        "<!DOCTYPE html><html><head><meta charset=\"utf-8\">"
+        f"<title>{html.escape(title)}</title>"
+        "<style>body{font-family:sans-serif;max-width:960px;margin:auto}"
+        "nav a{margin-right:8px}.g{margin:12px 0}</style>"
+        f"</head><body>{body}</body></html>"
+    )
+
+
+def docs_page(sections: int = 200) -> str:
+    """A long documentation page: nested headings, paragraphs, code blocks and tables."""
+    parts = ["<h1>AgentCore Browser Developer Guide</h1>", "<nav>"]
+    parts += [f'<a href="#section-{i}">Section {i}</a>' for i in range(sections)]
+    parts.append("</nav><main>")
+    for i in range(sections):
+        parts.append(f'<section id="section-{i}"><h{2 + i % 3}>Section {i}: Topic {i % 17}</h{2 + i % 3}>')
+        for p in range(4):
+            parts.append(f"<p>{_LOREM * (2 + (i + p) % 3)}Paragraph {i}.{p}.</p>")
+        parts.append(f"<pre><code>client.start_browser_session(name=\"docs-{i}\")\n"
+                     f"response = client.get_browser_session(sessionId=\"{i:08d}\")</code></pre>")
+        parts.append("<table><tr><th>Parameter</th><th>Description</th></tr>")
+        parts += [f"<tr><td>param_{i}_{r}</td><td>Value {r} for section {i}</td></tr>" for r in range(3)]
+        parts.append("</table></section>")
+    parts.append("</main>")
+    return _page("AgentCore Browser Developer Guide", "".join(parts))
+
+
+def links_page(links: int = 2000, images: int = 200) -> str:
+    """A link-heavy index page with headings every 50 links and inline images."""
+    parts = ["<h1>Link index</h1>"]
+    image_every = max(1, links // max(1, images))
+    for i in range(links):
+        if i % 50 == 0:
+            parts.append(f"<h2>Group {i // 50}</h2>")
+        parts.append(f'<a href="/crawl/{i % CRAWL_PAGE_COUNT}?ref={i}">Link {i}</a> ')
+        if i % image_every == 0 and i // image_every < images:
+            parts.append(f'<img src="data:image/gif;base64,R0lGODlhAQABAAAAACw=" alt="Image {i}">')
+    return _page("Link index", "".join(parts))
+
+
+def _form_field(i: int) -> str:
+    name = f"field_{i}"
+    label = f'<label for="{name}">Field {i}</label>'
+    if i < 38:
+        kind = ("text", "email", "number", "date")[i % 4]
+        return f'<div>{label}<input type="{kind}" id="{name}" name="{name}"></div>'
+    if i < 42:
+        return f'<div>{label}<textarea id="{name}" name="{name}"></textarea></div>'
+    if i < 46:
+        options = "".join(f'<option value="opt-{o}">Option {o}</option>' for o in range(5))
+        return f'<div>{label}<select id="{name}" name="{name}">{options}</select></div>'
+    if i < 49:
+        return f'<div>{label}<input type="checkbox" id="{name}" name="{name}"></div>'
+    radios = "".join(
+        f'<label><input type="radio" name="{name}" value="{plan}">{plan}</label>' for plan in ("free", "pro", "team")
+    )
+    return f"<div>{radios}</div>"
+
+
+def form_page() -> str:
+    """A form with FORM_FIELD_COUNT fields: text-like inputs, textareas, selects, checkboxes and a radio group."""
+    fields = "".join(_form_field(i) for i in range(FORM_FIELD_COUNT))
+    return _page("Registration form", f'<h1>Registration</h1><form action="/form" method="get">{fields}'
+                                      '<button type="submit">Submit</button></form>')
+
+
+def form_values() -> Dict[str, Any]:
+    """fill_form data that fills every field of form_page()."""
+    values: Dict[str, Any] = {}
+    for i in range(FORM_FIELD_COUNT):
+        name = f"field_{i}"
+        if i < 38:
+            values[name] = (f"Value {i}", f"user{i}@example.com", str(i * 7), "2024-01-15")[i % 4]
+        elif i < 42:
+            values[name] = f"Multi-line text for field {i}\nsecond line"
+        elif i < 46:
+            values[name] = f"opt-{i % 5}"
+        elif i < 49:
+            values[name] = True
+        else:
+            values[name] = "pro"
+    return values
+
+
+def search_page(query: Optional[str] = None) -> str:
+    """A search form; with a query, SEARCH_RESULT_COUNT results shaped like Google's div.g blocks."""
+    value = html.escape(query or "", quote=True)
+    parts = [f'<form action="/search" method="get"><input name="q" value="{value}"><button>Search</button></form>']
+    if query:
+        for i in range(SEARCH_RESULT_COUNT):
+            parts.append(
+                f'<div class="g"><a href="https://example.com/{i}?q={value}"><h3>{html.escape(query)} result {i}</h3></a>'
+                f"<div><span>Snippet {i}: {_LOREM}</span></div></div>"
+            )
+    return _page(f"{query} - Search" if query else "Search", "".join(parts))
+
+
+def crawl_page(index: int) -> str:
+    """A small article page used by crawl benchmarks."""
+    body = f"<h1>Article {index}</h1>" + "".join(f"<p>{_LOREM}Article {index}, part {p}.</p>" for p in range(20))
+    return _page(f"Article {index}", body)
+
+
+class FixtureSite:
+    """Serves the fixture pages from a ThreadingHTTPServer on a background thread."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        """
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+        """
+        self._pages = {
+            "/docs": docs_page().encode("utf-8"),
+            "/links": links_page().encode("utf-8"),
+            "/form": form_page().encode("utf-8"),
+        }
+        for i in range(CRAWL_PAGE_COUNT):
+            self._pages[f"/crawl/{i}"] = crawl_page(i).encode("utf-8")
+
+        pages = self._pages
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                if parts.path == "/search":
+                    query = parse_qs(parts.query).get("q", [None])[0]
+                    body = search_page(query).encode("utf-8")
+                else:
+                    body = pages.get(parts.path)
+                if body is None:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Cache-Control", "no-store")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, path: str) -> str:
+        return self.base_url + path
+
+    def start(self) -> "FixtureSite":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fixture-site", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "FixtureSite":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
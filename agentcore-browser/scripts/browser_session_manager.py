@@ -6,15 +6,30 @@ Session information is returned directly and should be stored by the caller.
 """
 
 import logging
-from typing import Dict, Any, Optional
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, Iterable, List, Optional
 
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 from bedrock_agentcore.tools.browser_client import BrowserClient
 
+from .browser_session_pool import BrowserSessionPool
+from .instrumentation import NOOP, Instrumentation
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+BROWSER_IDENTIFIER = "aws.browser.v1"
+
+# What BrowserClient.start() sends when no timeout is given
+DEFAULT_SESSION_TIMEOUT_SECONDS = 3600
+
+# Matches botocore's default max_pool_connections, so workers never queue
+# for an HTTP connection on the shared client
+DEFAULT_MAX_WORKERS = 10
+
 
 class BrowserSessionManager:
     """
@@ -25,21 +40,105 @@ class BrowserSessionManager:
     and should be managed by the caller.
     """
 
-    def __init__(self, aws_region: str = "us-east-1"):
+    def __init__(self, aws_region: str = "us-east-1", client_factory: Callable[[str], Any] = BrowserClient,
+                 instrumentation: Optional[Instrumentation] = None):
         """
         Initialize the session manager.
 
         Args:
             aws_region: AWS region for AgentCore Browser service
+            client_factory: Callable returning a BrowserClient for a region
+                (override to run against a stubbed client)
+            instrumentation: Optional Instrumentation receiving timing spans
+                for control-plane calls (disabled by default)
         """
         self.aws_region = aws_region
+        self.instrumentation = instrumentation or NOOP
+        self._client_factory = client_factory
+        self._control_clients: Dict[str, Any] = {}
+        self._clients_lock = threading.Lock()
+        self._signing_lock = threading.Lock()
+        self._pool: Optional[BrowserSessionPool] = None
+
+    def _control_client(self) -> Any:
+        """Return the long-lived BrowserClient shared by all calls for this region."""
+        with self._clients_lock:
+            browser_client = self._control_clients.get(self.aws_region)
+            if browser_client is None:
+                browser_client = self._client_factory(self.aws_region)
+                self._control_clients[self.aws_region] = browser_client
+            return browser_client
+
+    def _data_plane(self) -> Any:
+        """Return the boto3 client behind the shared BrowserClient."""
+        browser_client = self._control_client()
+        # Newer bedrock-agentcore releases name it data_plane_client, older ones client
+        return getattr(browser_client, "data_plane_client", None) or browser_client.client
+
+    def _start_session(self, session_timeout_seconds: Optional[int] = None) -> str:
+        """Start a new session through the shared client and return its ID."""
+        params = {
+            "browserIdentifier": BROWSER_IDENTIFIER,
+            "name": f"browser-session-{uuid.uuid4().hex[:8]}",
+            "sessionTimeoutSeconds": session_timeout_seconds or DEFAULT_SESSION_TIMEOUT_SECONDS
+        }
+
+        with self.instrumentation.span("session.start", region=self.aws_region) as span:
+            self.instrumentation.count("control_plane_calls")
+            response = self._data_plane().start_browser_session(**params)
+            span.set(session_id=response["sessionId"])
+        return response["sessionId"]
+
+    def _session_info(self, session_id: str) -> Dict[str, Any]:
+        """Generate connection details for a started session."""
+        browser_client = self._control_client()
+
+        # Signing reads the session from the client, so serialize access to it
+        with self._signing_lock:
+            browser_client.identifier = BROWSER_IDENTIFIER
+            browser_client.session_id = session_id
+            ws_url, headers = browser_client.generate_ws_headers()
+            live_view_url = browser_client.generate_live_view_url(expires=300)
+
+        return {
+            "success": True,
+            "status": "Browser session initialized successfully",
+            "session_id": session_id,
+            "ws_url": ws_url,
+            "ws_headers": headers,
+            "live_view_url": live_view_url,
+            "aws_region": self.aws_region
+        }
+
+    def _stop_session(self, session_id: str):
+        """Stop a session, raising on failure."""
+        with self.instrumentation.span("session.close", region=self.aws_region, session_id=session_id):
+            self.instrumentation.count("control_plane_calls")
+            self._data_plane().stop_browser_session(
+                browserIdentifier=BROWSER_IDENTIFIER,
+                sessionId=session_id
+            )
+
+    def _map_concurrently(self, func: Callable[[Any], Any], items: Iterable[Any],
+                          max_workers: int = DEFAULT_MAX_WORKERS) -> List[Any]:
+        """Apply func to every item on a bounded thread pool, preserving order."""
+        items = list(items)
+        if len(items) <= 1:
+            return [func(item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as executor:
+            return list(executor.map(func, items))
 
     def init_browser_session(self, session_timeout_seconds: Optional[int] = None) -> Dict[str, Any]:
         """
         Initialize AWS AgentCore Browser session.
 
+        When a session pool is running (see start_session_pool), a warm session
+        is leased from the pool instead and session_timeout_seconds is ignored
+        in favour of the pool's own timeout.
+
         Args:
-            session_timeout_seconds: Optional session timeout in seconds
+            session_timeout_seconds: Optional session timeout in seconds (default: 3600)
 
         Returns:
             Dictionary containing session information including:
@@ -49,34 +148,44 @@ class BrowserSessionManager:
             - ws_headers: WebSocket connection headers
             - live_view_url: URL to view browser activity (expires in 300s)
         """
-        try:
-            browser_client = BrowserClient(self.aws_region)
+        if self._pool is not None:
+            return self._pool.acquire()
 
-            if session_timeout_seconds:
-                browser_client.start(
-                    identifier="aws.browser.v1",
-                    session_timeout_seconds=session_timeout_seconds
-                )
-            else:
-                browser_client.start(identifier="aws.browser.v1")
+        try:
+            session = self._session_info(self._start_session(session_timeout_seconds))
 
-            ws_url, headers = browser_client.generate_ws_headers()
-            live_view_url = browser_client.generate_live_view_url(expires=300)
+            logger.info(f"Browser session initialized: {session['session_id']}")
 
-            logger.info(f"Browser session initialized: {browser_client.session_id}")
+            return session
 
+        except (NoCredentialsError, ClientError, Exception) as e:
+            logger.error(f"Error initializing browser session: {e}")
             return {
-                "success": True,
-                "status": "Browser session initialized successfully",
-                "session_id": browser_client.session_id,
-                "ws_url": ws_url,
-                "ws_headers": headers,
-                "live_view_url": live_view_url,
-                "aws_region": self.aws_region
+                "success": False,
+                "status": f"Error: {str(e)}",
+                "error": str(e)
             }
 
+    def get_connection_info(self, session_id: str) -> Dict[str, Any]:
+        """
+        Re-sign the connection details of a running session.
+
+        BrowserTool can use this (via refresh_connection) to reconnect to the
+        same session after its original ws_headers expired.
+
+        Args:
+            session_id: The session ID to reconnect to
+
+        Returns:
+            Dictionary with the same fields as init_browser_session
+        """
+        try:
+            info = self._session_info(session_id)
+            info["status"] = "Connection info refreshed"
+            return info
+
         except (NoCredentialsError, ClientError, Exception) as e:
-            logger.error(f"Error initializing browser session: {e}")
+            logger.error(f"Error refreshing connection info: {e}")
             return {
                 "success": False,
                 "status": f"Error: {str(e)}",
@@ -87,6 +196,9 @@ class BrowserSessionManager:
         """
         Close the browser session and cleanup resources.
 
+        Sessions leased from a running pool are handed back to the pool, which
+        stops them in the background and starts a replacement.
+
         Args:
             session_id: The session ID to close
 
@@ -100,12 +212,11 @@ class BrowserSessionManager:
                 "error": "Missing session_id parameter"
             }
 
+        if self._pool is not None and self._pool.owns(session_id):
+            return self._pool.release(session_id, reuse=False)
+
         try:
-            browser_client = BrowserClient(self.aws_region)
-            browser_client.client.stop_browser_session(
-                browserIdentifier="aws.browser.v1",
-                sessionId=session_id
-            )
+            self._stop_session(session_id)
 
             logger.info(f"Browser session stopped: {session_id}")
 
@@ -122,3 +233,158 @@ class BrowserSessionManager:
                 "status": f"Error: {str(e)}",
                 "error": str(e)
             }
+
+    def start_sessions(self, count: int, session_timeout_seconds: Optional[int] = None,
+                       max_workers: int = DEFAULT_MAX_WORKERS) -> Dict[str, Any]:
+        """
+        Initialize several browser sessions concurrently.
+
+        Args:
+            count: Number of sessions to start
+            session_timeout_seconds: Optional session timeout in seconds
+            max_workers: Upper bound on concurrent start requests
+
+        Returns:
+            Dictionary containing overall status and a sessions list with one
+            init_browser_session result per requested session
+        """
+        sessions = self._map_concurrently(
+            lambda _: self.init_browser_session(session_timeout_seconds),
+            range(count),
+            max_workers
+        )
+        started = sum(1 for session in sessions if session["success"])
+
+        logger.info(f"Started {started} of {count} browser sessions")
+        return {
+            "success": started == count,
+            "status": f"Started {started} of {count} sessions",
+            "sessions": sessions
+        }
+
+    def close_sessions(self, session_ids: Iterable[str],
+                       max_workers: int = DEFAULT_MAX_WORKERS) -> Dict[str, Any]:
+        """
+        Close several browser sessions concurrently.
+
+        Args:
+            session_ids: Session IDs to close
+            max_workers: Upper bound on concurrent stop requests
+
+        Returns:
+            Dictionary containing overall status and a results list with one
+            close_browser_session result per session ID, in input order
+        """
+        session_ids = list(session_ids)
+        results = self._map_concurrently(self.close_browser_session, session_ids, max_workers)
+        closed = sum(1 for result in results if result["success"])
+
+        logger.info(f"Closed {closed} of {len(session_ids)} browser sessions")
+        return {
+            "success": closed == len(session_ids),
+            "status": f"Closed {closed} of {len(session_ids)} sessions",
+            "results": results
+        }
+
+    def get_session_status(self, session_id: str) -> Dict[str, Any]:
+        """
+        Look up the service-side status of a browser session.
+
+        Args:
+            session_id: The session ID to inspect
+
+        Returns:
+            Dictionary containing operation status and session_status
+            (e.g. "READY" or "TERMINATED")
+        """
+        try:
+            with self.instrumentation.span("session.status", region=self.aws_region, session_id=session_id):
+                self.instrumentation.count("control_plane_calls")
+                response = self._data_plane().get_browser_session(
+                    browserIdentifier=BROWSER_IDENTIFIER,
+                    sessionId=session_id
+                )
+
+            return {
+                "success": True,
+                "status": "Browser session status retrieved",
+                "session_id": session_id,
+                "session_status": response.get("status")
+            }
+
+        except (ClientError, Exception) as e:
+            logger.error(f"Error getting browser session status: {e}")
+            return {
+                "success": False,
+                "status": f"Error: {str(e)}",
+                "error": str(e)
+            }
+
+    def start_session_pool(self, size: int = 2, session_timeout_seconds: int = 900,
+                           wait: bool = False, wait_timeout: Optional[float] = None,
+                           **pool_options) -> BrowserSessionPool:
+        """
+        Switch the manager into pool mode with pre-started sessions.
+
+        While the pool runs, init_browser_session leases warm sessions and
+        close_browser_session hands them back for replacement.
+
+        Args:
+            size: Number of idle sessions to keep ready
+            session_timeout_seconds: Timeout for every pooled session
+            wait: Block until the pool is fully warm
+            wait_timeout: Maximum seconds to wait when wait=True
+            **pool_options: Extra BrowserSessionPool options (eviction_margin_seconds,
+                max_idle_seconds, health_check_interval_seconds, acquire_timeout_seconds)
+
+        Returns:
+            The running BrowserSessionPool
+        """
+        if self._pool is not None:
+            return self._pool
+
+        self._pool = BrowserSessionPool(
+            self,
+            size=size,
+            session_timeout_seconds=session_timeout_seconds,
+            **pool_options
+        ).start()
+        logger.info(f"Browser session pool started with {size} sessions")
+
+        if wait:
+            self._pool.wait_until_ready(wait_timeout)
+        return self._pool
+
+    def release_browser_session(self, session_id: str) -> Dict[str, Any]:
+        """
+        Return a pooled session for reuse by a later init_browser_session call.
+
+        Args:
+            session_id: Session leased from the pool
+
+        Returns:
+            Dictionary containing operation status
+        """
+        if self._pool is None:
+            return {
+                "success": False,
+                "status": "No session pool is running",
+                "error": "Session pool not started"
+            }
+        return self._pool.release(session_id, reuse=True)
+
+    def shutdown_session_pool(self, close_leased: bool = False) -> Dict[str, Any]:
+        """
+        Stop the session pool and close its idle sessions.
+
+        Args:
+            close_leased: Also stop sessions that are still leased out
+
+        Returns:
+            Dictionary containing operation status
+        """
+        if self._pool is None:
+            return {"success": True, "status": "No session pool is running", "closed_sessions": 0}
+
+        pool, self._pool = self._pool, None
+        return pool.shutdown(close_leased=close_leased)
@@ -0,0 +1,393 @@
+"""
+AgentCore Browser Session Pool
+
+Keeps a number of AgentCore Browser sessions pre-started so that callers can
+lease a ready session in milliseconds instead of waiting for a cold start.
+A background thread refills the pool, health-checks idle sessions and retires
+them well before their session timeout runs out.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _PooledSession:
+    """Bookkeeping for a single session owned by the pool."""
+
+    def __init__(self, session_id: str, session_timeout_seconds: int):
+        now = time.monotonic()
+        self.session_id = session_id
+        self.started_at = now
+        self.expires_at = now + session_timeout_seconds
+        self.idle_since = now
+        self.last_checked = now
+
+
+class BrowserSessionPool:
+    """
+    Pool of warm AgentCore Browser sessions with lease/return semantics.
+
+    Sessions are started through the owning BrowserSessionManager, so the pool
+    can be exercised against a stubbed BrowserClient by passing a
+    ``client_factory`` to the manager.
+    """
+
+    def __init__(
+        self,
+        manager: Any,
+        size: int = 2,
+        session_timeout_seconds: int = 900,
+        eviction_margin_seconds: int = 120,
+        max_idle_seconds: Optional[float] = None,
+        health_check_interval_seconds: float = 60.0,
+        acquire_timeout_seconds: float = 60.0,
+    ):
+        """
+        Initialize the pool. Call start() to begin pre-starting sessions.
+
+        Args:
+            manager: BrowserSessionManager used to start, inspect and stop sessions
+            size: Number of idle sessions to keep ready
+            session_timeout_seconds: Timeout passed to every pooled session
+            eviction_margin_seconds: Retire sessions this long before they time out
+            max_idle_seconds: Optional cap on how long a session may sit idle
+            health_check_interval_seconds: How often idle sessions are checked
+            acquire_timeout_seconds: Default time acquire() waits for a session
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        if eviction_margin_seconds >= session_timeout_seconds:
+            raise ValueError("eviction_margin_seconds must be smaller than session_timeout_seconds")
+
+        self.manager = manager
+        self.size = size
+        self.session_timeout_seconds = session_timeout_seconds
+        self.eviction_margin_seconds = eviction_margin_seconds
+        self.max_idle_seconds = max_idle_seconds
+        self.health_check_interval_seconds = health_check_interval_seconds
+        self.acquire_timeout_seconds = acquire_timeout_seconds
+
+        self._idle: Deque[_PooledSession] = deque()
+        self._leased: Dict[str, _PooledSession] = {}
+        self._retired: List[_PooledSession] = []
+        self._starting = 0
+        self._start_failures = 0
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._counters = {
+            "leases": 0,
+            "lease_waits": 0,
+            "lease_timeouts": 0,
+            "sessions_started": 0,
+            "start_failures": 0,
+            "sessions_evicted": 0,
+            "sessions_unhealthy": 0,
+            "sessions_reused": 0,
+        }
+
+    # Lifecycle
+
+    def start(self) -> "BrowserSessionPool":
+        """Start the background maintenance thread."""
+        with self._cond:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="browser-session-pool", daemon=True
+                )
+                self._thread.start()
+        return self
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until the pool holds ``size`` idle sessions or timeout elapses."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while len(self._idle) < self.size and not self._closed:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return not self._closed
+
+    def shutdown(self, close_leased: bool = False) -> Dict[str, Any]:
+        """
+        Stop the maintenance thread and close pooled sessions.
+
+        Args:
+            close_leased: Also stop sessions that are currently leased out
+
+        Returns:
+            Dictionary containing operation status and the number of sessions closed
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+        with self._cond:
+            to_close = list(self._idle) + self._retired
+            self._idle.clear()
+            self._retired = []
+            if close_leased:
+                to_close.extend(self._leased.values())
+                self._leased.clear()
+
+        self.manager._map_concurrently(self._stop, to_close)
+
+        logger.info(f"Browser session pool shut down, closed {len(to_close)} sessions")
+        return {
+            "success": True,
+            "status": "Browser session pool shut down",
+            "closed_sessions": len(to_close)
+        }
+
+    # Leasing
+
+    def acquire(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Lease a warm session from the pool.
+
+        Args:
+            timeout: Seconds to wait for a session (default: acquire_timeout_seconds)
+
+        Returns:
+            Same shape as BrowserSessionManager.init_browser_session, with
+            freshly generated ws_headers and live_view_url
+        """
+        timeout = self.acquire_timeout_seconds if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        waited = False
+
+        with self._cond:
+            while True:
+                if self._closed:
+                    return self._failure("Browser session pool is shut down")
+                session = self._pop_usable_locked()
+                if session is not None:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._counters["lease_timeouts"] += 1
+                    return self._failure(f"Timed out after {timeout}s waiting for a pooled browser session")
+                waited = True
+                self._cond.notify_all()
+                self._cond.wait(remaining)
+
+            self._leased[session.session_id] = session
+            self._counters["leases"] += 1
+            if waited:
+                self._counters["lease_waits"] += 1
+            # Wake the maintenance thread so it can refill the slot
+            self._cond.notify_all()
+
+        try:
+            info = self.manager._session_info(session.session_id)
+        except Exception as e:
+            logger.error(f"Error preparing pooled session {session.session_id}: {e}")
+            with self._cond:
+                self._leased.pop(session.session_id, None)
+                self._retired.append(session)
+                self._cond.notify_all()
+            return self._failure(str(e))
+
+        info["status"] = "Browser session leased from pool"
+        info["pooled"] = True
+        logger.info(f"Browser session leased from pool: {session.session_id}")
+        return info
+
+    def release(self, session_id: str, reuse: bool = True) -> Dict[str, Any]:
+        """
+        Return a leased session to the pool.
+
+        Args:
+            session_id: Session previously returned by acquire()
+            reuse: Put the session back into the idle set; when False the
+                session is stopped in the background and replaced
+
+        Returns:
+            Dictionary containing operation status
+        """
+        with self._cond:
+            session = self._leased.pop(session_id, None)
+            if session is None:
+                return {
+                    "success": False,
+                    "status": f"Session {session_id} is not leased from this pool",
+                    "error": "Unknown session_id"
+                }
+
+            now = time.monotonic()
+            if reuse and not self._closed and not self._is_expiring(session, now):
+                session.idle_since = now
+                self._idle.append(session)
+                self._counters["sessions_reused"] += 1
+                status = "Browser session returned to pool"
+            else:
+                self._retired.append(session)
+                status = "Browser session released for shutdown"
+            self._cond.notify_all()
+
+        logger.info(f"{status}: {session_id}")
+        return {"success": True, "status": status, "session_id": session_id}
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None, reuse: bool = False) -> Iterator[Dict[str, Any]]:
+        """Context manager that acquires a session and releases it on exit."""
+        session = self.acquire(timeout)
+        if not session["success"]:
+            raise RuntimeError(session["error"])
+        try:
+            yield session
+        finally:
+            self.release(session["session_id"], reuse=reuse)
+
+    def owns(self, session_id: str) -> bool:
+        """Return True if session_id is currently leased from this pool."""
+        with self._cond:
+            return session_id in self._leased
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of pool occupancy and lifetime counters."""
+        with self._cond:
+            return {
+                "size": self.size,
+                "idle": len(self._idle),
+                "leased": len(self._leased),
+                "starting": self._starting,
+                "closed": self._closed,
+                **self._counters
+            }
+
+    # Internals
+
+    def _failure(self, message: str) -> Dict[str, Any]:
+        return {"success": False, "status": f"Error: {message}", "error": message}
+
+    def _is_expiring(self, session: _PooledSession, now: float) -> bool:
+        return now >= session.expires_at - self.eviction_margin_seconds
+
+    def _is_stale(self, session: _PooledSession, now: float) -> bool:
+        if self._is_expiring(session, now):
+            return True
+        return self.max_idle_seconds is not None and now - session.idle_since >= self.max_idle_seconds
+
+    def _pop_usable_locked(self) -> Optional[_PooledSession]:
+        now = time.monotonic()
+        while self._idle:
+            session = self._idle.popleft()
+            if not self._is_stale(session, now):
+                return session
+            self._counters["sessions_evicted"] += 1
+            self._retired.append(session)
+        return None
+
+    def _collect_retired_locked(self, now: float) -> List[_PooledSession]:
+        keep: Deque[_PooledSession] = deque()
+        for session in self._idle:
+            if self._is_stale(session, now):
+                self._counters["sessions_evicted"] += 1
+                self._retired.append(session)
+            else:
+                keep.append(session)
+        # Sessions returned for reuse may push the pool above its target size
+        while len(keep) > self.size:
+            self._retired.append(keep.popleft())
+        self._idle = keep
+
+        retired, self._retired = self._retired, []
+        return retired
+
+    def _next_wakeup_locked(self, now: float) -> float:
+        wakeup = now + self.health_check_interval_seconds
+        for session in self._idle:
+            wakeup = min(wakeup, session.expires_at - self.eviction_margin_seconds)
+            if self.max_idle_seconds is not None:
+                wakeup = min(wakeup, session.idle_since + self.max_idle_seconds)
+        return max(wakeup - now, 0.05)
+
+    def _stop(self, session: _PooledSession):
+        try:
+            self.manager._stop_session(session.session_id)
+            logger.info(f"Pooled browser session stopped: {session.session_id}")
+        except Exception as e:
+            logger.warning(f"Error stopping pooled session {session.session_id}: {e}")
+
+    def _check_health(self, sessions: List[_PooledSession]):
+        for session in sessions:
+            result = self.manager.get_session_status(session.session_id)
+            healthy = result["success"] and result.get("session_status") == "READY"
+            with self._cond:
+                session.last_checked = time.monotonic()
+                if healthy or session not in self._idle:
+                    continue
+                self._idle.remove(session)
+                self._retired.append(session)
+                self._counters["sessions_unhealthy"] += 1
+                self._cond.notify_all()
+            logger.warning(f"Pooled session {session.session_id} failed health check: {result.get('session_status') or result.get('error')}")
+
+    def _start_one(self, _: Any = None):
+        try:
+            session_id = self.manager._start_session(self.session_timeout_seconds)
+        except Exception as e:
+            logger.error(f"Error pre-starting pooled browser session: {e}")
+            with self._cond:
+                self._starting -= 1
+                self._start_failures += 1
+                self._counters["start_failures"] += 1
+                self._cond.notify_all()
+            return
+
+        session = _PooledSession(session_id, self.session_timeout_seconds)
+        with self._cond:
+            self._starting -= 1
+            self._start_failures = 0
+            self._counters["sessions_started"] += 1
+            if self._closed:
+                self._retired.append(session)
+            else:
+                self._idle.append(session)
+            self._cond.notify_all()
+        logger.info(f"Pooled browser session ready: {session.session_id}")
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if self._closed:
+                    return
+                now = time.monotonic()
+                retired = self._collect_retired_locked(now)
+                due = [
+                    s for s in self._idle
+                    if now - s.last_checked >= self.health_check_interval_seconds
+                ]
+                missing = max(self.size - len(self._idle) - self._starting, 0)
+                self._starting += missing
+                backoff = min(2 ** self._start_failures, 30) if self._start_failures else 0
+
+            if retired:
+                self.manager._map_concurrently(self._stop, retired)
+            if due:
+                self._check_health(due)
+            if missing and backoff:
+                with self._cond:
+                    self._cond.wait(backoff)
+                    if self._closed:
+                        self._starting -= missing
+                        return
+            if missing:
+                self.manager._map_concurrently(self._start_one, range(missing))
+
+            if retired or due or missing:
+                continue
+            with self._cond:
+                if not self._closed and not self._retired and len(self._idle) + self._starting >= self.size:
+                    self._cond.wait(self._next_wakeup_locked(time.monotonic()))
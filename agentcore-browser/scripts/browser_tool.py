@@ -6,23 +6,138 @@ Session info passed directly without ParameterStore dependency.
 """
 
 import asyncio
+import functools
 import json
 import logging
-from typing import Dict, Any, Optional
+import threading
+import time
+import uuid
+import weakref
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
-import nest_asyncio
-from playwright.async_api import async_playwright
-
-nest_asyncio.apply()
+from .connection_registry import SHARED_REGISTRY, ConnectionRegistry
+from .instrumentation import NOOP, Instrumentation, payload_size
+from .network_profiles import NetworkProfile, RequestBlocker, get_profile
+from .page_readiness import DEFAULT_READINESS, validate_strategy, wait_until_ready
+from .page_scripts import (
+    EXTRACT_CONTENT_SCRIPT, FILL_FORM_SCRIPT, MAIN_CONTENT_SCRIPT, PAGE_TEXT_SCRIPT, SEARCH_RESULTS_SCRIPT, TEXT_CURSOR_CLOSE_SCRIPT,
+    TEXT_CURSOR_OPEN_SCRIPT, TEXT_CURSOR_READ_SCRIPT, TRUNCATION_MARKER
+)
+from .result_cache import ResultCache, cache_key
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Result limits shared by the in-page extraction scripts
+MAX_PAGE_CHARS = 5000
+MAX_TEXT_CHARS = 3000
+MAX_LINKS = 20
+MAX_IMAGES = 10
+MAX_SEARCH_RESULTS = 10
+
+# Main-content extraction: default budget and the bytes-per-token estimate used
+# to turn a token budget into the byte budget enforced in the page
+MAIN_CONTENT_TOKENS = 2000
+BYTES_PER_TOKEN = 4
+MAIN_CONTENT_FORMATS = ("markdown", "text")
+
+# Search page used by search_web; must have an input[name="q"] and render div.g results
+SEARCH_URL = "https://www.google.com"
+
+# Reconnect backoff: attempts and the delay before the 2nd, doubling up to the cap
+RECONNECT_ATTEMPTS = 4
+RECONNECT_BASE_DELAY_SECONDS = 0.05
+RECONNECT_MAX_DELAY_SECONDS = 1.0
+PROBE_TIMEOUT_SECONDS = 2.0
+
+# run_actions: step name -> keys the step must have, and the default per-step timeout
+ACTION_REQUIRED_KEYS = {
+    "goto": ("url",),
+    "wait_for": (),
+    "fill": (),
+    "click": ("selector",),
+    "evaluate": ("script",),
+    "extract": (),
+}
+ACTION_TIMEOUT_MS = 30000
+
+# Default chunk size for text cursors and stream_text
+TEXT_CHUNK_CHARS = 16000
+
+# Part of every cache key, so changing a limit never serves stale-shaped results
+_CACHE_LIMITS = {
+    "browse_url": {"max_chars": MAX_PAGE_CHARS},
+    "extract_content": {"max_links": MAX_LINKS, "max_images": MAX_IMAGES, "max_chars": MAX_TEXT_CHARS},
+}
+
+
+def _traced(name: str):
+    """Record an instrumentation span around a public async operation."""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            with self.instrumentation.span(name, session_id=self.session_id) as span:
+                result = await func(self, *args, **kwargs)
+                span.set(success=result.get("success"), cached=result.get("cached"))
+                return result
+        return wrapper
+    return decorator
+
+
+def _main_content_budget(max_tokens: Optional[int], max_bytes: Optional[int]) -> int:
+    """Byte budget for main-content extraction; max_bytes wins, 0 included."""
+    return max_bytes if max_bytes is not None else (max_tokens or MAIN_CONTENT_TOKENS) * BYTES_PER_TOKEN
+
+
+def _validate_actions(actions: Any) -> Optional[str]:
+    """Return a description of the first invalid run_actions step, or None."""
+    if not isinstance(actions, list):
+        return "actions must be a list of steps"
+    for index, step in enumerate(actions):
+        if not isinstance(step, dict):
+            return f"Step {index} must be an object"
+        name = step.get("action")
+        if name not in ACTION_REQUIRED_KEYS:
+            return f"Step {index}: unknown action '{name}', expected one of: {', '.join(ACTION_REQUIRED_KEYS)}"
+        missing = [key for key in ACTION_REQUIRED_KEYS[name] if key not in step]
+        if missing:
+            return f"Step {index} ({name}) is missing: {', '.join(missing)}"
+        if name == "fill" and "fields" not in step and not ("selector" in step and "value" in step):
+            return f"Step {index} (fill) needs 'fields' or 'selector' and 'value'"
+        for key in ("max_tokens", "max_bytes"):
+            value = step.get(key)
+            if value is not None and (isinstance(value, bool) or not isinstance(value, int) or value < 0):
+                return f"Step {index} ({name}): {key} must be a non-negative integer"
+        if "readiness" in step:
+            try:
+                validate_strategy(step["readiness"])
+            except ValueError as e:
+                return f"Step {index} ({name}): {e}"
+    return None
+
 
 class BrowserTool:
-    """Browser automation tool using Playwright and AWS AgentCore Browser."""
+    """
+    Browser automation tool using Playwright and AWS AgentCore Browser.
+
+    The async methods run on the caller's event loop. The ``*_sync`` methods run
+    on the connection registry's background loop, so the CDP connection
+    survives between sync calls. Use one style per tool instance: Playwright
+    objects stay bound to the loop that created them.
+
+    Tools on the same loop share one Playwright driver, and tools pointing at
+    the same session_id share one CDP connection (see ConnectionRegistry).
+    """
+
+    # Overridable per instance, e.g. to point search_web at a local fixture
+    search_url = SEARCH_URL
 
-    def __init__(self, session_id: str, ws_url: str, ws_headers: Dict[str, str], aws_region: str = "us-east-1"):
+    def __init__(self, session_id: str, ws_url: str, ws_headers: Dict[str, str], aws_region: str = "us-east-1",
+                 readiness: str = DEFAULT_READINESS, cache: Optional[ResultCache] = None,
+                 network_profile: Union[str, NetworkProfile] = "full",
+                 instrumentation: Optional[Instrumentation] = None,
+                 registry: Optional[ConnectionRegistry] = None,
+                 refresh_connection: Optional[Callable[[], Dict[str, Any]]] = None):
         """
         Initialize browser tool with session information.
 
@@ -31,177 +146,473 @@ class BrowserTool:
             ws_url: WebSocket connection URL
             ws_headers: WebSocket connection headers
             aws_region: AWS region
+            readiness: Default page readiness strategy ("dom-quiescence",
+                "network-idle", "selector", "load", "fixed" or "none")
+            cache: Optional ResultCache for browse_url/extract_content results
+            network_profile: Request-blocking profile ("full", "no-media",
+                "text-only") or a custom NetworkProfile
+            instrumentation: Optional Instrumentation receiving timing spans
+                and CDP round-trip/byte counters (disabled by default)
+            registry: ConnectionRegistry sharing the driver and connections
+                (default: the process-wide SHARED_REGISTRY)
+            refresh_connection: Optional callable returning fresh {ws_url,
+                ws_headers} for this session (e.g. a partial of
+                BrowserSessionManager.get_connection_info), used when a
+                reconnect attempt fails because the signed headers expired
         """
         self.session_id = session_id
         self.ws_url = ws_url
         self.ws_headers = ws_headers
         self.aws_region = aws_region
+        self.readiness = validate_strategy(readiness)
+        self.cache = cache
+        self.network_profile = get_profile(network_profile)
+        self.instrumentation = instrumentation or NOOP
+        self.registry = registry or SHARED_REGISTRY
+        self.refresh_connection = refresh_connection
+        self._blockers: "weakref.WeakKeyDictionary[Any, RequestBlocker]" = weakref.WeakKeyDictionary()
         self._browser = None
         self._page = None
-        self._playwright = None
         self._initialized = False
+        self._connect_lock: Optional[asyncio.Lock] = None
+        self._sync_lock = threading.Lock()
+
+    def _connection_alive(self) -> bool:
+        """Local liveness check: no round trip, just Playwright's connection and page state."""
+        return (
+            self._initialized
+            and self._browser is not None and self._browser.is_connected()
+            and self._page is not None and not self._page.is_closed()
+        )
 
     async def _ensure_connected(self):
-        """Ensure browser connection is established."""
-        if self._initialized and self._page:
+        """Ensure the connection and page are usable, recovering whichever one died."""
+        if self._connection_alive():
             return
 
+        # Created on first use and kept for the tool's lifetime: _connect() runs
+        # _cleanup() while holding it, and a fresh lock would let a concurrent
+        # caller connect in parallel
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if self._connection_alive():
+                return
+            if self._initialized and self._browser.is_connected():
+                await self._select_page()
+            else:
+                await self._connect()
+
+    async def _select_page(self):
+        """Attach to the session's first open page, opening a new one if all were closed."""
+        contexts = self._browser.contexts
+        context = contexts[0] if contexts else await self._round_trip(self._browser.new_context())
+        pages = [page for page in context.pages if not page.is_closed()]
+        if pages:
+            self._page = pages[0]
+        else:
+            self._page = await self._round_trip(context.new_page())
+            logger.info("Opened a new page: the session had no open pages")
+
+    async def _connect(self):
+        """
+        Borrow the session's shared CDP connection and attach to a page.
+
+        Reuses the registry's running driver, retries with bounded exponential
+        backoff and refreshes the signed headers (if refresh_connection is set)
+        after a failed attempt.
+        """
+        if self._browser is not None:
+            # Stale connection: hand it back so the registry can replace it
+            await self._cleanup()
+
+        delay = RECONNECT_BASE_DELAY_SECONDS
+        for attempt in range(1, RECONNECT_ATTEMPTS + 1):
+            try:
+                logger.info(f"Initializing browser connection (attempt {attempt})...")
+                with self.instrumentation.span("connect", session_id=self.session_id, attempt=attempt):
+                    self._browser = await self.registry.borrow(
+                        self.session_id, self.ws_url, self.ws_headers, self.instrumentation
+                    )
+                    await self._select_page()
+                self._initialized = True
+                logger.info("Browser connection established")
+                return
+            except Exception as e:
+                await self._cleanup()
+                if attempt == RECONNECT_ATTEMPTS:
+                    logger.error(f"Failed to connect to browser: {e}")
+                    raise
+                logger.warning(f"Connect attempt {attempt} failed: {e}; retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, RECONNECT_MAX_DELAY_SECONDS)
+                self._refresh_connection_info()
+
+    def _refresh_connection_info(self):
+        if self.refresh_connection is None:
+            return
         try:
-            logger.info("Initializing browser connection...")
-            self._playwright = await async_playwright().start()
-            self._browser = await self._playwright.chromium.connect_over_cdp(
-                endpoint_url=self.ws_url,
-                headers=self.ws_headers
-            )
-            context = self._browser.contexts[0]
-            self._page = context.pages[0]
-            self._initialized = True
-            logger.info("Browser connection established")
+            info = self.refresh_connection()
         except Exception as e:
-            logger.error(f"Failed to connect to browser: {e}")
-            await self._cleanup()
-            raise
+            logger.warning(f"Could not refresh connection info: {e}")
+            return
+        if info.get("success", True) and info.get("ws_url"):
+            self.ws_url = info["ws_url"]
+            self.ws_headers = info["ws_headers"]
+
+    async def check_connection(self, reconnect: bool = True,
+                               probe_timeout: float = PROBE_TIMEOUT_SECONDS) -> Dict[str, Any]:
+        """
+        Probe the connection with one cheap round trip and optionally recover it.
+
+        A probe that fails or times out while Playwright still reports the
+        connection as open (e.g. a half-open WebSocket) discards the connection,
+        so the reconnect opens a fresh one.
 
-    async def _cleanup(self):
-        """Clean up browser resources."""
+        Args:
+            reconnect: Recover a dead connection or page before returning
+            probe_timeout: Seconds to wait for the probe round trip
+
+        Returns:
+            Dictionary with success, connected, page_attached, latency_ms,
+            recovered and status
+        """
+        recovered = False
+        for _ in range(2):
+            connected = self._browser is not None and self._browser.is_connected()
+            attached = connected and self._page is not None and not self._page.is_closed()
+            latency_ms = None
+            error = None
+            if attached:
+                start = time.perf_counter()
+                try:
+                    await asyncio.wait_for(self._evaluate(self._page, "1"), probe_timeout)
+                    latency_ms = round((time.perf_counter() - start) * 1000, 1)
+                except Exception as e:
+                    error = str(e) or type(e).__name__
+                    attached = False
+                    await self.registry.discard(self.session_id, self._browser)
+
+            if attached or not reconnect or recovered:
+                break
+            try:
+                await self._ensure_connected()
+                recovered = True
+            except Exception as e:
+                error = str(e)
+                break
+
+        return {
+            "success": attached,
+            "connected": connected,
+            "page_attached": attached,
+            "latency_ms": latency_ms,
+            "recovered": recovered and attached,
+            "status": "Connection healthy" if attached else f"Connection unavailable: {error or 'not connected'}"
+        }
+
+    async def cleanup(self, disconnect: bool = False):
+        """
+        Release the tool's borrowed connection.
+
+        Args:
+            disconnect: Close the connection now if no other tool borrows it,
+                instead of keeping it open for the registry's idle timeout
+        """
+        await self._cleanup(disconnect)
+
+    async def _cleanup(self, disconnect: bool = False):
+        """Release the borrowed connection; the registry disconnects it once idle."""
         try:
             if self._browser:
-                await self._browser.close()
-            if self._playwright:
-                await self._playwright.stop()
+                await self.registry.release(self.session_id, self._browser, disconnect)
         except Exception as e:
             logger.warning(f"Error during cleanup: {e}")
         finally:
             self._browser = None
             self._page = None
-            self._playwright = None
             self._initialized = False
 
-    async def browse_url(self, url: str, wait_time: int = 3) -> Dict[str, Any]:
-        """Navigate to URL and extract basic content."""
-        try:
-            await self._ensure_connected()
-            await self._page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await asyncio.sleep(wait_time)
+    async def _wait_until_ready(self, wait_time: float, readiness: Optional[str] = None,
+                                wait_selector: Optional[str] = None, page=None) -> Dict[str, Any]:
+        """Wait for the page (default: current page) to become ready, using wait_time as the upper bound."""
+        strategy = readiness or ("selector" if wait_selector else self.readiness)
+        with self.instrumentation.span("wait", strategy=strategy) as span:
+            report = await wait_until_ready(page or self._page, strategy, wait_time, selector=wait_selector)
+            self.instrumentation.count("cdp_round_trips", report["round_trips"])
+            span.set(timed_out=report["timed_out"])
+        logger.info(
+            f"Page ready via {report['strategy']} in {report['elapsed_ms']}ms"
+            f"{' (hit wait_time cap)' if report['timed_out'] else ''}"
+        )
+        return report
 
-            title = await self._page.title()
-            current_url = self._page.url
-            content = await self._page.inner_text("body")
+    async def _round_trip(self, call: Awaitable[Any]) -> Any:
+        """Await one Playwright call, counted as one CDP round trip."""
+        self.instrumentation.count("cdp_round_trips")
+        return await call
 
-            if len(content) > 5000:
-                content = content[:5000] + "... [Content truncated]"
+    async def _evaluate(self, page, script: str, arg: Any = None) -> Any:
+        """page.evaluate, counted as one CDP round trip plus the bytes it returned."""
+        result = await page.evaluate(script, arg)
+        if self.instrumentation.enabled:
+            self.instrumentation.count("cdp_round_trips")
+            self.instrumentation.count("cdp_bytes_returned", payload_size(result))
+        return result
 
-            return {
-                "success": True,
-                "title": title,
-                "url": current_url,
-                "content": content,
-                "status": "Page loaded successfully"
-            }
+    async def _blocker_for(self, page) -> RequestBlocker:
+        """Return the page's RequestBlocker, installing the network profile on first use."""
+        blocker = self._blockers.get(page)
+        if blocker is None:
+            blocker = RequestBlocker(self.network_profile)
+            self.instrumentation.count("cdp_round_trips", await blocker.install(page))
+            self._blockers[page] = blocker
+        return blocker
+
+    async def _navigate(self, url: str, wait_time: float, readiness: Optional[str] = None,
+                        wait_selector: Optional[str] = None, timeout: int = 30000,
+                        page=None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Navigate the page (default: current page) to url and wait for readiness.
+
+        Returns:
+            The readiness report and the network report for this navigation
+        """
+        page = page or self._page
+        blocker = await self._blocker_for(page)
+        blocker.reset()
+        with self.instrumentation.span("navigate", url=url):
+            await self._round_trip(page.goto(url, wait_until="domcontentloaded", timeout=timeout))
+        wait_report = await self._wait_until_ready(wait_time, readiness, wait_selector, page=page)
+        return wait_report, blocker.report()
+
+    async def _browse_page(self, page, url: str, wait_time: float, readiness: Optional[str] = None,
+                           wait_selector: Optional[str] = None) -> Dict[str, Any]:
+        """browse_url on a given page; raises on failure."""
+        wait_report, network_report = await self._navigate(url, wait_time, readiness, wait_selector, page=page)
+        with self.instrumentation.span("extract", operation="browse_url"):
+            page_text = await self._evaluate(page, PAGE_TEXT_SCRIPT, [MAX_PAGE_CHARS, TRUNCATION_MARKER])
+
+        return {
+            "success": True,
+            "title": page_text["title"],
+            "url": page.url,
+            "content": page_text["text"],
+            "readiness": wait_report,
+            "network": network_report,
+            "status": "Page loaded successfully"
+        }
+
+    async def _extract_page(self, page, url: Optional[str], wait_time: float, readiness: Optional[str] = None,
+                            wait_selector: Optional[str] = None) -> Dict[str, Any]:
+        """extract_content on a given page; raises on failure."""
+        wait_report = network_report = None
+        if url:
+            wait_report, network_report = await self._navigate(url, wait_time, readiness, wait_selector, page=page)
+
+        with self.instrumentation.span("extract", operation="extract_content"):
+            extracted = await self._evaluate(
+                page, EXTRACT_CONTENT_SCRIPT, [MAX_LINKS, MAX_IMAGES, MAX_TEXT_CHARS, TRUNCATION_MARKER]
+            )
+        content = {"title": extracted.pop("title"), "url": page.url, **extracted}
+
+        return {
+            "success": True,
+            "content": content,
+            "readiness": wait_report,
+            "network": network_report,
+            "status": "Content extracted successfully"
+        }
+
+    async def _main_content_page(self, page, url: Optional[str], wait_time: float, readiness: Optional[str],
+                                 wait_selector: Optional[str], output_format: str,
+                                 budget_bytes: int) -> Dict[str, Any]:
+        """extract_main_content on a given page; raises on failure."""
+        wait_report = network_report = None
+        if url:
+            wait_report, network_report = await self._navigate(url, wait_time, readiness, wait_selector, page=page)
+
+        with self.instrumentation.span("extract", operation="extract_main_content"):
+            extracted = await self._evaluate(page, MAIN_CONTENT_SCRIPT, [output_format, budget_bytes])
+
+        content_bytes = extracted["contentBytes"]
+        source_bytes = extracted["sourceBytes"]
+        ratio = round(source_bytes / content_bytes, 2) if content_bytes else None
+        return {
+            "success": True,
+            "title": extracted["title"],
+            "url": page.url,
+            "content": extracted["content"],
+            "format": output_format,
+            "main_element": extracted["mainElement"],
+            "budget_bytes": budget_bytes,
+            "content_bytes": content_bytes,
+            "source_bytes": source_bytes,
+            "compression_ratio": ratio,
+            "estimated_tokens": -(-content_bytes // BYTES_PER_TOKEN),
+            "truncated": extracted["truncated"],
+            "omitted_sections": extracted["omittedSections"],
+            "readiness": wait_report,
+            "network": network_report,
+            "status": f"Extracted {content_bytes} of {source_bytes} bytes of page text"
+                      + (f" ({ratio}x smaller)" if ratio else "")
+        }
+
+    def _fetch_settings(self, readiness: Optional[str], wait_selector: Optional[str]) -> Dict[str, Any]:
+        """Settings that change what a navigation returns, for cache keys."""
+        profile = self.network_profile
+        return {
+            "network_profile": [profile.name, sorted(profile.block_resource_types), list(profile.block_url_patterns)],
+            "readiness": readiness or ("selector" if wait_selector else self.readiness),
+            "wait_selector": wait_selector,
+        }
+
+    async def _cached(self, operation: str, url: Optional[str], fetch: Callable[[], Awaitable[Dict[str, Any]]],
+                      use_cache: bool = True, refresh_cache: bool = False,
+                      limits: Optional[Dict[str, Any]] = None, readiness: Optional[str] = None,
+                      wait_selector: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Serve operation on url from the cache, or run fetch() and store a successful result.
+
+        Results for the current page (no url) are never cached. A hit does not
+        touch the browser, so the tool's page is not navigated. limits defaults
+        to the operation's entry in _CACHE_LIMITS; the network profile and the
+        readiness settings are part of the key as well.
+        """
+        if self.cache is None or not url or not use_cache:
+            return await fetch()
+
+        key = cache_key(operation, url, limits if limits is not None else _CACHE_LIMITS[operation],
+                        self._fetch_settings(readiness, wait_selector))
+        if not refresh_cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return {**cached, "readiness": None, "network": None, "cached": True}
+
+        result = await fetch()
+        if result.get("success"):
+            self.cache.set(key, result)
+        return {**result, "cached": False}
+
+    @_traced("browse_url")
+    async def browse_url(self, url: str, wait_time: int = 3, readiness: Optional[str] = None,
+                         wait_selector: Optional[str] = None, use_cache: bool = True,
+                         refresh_cache: bool = False) -> Dict[str, Any]:
+        """Navigate to URL and extract basic content."""
+        async def fetch():
+            await self._ensure_connected()
+            return await self._browse_page(self._page, url, wait_time, readiness, wait_selector)
+
+        try:
+            return await self._cached("browse_url", url, fetch, use_cache, refresh_cache,
+                                      readiness=readiness, wait_selector=wait_selector)
         except Exception as e:
             logger.error(f"Error browsing URL {url}: {e}")
             return {"success": False, "error": str(e), "status": "Error occurred while browsing"}
 
-    async def search_web(self, query: str, wait_time: int = 3) -> Dict[str, Any]:
+    @_traced("search_web")
+    async def search_web(self, query: str, wait_time: int = 3, readiness: Optional[str] = None,
+                         wait_selector: Optional[str] = None) -> Dict[str, Any]:
         """Perform Google search and extract results."""
         try:
             await self._ensure_connected()
-            await self._page.goto("https://www.google.com", wait_until="domcontentloaded", timeout=60000)
-            await asyncio.sleep(2)
+            blocker = await self._blocker_for(self._page)
+            blocker.reset()
+            with self.instrumentation.span("navigate", url=self.search_url):
+                await self._round_trip(self._page.goto(self.search_url, wait_until="domcontentloaded", timeout=60000))
 
             search_box = self._page.locator('input[name="q"]')
-            await search_box.wait_for(state="visible", timeout=60000)
-            await search_box.fill(query, timeout=10000)
-            await search_box.press("Enter")
-            await self._page.wait_for_selector('div.g', timeout=10000)
-            await asyncio.sleep(wait_time)
+            await self._round_trip(search_box.wait_for(state="visible", timeout=60000))
+            await self._round_trip(search_box.fill(query, timeout=10000))
+            await self._round_trip(search_box.press("Enter"))
+            await self._round_trip(self._page.wait_for_selector('div.g', timeout=10000))
+            wait_report = await self._wait_until_ready(wait_time, readiness, wait_selector)
 
-            results = []
-            search_results = await self._page.locator('div.g').all()
-
-            for result in search_results[:10]:
-                try:
-                    title_element = result.locator('h3').first
-                    link_element = result.locator('a').first
-                    snippet_element = result.locator('span').first
-
-                    if await title_element.count() > 0 and await link_element.count() > 0:
-                        title = await title_element.inner_text()
-                        url = await link_element.get_attribute('href')
-                        snippet = await snippet_element.inner_text() if await snippet_element.count() > 0 else ''
-                        results.append({"title": title, "url": url, "snippet": snippet})
-                except:
-                    continue
+            with self.instrumentation.span("extract", operation="search_web"):
+                results = await self._evaluate(self._page, SEARCH_RESULTS_SCRIPT, [MAX_SEARCH_RESULTS])
 
             return {
                 "success": True,
                 "query": query,
                 "results": results,
+                "readiness": wait_report,
+                "network": blocker.report(),
                 "status": f"Found {len(results)} search results"
             }
         except Exception as e:
             logger.error(f"Error searching web: {e}")
             return {"success": False, "error": str(e), "status": "Error occurred during search"}
 
-    async def extract_content(self, url: Optional[str] = None, wait_time: int = 3) -> Dict[str, Any]:
+    @_traced("extract_content")
+    async def extract_content(self, url: Optional[str] = None, wait_time: int = 3, readiness: Optional[str] = None,
+                              wait_selector: Optional[str] = None, use_cache: bool = True,
+                              refresh_cache: bool = False) -> Dict[str, Any]:
         """Extract structured content from current page or navigate to URL first."""
-        try:
+        async def fetch():
             await self._ensure_connected()
+            return await self._extract_page(self._page, url, wait_time, readiness, wait_selector)
 
-            if url:
-                await self._page.goto(url, wait_until="domcontentloaded")
-                await asyncio.sleep(wait_time)
+        try:
+            return await self._cached("extract_content", url, fetch, use_cache, refresh_cache,
+                                      readiness=readiness, wait_selector=wait_selector)
+        except Exception as e:
+            logger.error(f"Error extracting content: {e}")
+            return {"success": False, "error": str(e), "status": "Error occurred while extracting content"}
 
-            content = {
-                "title": await self._page.title(),
-                "url": self._page.url,
-                "headings": [],
-                "links": [],
-                "images": [],
-                "text_content": ""
-            }
+    @_traced("extract_main_content")
+    async def extract_main_content(self, url: Optional[str] = None, wait_time: int = 3,
+                                   output_format: str = "markdown", max_tokens: Optional[int] = None,
+                                   max_bytes: Optional[int] = None, readiness: Optional[str] = None,
+                                   wait_selector: Optional[str] = None, use_cache: bool = True,
+                                   refresh_cache: bool = False) -> Dict[str, Any]:
+        """
+        Extract only the page's main content (no navigation, footers or banners)
+        from the current page or navigate to URL first.
 
-            for i in range(1, 7):
-                headings = await self._page.locator(f'h{i}').all()
-                for heading in headings:
-                    try:
-                        text = (await heading.inner_text()).strip()
-                        if text:
-                            content["headings"].append({"level": i, "text": text})
-                    except:
-                        continue
-
-            links = (await self._page.locator('a[href]').all())[:20]
-            for link in links:
-                try:
-                    text = (await link.inner_text()).strip()
-                    href = await link.get_attribute('href')
-                    if text and href:
-                        content["links"].append({"text": text, "url": href})
-                except:
-                    continue
+        The content is trimmed to the budget by dropping whole trailing blocks,
+        then list items or table rows, then sentences; headings of sections
+        that did not fit are listed in omitted_sections.
 
-            images = (await self._page.locator('img[src]').all())[:10]
-            for img in images:
-                try:
-                    src = await img.get_attribute('src')
-                    alt = await img.get_attribute('alt') or ''
-                    if src:
-                        content["images"].append({"src": src, "alt": alt})
-                except:
-                    continue
+        Args:
+            url: Optional URL to navigate to first
+            wait_time: Readiness upper bound in seconds
+            output_format: "markdown" or "text"
+            max_tokens: Budget in estimated tokens (default MAIN_CONTENT_TOKENS)
+            max_bytes: Budget in UTF-8 bytes; overrides max_tokens
 
-            text_content = await self._page.inner_text('body')
-            if len(text_content) > 3000:
-                text_content = text_content[:3000] + '... [Content truncated]'
-            content["text_content"] = text_content
+        Returns:
+            Dictionary with success, title, url, content, format, main_element,
+            budget_bytes, content_bytes, source_bytes (full page text),
+            compression_ratio, estimated_tokens, truncated, omitted_sections,
+            readiness, network and status
+        """
+        if output_format not in MAIN_CONTENT_FORMATS:
+            return {
+                "success": False,
+                "error": f"Unknown format '{output_format}', expected one of: {', '.join(MAIN_CONTENT_FORMATS)}",
+                "status": "Invalid format"
+            }
+        budget_bytes = _main_content_budget(max_tokens, max_bytes)
+
+        async def fetch():
+            await self._ensure_connected()
+            return await self._main_content_page(
+                self._page, url, wait_time, readiness, wait_selector, output_format, budget_bytes
+            )
 
-            return {"success": True, "content": content, "status": "Content extracted successfully"}
+        try:
+            return await self._cached(
+                "extract_main_content", url, fetch, use_cache, refresh_cache,
+                limits={"format": output_format, "budget_bytes": budget_bytes},
+                readiness=readiness, wait_selector=wait_selector
+            )
         except Exception as e:
-            logger.error(f"Error extracting content: {e}")
-            return {"success": False, "error": str(e), "status": "Error occurred while extracting content"}
+            logger.error(f"Error extracting main content: {e}")
+            return {"success": False, "error": str(e), "status": "Error occurred while extracting main content"}
 
-    async def fill_form(self, url: Optional[str] = None, form_data: str = "{}", wait_time: int = 3) -> Dict[str, Any]:
+    @_traced("fill_form")
+    async def fill_form(self, url: Optional[str] = None, form_data: str = "{}", wait_time: int = 3,
+                        readiness: Optional[str] = None, wait_selector: Optional[str] = None) -> Dict[str, Any]:
         """Fill form fields on current page or navigate to URL first."""
         try:
             await self._ensure_connected()
@@ -211,78 +622,492 @@ class BrowserTool:
             except json.JSONDecodeError as e:
                 return {"success": False, "error": f"Invalid JSON format: {str(e)}", "status": "JSON parsing error"}
 
+            wait_report = network_report = None
             if url:
-                await self._page.goto(url, wait_until="domcontentloaded")
-                await asyncio.sleep(wait_time)
-
-            filled_fields = []
-            errors = []
+                wait_report, network_report = await self._navigate(url, wait_time, readiness, wait_selector)
 
-            for field_name, field_value in form_fields.items():
-                try:
-                    selectors = [
-                        f"input[name='{field_name}']", f"input[id='{field_name}']",
-                        f"textarea[name='{field_name}']", f"textarea[id='{field_name}']",
-                        f"select[name='{field_name}']", f"select[id='{field_name}']"
-                    ]
-
-                    field_found = False
-                    for selector in selectors:
-                        try:
-                            element = self._page.locator(selector)
-                            if await element.count() > 0:
-                                await element.fill(str(field_value))
-                                filled_fields.append(field_name)
-                                field_found = True
-                                break
-                        except:
-                            continue
-
-                    if not field_found:
-                        errors.append(f"Field '{field_name}' not found")
-                except Exception as e:
-                    errors.append(f"Error filling field '{field_name}': {str(e)}")
+            filled_fields, errors = await self._fill_fields(self._page, form_fields)
 
             return {
                 "success": len(filled_fields) > 0,
                 "filled_fields": filled_fields,
                 "errors": errors,
+                "readiness": wait_report,
+                "network": network_report,
                 "status": f"Filled {len(filled_fields)} fields, {len(errors)} errors"
             }
         except Exception as e:
             logger.error(f"Error filling form: {e}")
             return {"success": False, "error": str(e), "status": "Error occurred while filling form"}
 
-    async def execute_script(self, url: Optional[str] = None, script: str = "", wait_time: int = 3) -> Dict[str, Any]:
+    async def _fill_fields(self, page, form_fields: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+        """Fill fields by name or id in one in-page pass; returns the filled names and error messages."""
+        filled_fields = []
+        errors = []
+
+        # "text" keeps the str() conversion text inputs always used, "value"
+        # keeps JSON types for checkbox and multi-select semantics
+        fields = [
+            {"name": str(field_name), "value": field_value, "text": str(field_value)}
+            for field_name, field_value in form_fields.items()
+        ]
+        for result in await self._evaluate(page, FILL_FORM_SCRIPT, fields):
+            if result["filled"]:
+                filled_fields.append(result["name"])
+            elif not result["found"]:
+                errors.append(f"Field '{result['name']}' not found")
+            else:
+                errors.append(f"Error filling field '{result['name']}': {result['error']}")
+        return filled_fields, errors
+
+    @_traced("execute_script")
+    async def execute_script(self, url: Optional[str] = None, script: str = "", wait_time: int = 3,
+                             readiness: Optional[str] = None, wait_selector: Optional[str] = None) -> Dict[str, Any]:
         """Execute JavaScript code on current page or navigate to URL first."""
         try:
             await self._ensure_connected()
 
+            wait_report = network_report = None
             if url:
-                await self._page.goto(url, wait_until="domcontentloaded")
-                await asyncio.sleep(wait_time)
+                wait_report, network_report = await self._navigate(url, wait_time, readiness, wait_selector)
 
-            result = await self._page.evaluate(script)
-            return {"success": True, "result": result, "status": "Script executed successfully"}
+            result = await self._evaluate(self._page, script)
+            return {
+                "success": True,
+                "result": result,
+                "readiness": wait_report,
+                "network": network_report,
+                "status": "Script executed successfully"
+            }
         except Exception as e:
             logger.error(f"Error executing script: {e}")
             return {"success": False, "error": str(e), "status": "Error occurred while executing script"}
 
+    async def _action_goto(self, page, step: Dict[str, Any]) -> Dict[str, Any]:
+        wait_report, network_report = await self._navigate(
+            step["url"], step.get("wait_time", 3), step.get("readiness"), step.get("wait_selector"),
+            timeout=step.get("timeout", ACTION_TIMEOUT_MS), page=page
+        )
+        return {"url": page.url, "readiness": wait_report, "network": network_report}
+
+    async def _action_wait_for(self, page, step: Dict[str, Any]) -> Dict[str, Any]:
+        if "selector" in step:
+            state = step.get("state", "visible")
+            await self._round_trip(
+                page.wait_for_selector(step["selector"], state=state, timeout=step.get("timeout", ACTION_TIMEOUT_MS))
+            )
+            return {"selector": step["selector"], "state": state}
+        wait_report = await self._wait_until_ready(step.get("wait_time", 3), step.get("readiness"), page=page)
+        return {"readiness": wait_report}
+
+    async def _action_fill(self, page, step: Dict[str, Any]) -> Dict[str, Any]:
+        if "fields" in step:
+            filled_fields, errors = await self._fill_fields(page, step["fields"])
+            return {"success": not errors, "filled_fields": filled_fields, "errors": errors}
+        await self._round_trip(
+            page.fill(step["selector"], str(step["value"]), timeout=step.get("timeout", ACTION_TIMEOUT_MS))
+        )
+        return {"filled_fields": [step["selector"]], "errors": []}
+
+    async def _action_click(self, page, step: Dict[str, Any]) -> Dict[str, Any]:
+        await self._round_trip(page.click(step["selector"], timeout=step.get("timeout", ACTION_TIMEOUT_MS)))
+        result = {"selector": step["selector"]}
+        if step.get("readiness") or step.get("wait_selector"):
+            result["readiness"] = await self._wait_until_ready(
+                step.get("wait_time", 3), step.get("readiness"), step.get("wait_selector"), page=page
+            )
+        result["url"] = page.url
+        return result
+
+    async def _action_evaluate(self, page, step: Dict[str, Any]) -> Dict[str, Any]:
+        return {"result": await self._evaluate(page, step["script"], step.get("arg"))}
+
+    async def _action_extract(self, page, step: Dict[str, Any]) -> Dict[str, Any]:
+        mode = step.get("mode", "content")
+        if mode == "text":
+            with self.instrumentation.span("extract", operation="run_actions"):
+                page_text = await self._evaluate(
+                    page, PAGE_TEXT_SCRIPT, [step.get("max_chars", MAX_PAGE_CHARS), TRUNCATION_MARKER]
+                )
+            return {"title": page_text["title"], "url": page.url, "content": page_text["text"]}
+        if mode == "main":
+            output_format = step.get("format", "markdown")
+            if output_format not in MAIN_CONTENT_FORMATS:
+                return {"success": False, "error": f"Unknown format '{output_format}'"}
+            budget_bytes = _main_content_budget(step.get("max_tokens"), step.get("max_bytes"))
+            extracted = await self._main_content_page(page, None, 0, None, None, output_format, budget_bytes)
+            return {key: value for key, value in extracted.items()
+                    if key not in ("success", "readiness", "network", "status")}
+        if mode != "content":
+            return {"success": False, "error": f"Unknown extract mode '{mode}', expected 'content', 'text' or 'main'"}
+        extracted = await self._extract_page(page, None, 0)
+        return {"content": extracted["content"]}
+
+    @_traced("run_actions")
+    async def run_actions(self, actions: Union[str, List[Dict[str, Any]]],
+                          stop_on_error: bool = True) -> Dict[str, Any]:
+        """
+        Run a declarative list of steps back to back on the tool's page.
+
+        Steps are objects with an "action" key:
+        - goto: url, optional wait_time/readiness/wait_selector/timeout
+        - wait_for: selector (optional state, timeout), or a readiness strategy
+        - fill: fields ({name or id: value}) or selector + value
+        - click: selector, optional readiness/wait_selector to wait afterwards
+        - evaluate: script, optional arg
+        - extract: mode "content" (headings, links, images, text), "text" or
+          "main" (optional format, max_tokens, max_bytes)
+
+        The connection is checked once for the whole pipeline and nothing
+        waits unless a step asks for it.
+
+        Args:
+            actions: List of steps, or the same list as a JSON string
+            stop_on_error: Skip the remaining steps after the first failure
+
+        Returns:
+            Dictionary with success, steps (index, action, success, elapsed_ms
+            and the step's result or error), completed, skipped, elapsed_ms
+            and status
+        """
+        try:
+            if isinstance(actions, str):
+                try:
+                    actions = json.loads(actions)
+                except json.JSONDecodeError as e:
+                    return {"success": False, "error": f"Invalid JSON format: {str(e)}", "status": "JSON parsing error"}
+            error = _validate_actions(actions)
+            if error:
+                return {"success": False, "error": error, "status": "Invalid actions"}
+
+            await self._ensure_connected()
+            page = self._page
+            steps = []
+            start = time.perf_counter()
+            for index, step in enumerate(actions):
+                name = step["action"]
+                step_start = time.perf_counter()
+                with self.instrumentation.span("action", action=name, index=index) as span:
+                    try:
+                        result = await getattr(self, f"_action_{name}")(page, step)
+                        ok = result.pop("success", True)
+                    except Exception as e:
+                        logger.warning(f"Step {index} ({name}) failed: {e}")
+                        result, ok = {"error": str(e)}, False
+                    span.set(success=ok)
+                steps.append({
+                    "index": index,
+                    "action": name,
+                    "success": ok,
+                    "elapsed_ms": round((time.perf_counter() - step_start) * 1000, 1),
+                    **result
+                })
+                if not ok and stop_on_error:
+                    break
+
+            failed = sum(1 for step in steps if not step["success"])
+            skipped = len(actions) - len(steps)
+            return {
+                "success": failed == 0 and skipped == 0,
+                "steps": steps,
+                "completed": len(steps),
+                "skipped": skipped,
+                "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+                "status": f"Ran {len(steps)} of {len(actions)} steps, {failed} failed"
+            }
+        except Exception as e:
+            logger.error(f"Error running actions: {e}")
+            return {"success": False, "error": str(e), "status": "Error occurred while running actions"}
+
+    @_traced("open_text_cursor")
+    async def open_text_cursor(self, url: Optional[str] = None, wait_time: int = 3, readiness: Optional[str] = None,
+                               wait_selector: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Snapshot the full page text inside the page and return a cursor to read it in chunks.
+
+        The text stays in the page; nothing but its length is transferred until
+        read_text() is called. Offsets are JavaScript string offsets (UTF-16 code
+        units) and remain stable until the page navigates or the cursor is closed.
+        """
+        try:
+            await self._ensure_connected()
+
+            wait_report = network_report = None
+            if url:
+                wait_report, network_report = await self._navigate(url, wait_time, readiness, wait_selector)
+
+            cursor = uuid.uuid4().hex
+            snapshot = await self._evaluate(self._page, TEXT_CURSOR_OPEN_SCRIPT, [cursor])
+
+            return {
+                "success": True,
+                "cursor": cursor,
+                "title": snapshot["title"],
+                "url": self._page.url,
+                "total_length": snapshot["totalLength"],
+                "readiness": wait_report,
+                "network": network_report,
+                "status": "Text cursor opened"
+            }
+        except Exception as e:
+            logger.error(f"Error opening text cursor: {e}")
+            return {"success": False, "error": str(e), "status": "Error occurred while opening text cursor"}
+
+    @_traced("read_text")
+    async def read_text(self, cursor: str, offset: int = 0, size: int = TEXT_CHUNK_CHARS) -> Dict[str, Any]:
+        """
+        Read up to size characters of a text cursor starting at offset.
+
+        Returns:
+            Dictionary with text, offset, next_offset, total_length and done;
+            pass next_offset to the following call
+        """
+        try:
+            if offset < 0 or size < 1:
+                raise ValueError("offset must be >= 0 and size >= 1")
+            await self._ensure_connected()
+
+            chunk = await self._evaluate(self._page, TEXT_CURSOR_READ_SCRIPT, [cursor, offset, size])
+            if chunk is None:
+                return {
+                    "success": False,
+                    "error": f"Text cursor {cursor} not found (closed, or the page navigated away)",
+                    "status": "Text cursor expired"
+                }
+
+            return {
+                "success": True,
+                "cursor": cursor,
+                "offset": offset,
+                "next_offset": chunk["nextOffset"],
+                "total_length": chunk["totalLength"],
+                "text": chunk["text"],
+                "done": chunk["nextOffset"] >= chunk["totalLength"],
+                "status": "Text chunk read"
+            }
+        except Exception as e:
+            logger.error(f"Error reading text cursor: {e}")
+            return {"success": False, "error": str(e), "status": "Error occurred while reading text"}
+
+    async def close_text_cursor(self, cursor: str) -> Dict[str, Any]:
+        """Release a text cursor's snapshot in the page."""
+        try:
+            if self._initialized and self._page:
+                await self._evaluate(self._page, TEXT_CURSOR_CLOSE_SCRIPT, [cursor])
+            return {"success": True, "cursor": cursor, "status": "Text cursor closed"}
+        except Exception as e:
+            logger.warning(f"Error closing text cursor: {e}")
+            return {"success": False, "error": str(e), "status": "Error occurred while closing text cursor"}
+
+    async def stream_text(self, url: Optional[str] = None, chunk_size: int = TEXT_CHUNK_CHARS, start: int = 0,
+                          wait_time: int = 3, readiness: Optional[str] = None,
+                          wait_selector: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield the page text in chunks of chunk_size, pulled from the page on demand.
+
+        The first item is the open_text_cursor result; the following items are
+        read_text results. Iteration stops after the last chunk or the first
+        failure, and the cursor is released when the generator finishes.
+        """
+        opened = await self.open_text_cursor(url, wait_time, readiness, wait_selector)
+        yield opened
+        if not opened["success"]:
+            return
+
+        cursor = opened["cursor"]
+        offset = start
+        try:
+            while True:
+                chunk = await self.read_text(cursor, offset, chunk_size)
+                yield chunk
+                if not chunk["success"] or chunk["done"]:
+                    return
+                offset = chunk["next_offset"]
+        finally:
+            await self.close_text_cursor(cursor)
+
+    async def _crawl(self, name: str, urls: List[str], operation: Callable[[Any, str], Awaitable[Dict[str, Any]]],
+                     concurrency: int, timeout: float) -> AsyncIterator[Dict[str, Any]]:
+        """Run operation(page, url) over urls on a bounded pool of tabs, yielding results as they finish."""
+        await self._ensure_connected()
+        context = self._page.context
+
+        work: asyncio.Queue = asyncio.Queue()
+        for index, url in enumerate(urls):
+            work.put_nowait((index, url))
+        finished: asyncio.Queue = asyncio.Queue()
+        worker_done = object()
+
+        async def run_one(page, index: int, url: str) -> Dict[str, Any]:
+            with self.instrumentation.span(name, session_id=self.session_id, url=url) as span:
+                try:
+                    result = await asyncio.wait_for(operation(page, url), timeout)
+                except asyncio.TimeoutError:
+                    result = {"success": False, "error": f"Timed out after {timeout}s", "status": "URL timed out"}
+                except Exception as e:
+                    logger.error(f"Error processing {url}: {e}")
+                    result = {"success": False, "error": str(e), "status": "Error occurred while processing URL"}
+                span.set(success=result["success"], cached=result.get("cached"))
+            return {"index": index, "requested_url": url, **result}
+
+        async def worker():
+            page = None
+            try:
+                page = await self._round_trip(context.new_page())
+                while not work.empty():
+                    index, url = work.get_nowait()
+                    result = await run_one(page, index, url)
+                    await finished.put(result)
+                    if not result["success"]:
+                        # A timed out or crashed tab may be stuck; continue on a fresh one
+                        await self._round_trip(page.close())
+                        page = await self._round_trip(context.new_page())
+            except Exception as e:
+                logger.error(f"Crawl worker stopped: {e}")
+            finally:
+                if page is not None:
+                    try:
+                        await self._round_trip(page.close())
+                    except Exception:
+                        pass
+                await finished.put(worker_done)
+
+        workers = [asyncio.create_task(worker()) for _ in range(max(1, min(concurrency, len(urls))))]
+        try:
+            running = len(workers)
+            while running:
+                item = await finished.get()
+                if item is worker_done:
+                    running -= 1
+                    continue
+                yield item
+
+            # URLs left behind if every worker lost its tab
+            while not work.empty():
+                index, url = work.get_nowait()
+                yield {
+                    "index": index,
+                    "requested_url": url,
+                    "success": False,
+                    "error": "No browser tab available",
+                    "status": "URL not processed"
+                }
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    def browse_many(self, urls: List[str], concurrency: int = 4, wait_time: int = 3, timeout: float = 60,
+                    readiness: Optional[str] = None, wait_selector: Optional[str] = None,
+                    use_cache: bool = True, refresh_cache: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Browse several URLs concurrently on a bounded pool of tabs in this session.
+
+        Yields browse_url results as they finish, each with the input "index" and
+        "requested_url". Failures and per-URL timeouts only affect their own URL.
+        """
+        async def operation(page, url):
+            async def fetch():
+                return await self._browse_page(page, url, wait_time, readiness, wait_selector)
+            return await self._cached("browse_url", url, fetch, use_cache, refresh_cache,
+                                      readiness=readiness, wait_selector=wait_selector)
+
+        return self._crawl("browse_many", urls, operation, concurrency, timeout)
+
+    def extract_many(self, urls: List[str], concurrency: int = 4, wait_time: int = 3, timeout: float = 60,
+                     readiness: Optional[str] = None, wait_selector: Optional[str] = None,
+                     use_cache: bool = True, refresh_cache: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Extract structured content from several URLs concurrently.
+
+        Yields extract_content results as they finish, each with the input
+        "index" and "requested_url".
+        """
+        async def operation(page, url):
+            async def fetch():
+                return await self._extract_page(page, url, wait_time, readiness, wait_selector)
+            return await self._cached("extract_content", url, fetch, use_cache, refresh_cache,
+                                      readiness=readiness, wait_selector=wait_selector)
+
+        return self._crawl("extract_many", urls, operation, concurrency, timeout)
+
     # Synchronous wrappers
-    def browse_url_sync(self, url: str, wait_time: int = 3) -> Dict[str, Any]:
-        return asyncio.run(self.browse_url(url, wait_time))
+    def _run_sync(self, coro):
+        """Run coro on the registry's background loop, one sync call per tool at a time."""
+        with self._sync_lock:
+            return self.registry.loop_thread.run(coro)
+
+    def _iterate_sync(self, agen: AsyncIterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Stream an async generator running on the background loop as a sync iterator."""
+        try:
+            while True:
+                try:
+                    yield self._run_sync(agen.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            self._run_sync(agen.aclose())
+
+    def browse_url_sync(self, url: str, wait_time: int = 3, **kwargs) -> Dict[str, Any]:
+        return self._run_sync(self.browse_url(url, wait_time, **kwargs))
+
+    def search_web_sync(self, query: str, wait_time: int = 3, **kwargs) -> Dict[str, Any]:
+        return self._run_sync(self.search_web(query, wait_time, **kwargs))
+
+    def extract_content_sync(self, url: Optional[str] = None, wait_time: int = 3, **kwargs) -> Dict[str, Any]:
+        return self._run_sync(self.extract_content(url, wait_time, **kwargs))
+
+    def extract_main_content_sync(self, url: Optional[str] = None, wait_time: int = 3, **kwargs) -> Dict[str, Any]:
+        return self._run_sync(self.extract_main_content(url, wait_time, **kwargs))
+
+    def fill_form_sync(self, url: Optional[str] = None, form_data: str = "{}", wait_time: int = 3,
+                       **kwargs) -> Dict[str, Any]:
+        return self._run_sync(self.fill_form(url, form_data, wait_time, **kwargs))
+
+    def execute_script_sync(self, url: Optional[str] = None, script: str = "", wait_time: int = 3,
+                            **kwargs) -> Dict[str, Any]:
+        return self._run_sync(self.execute_script(url, script, wait_time, **kwargs))
+
+    def browse_many_sync(self, urls: List[str], concurrency: int = 4, **kwargs) -> Iterator[Dict[str, Any]]:
+        return self._iterate_sync(self.browse_many(urls, concurrency, **kwargs))
+
+    def extract_many_sync(self, urls: List[str], concurrency: int = 4, **kwargs) -> Iterator[Dict[str, Any]]:
+        return self._iterate_sync(self.extract_many(urls, concurrency, **kwargs))
+
+    def open_text_cursor_sync(self, url: Optional[str] = None, wait_time: int = 3, **kwargs) -> Dict[str, Any]:
+        return self._run_sync(self.open_text_cursor(url, wait_time, **kwargs))
+
+    def read_text_sync(self, cursor: str, offset: int = 0, size: int = TEXT_CHUNK_CHARS) -> Dict[str, Any]:
+        return self._run_sync(self.read_text(cursor, offset, size))
+
+    def run_actions_sync(self, actions: Union[str, List[Dict[str, Any]]],
+                         stop_on_error: bool = True) -> Dict[str, Any]:
+        return self._run_sync(self.run_actions(actions, stop_on_error))
+
+    def check_connection_sync(self, reconnect: bool = True,
+                              probe_timeout: float = PROBE_TIMEOUT_SECONDS) -> Dict[str, Any]:
+        return self._run_sync(self.check_connection(reconnect, probe_timeout))
+
+    def close_text_cursor_sync(self, cursor: str) -> Dict[str, Any]:
+        return self._run_sync(self.close_text_cursor(cursor))
+
+    def stream_text_sync(self, url: Optional[str] = None, chunk_size: int = TEXT_CHUNK_CHARS,
+                         **kwargs) -> Iterator[Dict[str, Any]]:
+        return self._iterate_sync(self.stream_text(url, chunk_size, **kwargs))
 
-    def search_web_sync(self, query: str, wait_time: int = 3) -> Dict[str, Any]:
-        return asyncio.run(self.search_web(query, wait_time))
+    def cleanup_sync(self, disconnect: bool = False):
+        """Release the browser connection borrowed by sync calls."""
+        if self._browser is not None and self.registry.loop_thread.running:
+            self._run_sync(self.cleanup(disconnect))
 
-    def extract_content_sync(self, url: Optional[str] = None, wait_time: int = 3) -> Dict[str, Any]:
-        return asyncio.run(self.extract_content(url, wait_time))
+    def __enter__(self) -> "BrowserTool":
+        return self
 
-    def fill_form_sync(self, url: Optional[str] = None, form_data: str = "{}", wait_time: int = 3) -> Dict[str, Any]:
-        return asyncio.run(self.fill_form(url, form_data, wait_time))
+    def __exit__(self, exc_type, exc, tb):
+        self.cleanup_sync()
 
-    def execute_script_sync(self, url: Optional[str] = None, script: str = "", wait_time: int = 3) -> Dict[str, Any]:
-        return asyncio.run(self.execute_script(url, script, wait_time))
+    async def __aenter__(self) -> "BrowserTool":
+        return self
 
-    def cleanup_sync(self):
-        asyncio.run(self._cleanup())
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.cleanup()
@@ -0,0 +1,286 @@
+"""
+Connection Registry
+
+Process-wide sharing of the Playwright driver and CDP connections. Playwright
+objects are bound to the event loop that created them, so the registry keeps
+one driver per event loop and one connect_over_cdp connection per
+(loop, session_id). BrowserTool instances borrow a connection and release it
+when they are done; a connection nobody borrows is closed after an idle
+timeout, and the driver stops once its loop has no connections left. When a
+loop shuts down (asyncio.run() returning), its connections and driver are
+closed before the loop is, so idle timers never outlive it.
+
+Synchronous BrowserTool calls all run on the registry's loop thread, so every
+sync tool in the process shares one driver.
+"""
+
+import asyncio
+import logging
+import threading
+import weakref
+from typing import Any, Dict, Optional, Set
+
+from playwright.async_api import async_playwright
+
+from .event_loop_thread import EventLoopThread
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IDLE_TIMEOUT_SECONDS = 60
+
+# Upper bound on closing connections while a loop shuts down; Playwright's own
+# tasks are being cancelled at the same time, so a close may never finish
+SHUTDOWN_CLOSE_TIMEOUT_SECONDS = 5
+
+
+class _Connection:
+    """A CDP connection to one session and the number of tools borrowing it."""
+
+    def __init__(self, session_id: str, browser: Any):
+        self.session_id = session_id
+        self.browser = browser
+        self.refs = 1
+        self.idle_handle: Optional[asyncio.TimerHandle] = None
+
+
+class _LoopState:
+    """Driver and connections owned by one event loop; only used from that loop."""
+
+    def __init__(self):
+        self.playwright = None
+        self.connections: Dict[str, _Connection] = {}
+        self.lock = asyncio.Lock()
+        # Timer-started tasks, referenced until done so they are not garbage collected
+        self.tasks: Set[asyncio.Task] = set()
+        self.timers: Set[asyncio.TimerHandle] = set()
+        self.watcher: Optional[asyncio.Task] = None
+
+
+class ConnectionRegistry:
+    """Shares Playwright drivers and per-session CDP connections between BrowserTool instances."""
+
+    def __init__(self, idle_timeout_seconds: float = DEFAULT_IDLE_TIMEOUT_SECONDS):
+        """
+        Args:
+            idle_timeout_seconds: How long a connection with no borrowers stays
+                open for the next tool (0 disconnects on the last release)
+        """
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.loop_thread = EventLoopThread(name="agentcore-browser-loop")
+        self._states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]" = \
+            weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._counters = {"driver_starts": 0, "connects": 0, "reuses": 0, "idle_disconnects": 0}
+
+    def _state(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._states.get(loop)
+            if state is None:
+                state = self._states[loop] = _LoopState()
+                state.watcher = loop.create_task(self._close_on_loop_shutdown(state))
+            return state
+
+    async def _close_on_loop_shutdown(self, state: _LoopState):
+        """
+        Wait until the loop shuts down, then close its connections and driver.
+
+        asyncio.run() and EventLoopThread.stop() cancel every pending task
+        before closing the loop; this task catches that cancellation. Closing
+        is bounded and best effort, so it can neither hang nor fail shutdown.
+        """
+        try:
+            await asyncio.get_running_loop().create_future()
+        except asyncio.CancelledError:
+            try:
+                await asyncio.wait_for(self._close_state(state), SHUTDOWN_CLOSE_TIMEOUT_SECONDS)
+            except (Exception, asyncio.CancelledError) as e:
+                logger.warning(f"Error closing browser connections at loop shutdown: {e!r}")
+            raise
+
+    @staticmethod
+    def _cancel_idle(state: _LoopState, connection: _Connection):
+        if connection.idle_handle is not None:
+            connection.idle_handle.cancel()
+            state.timers.discard(connection.idle_handle)
+            connection.idle_handle = None
+
+    def _call_later(self, state: _LoopState, delay: float, coro_factory):
+        """Run coro_factory() as a task after delay, keeping the timer and the task referenced."""
+        loop = asyncio.get_running_loop()
+
+        def start():
+            state.timers.discard(handle)
+            task = loop.create_task(coro_factory())
+            state.tasks.add(task)
+            task.add_done_callback(state.tasks.discard)
+
+        handle = loop.call_later(delay, start)
+        state.timers.add(handle)
+        return handle
+
+    def _count(self, name: str):
+        with self._lock:
+            self._counters[name] += 1
+
+    async def borrow(self, session_id: str, ws_url: str, ws_headers: Dict[str, str],
+                     instrumentation: Optional[Any] = None) -> Any:
+        """
+        Return the Playwright Browser connected to session_id on the running loop,
+        connecting (and starting the driver) only if no live connection exists.
+
+        Every borrow must be paired with release(session_id, browser). A new
+        connection is counted as one cdp_round_trips on instrumentation.
+        """
+        state = self._state()
+        async with state.lock:
+            connection = state.connections.get(session_id)
+            if connection is not None:
+                self._cancel_idle(state, connection)
+                if connection.browser.is_connected():
+                    connection.refs += 1
+                    self._count("reuses")
+                    return connection.browser
+                del state.connections[session_id]
+
+            try:
+                if state.playwright is None:
+                    state.playwright = await async_playwright().start()
+                    self._count("driver_starts")
+                if instrumentation is not None:
+                    instrumentation.count("cdp_round_trips")
+                browser = await state.playwright.chromium.connect_over_cdp(
+                    endpoint_url=ws_url,
+                    headers=ws_headers
+                )
+            except Exception:
+                self._schedule_reap(state)
+                raise
+
+            connection = _Connection(session_id, browser)
+            state.connections[session_id] = connection
+            browser.on("disconnected", lambda _: self._forget(state, connection))
+            self._count("connects")
+            logger.info(f"Connected to browser session {session_id}")
+            return browser
+
+    async def release(self, session_id: str, browser: Any, disconnect: bool = False):
+        """
+        Give back a borrowed connection; the last release starts the idle timer,
+        or closes the connection right away if disconnect is set.
+        """
+        state = self._state()
+        async with state.lock:
+            connection = state.connections.get(session_id)
+            # The connection may already have dropped and been replaced
+            if connection is None or connection.browser is not browser:
+                return
+            connection.refs -= 1
+            if connection.refs > 0:
+                return
+            if disconnect or self.idle_timeout_seconds <= 0:
+                await self._disconnect(state, connection)
+                return
+            connection.idle_handle = self._call_later(
+                state, self.idle_timeout_seconds, lambda: self._disconnect_if_idle(state, connection)
+            )
+
+    async def discard(self, session_id: str, browser: Any):
+        """
+        Close a connection that looks open but is not responding, so every
+        borrower reconnects on its next call instead of reusing it.
+        """
+        state = self._state()
+        async with state.lock:
+            connection = state.connections.get(session_id)
+            if connection is not None and connection.browser is browser:
+                logger.warning(f"Discarding unresponsive connection to browser session {session_id}")
+                await self._disconnect(state, connection, stop_driver=False)
+                self._schedule_reap(state)
+
+    async def _disconnect_if_idle(self, state: _LoopState, connection: _Connection):
+        async with state.lock:
+            if state.connections.get(connection.session_id) is connection and connection.refs == 0:
+                self._count("idle_disconnects")
+                await self._disconnect(state, connection)
+
+    async def _disconnect(self, state: _LoopState, connection: _Connection, stop_driver: bool = True):
+        """Close one connection; the caller holds state.lock."""
+        self._cancel_idle(state, connection)
+        if state.connections.get(connection.session_id) is connection:
+            del state.connections[connection.session_id]
+        try:
+            await connection.browser.close()
+        except Exception as e:
+            logger.warning(f"Error disconnecting from session {connection.session_id}: {e}")
+        logger.info(f"Disconnected from browser session {connection.session_id}")
+        if stop_driver:
+            await self._stop_driver_if_unused(state)
+
+    async def _stop_driver_if_unused(self, state: _LoopState):
+        """Stop the loop's driver once no connections remain; the caller holds state.lock."""
+        if state.connections or state.playwright is None:
+            return
+        playwright, state.playwright = state.playwright, None
+        try:
+            await playwright.stop()
+        except Exception as e:
+            logger.warning(f"Error stopping Playwright driver: {e}")
+
+    def _forget(self, state: _LoopState, connection: _Connection):
+        """Drop a connection whose WebSocket closed; borrowers reconnect on their next borrow."""
+        if state.connections.get(connection.session_id) is not connection:
+            return
+        self._cancel_idle(state, connection)
+        del state.connections[connection.session_id]
+        logger.warning(f"Connection to browser session {connection.session_id} dropped")
+        self._schedule_reap(state)
+
+    def _schedule_reap(self, state: _LoopState):
+        """Stop the driver after the idle timeout if it is still unused by then."""
+        async def reap():
+            async with state.lock:
+                await self._stop_driver_if_unused(state)
+
+        # Keeping the driver that long lets borrowers reconnect without restarting it
+        self._call_later(state, max(self.idle_timeout_seconds, 0), reap)
+
+    async def _close_state(self, state: _LoopState):
+        for handle in list(state.timers):
+            handle.cancel()
+        state.timers.clear()
+        async with state.lock:
+            for connection in list(state.connections.values()):
+                await self._disconnect(state, connection)
+            await self._stop_driver_if_unused(state)
+
+    async def close_all(self):
+        """
+        Disconnect every connection on the running loop, borrowed or not, and
+        stop its driver. Async callers can await this before their loop ends;
+        otherwise it runs when the loop shuts down.
+        """
+        await self._close_state(self._state())
+
+    def shutdown(self):
+        """Close everything opened by synchronous tools and stop the loop thread."""
+        if self.loop_thread.running:
+            self.loop_thread.run(self.close_all())
+            self.loop_thread.stop()
+
+    def stats(self) -> Dict[str, Any]:
+        """Running drivers, open and borrowed connections, plus connect/reuse counters."""
+        with self._lock:
+            states = list(self._states.values())
+            counters = dict(self._counters)
+        connections = [c for state in states for c in list(state.connections.values())]
+        return {
+            "drivers": sum(1 for state in states if state.playwright is not None),
+            "connections": len(connections),
+            "borrowed": sum(1 for c in connections if c.refs > 0),
+            **counters,
+        }
+
+
+# Registry used by every BrowserTool that is not given its own
+SHARED_REGISTRY = ConnectionRegistry()
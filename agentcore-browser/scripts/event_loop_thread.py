@@ -0,0 +1,87 @@
+"""
+Event Loop Thread
+
+Runs an asyncio event loop on a dedicated daemon thread so synchronous code can
+drive async Playwright objects that must stay bound to a single, long-lived loop.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, Coroutine, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class EventLoopThread:
+    """A lazily started event loop running on its own thread."""
+
+    def __init__(self, name: str = "browser-tool-loop"):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is not None and self.running:
+                return self._loop
+
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def run():
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            self._thread = threading.Thread(target=run, name=self.name, daemon=True)
+            self._thread.start()
+            ready.wait()
+            self._loop = loop
+            return loop
+
+    def run(self, coro: Coroutine[Any, Any, Any], timeout: Optional[float] = None) -> Any:
+        """
+        Run coro on the loop thread and block until it finishes.
+
+        Safe to call from any thread except the loop thread itself.
+        """
+        loop = self._ensure_started()
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("EventLoopThread.run() called from its own loop thread would deadlock")
+        return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout)
+
+    def stop(self, timeout: float = 10.0):
+        """Cancel outstanding tasks, stop the loop and join the thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+
+        if loop is None or thread is None:
+            return
+
+        async def shutdown():
+            tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await loop.shutdown_asyncgens()
+
+        if thread is not threading.current_thread():
+            try:
+                asyncio.run_coroutine_threadsafe(shutdown(), loop).result(timeout)
+            except Exception as e:
+                logger.warning(f"Error shutting down event loop thread {self.name}: {e}")
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout)
+            if not thread.is_alive():
+                loop.close()
+        else:
+            loop.stop()
@@ -0,0 +1,230 @@
+"""
+Instrumentation
+
+Timing spans and counters for BrowserTool and BrowserSessionManager with
+pluggable exporters. The default NOOP instrumentation hands out a shared
+no-op span, so disabled instrumentation costs one attribute lookup per call.
+"""
+
+import json
+import math
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, IO, Iterable, List, Optional, Union
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("agentcore_browser_span", default=None)
+
+
+def payload_size(value: Any) -> int:
+    """Approximate size in bytes of a JSON-serializable value returned by the page."""
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    try:
+        return len(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"))
+    except (TypeError, ValueError):
+        return 0
+
+
+class Span:
+    """A timed operation; counters recorded while it is active are attached to it."""
+
+    __slots__ = ("name", "attributes", "counters", "parent", "error", "_instrumentation", "_start", "_wall", "_token")
+
+    def __init__(self, instrumentation: "Instrumentation", name: str, attributes: Dict[str, Any]):
+        self.name = name
+        self.attributes = attributes
+        self.counters: Dict[str, float] = {}
+        self.parent: Optional[Span] = None
+        self.error: Optional[str] = None
+        self._instrumentation = instrumentation
+
+    def set(self, **attributes):
+        """Add attributes to the span."""
+        self.attributes.update(attributes)
+
+    def __enter__(self) -> "Span":
+        self.parent = _current_span.get()
+        self._token = _current_span.set(self)
+        self._wall = time.time()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration_ms = (time.perf_counter() - self._start) * 1000
+        _current_span.reset(self._token)
+        if exc is not None:
+            self.error = f"{exc_type.__name__}: {exc}"
+        self._instrumentation._finish(self, duration_ms)
+        return False
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def set(self, **attributes):
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Instrumentation:
+    """Records spans and counters and hands finished spans to exporters."""
+
+    enabled = True
+
+    def __init__(self, exporters: Iterable[Any] = ()):
+        """
+        Args:
+            exporters: Objects with an export(record) method, e.g.
+                JsonLinesExporter or HistogramExporter
+        """
+        self.exporters = list(exporters)
+        self._lock = threading.Lock()
+        self._totals: Dict[str, float] = {}
+
+    def span(self, name: str, **attributes) -> Union[Span, _NoopSpan]:
+        """Context manager timing an operation."""
+        return Span(self, name, attributes)
+
+    def count(self, name: str, value: float = 1):
+        """Add value to a counter on every active span and to the process totals."""
+        span = _current_span.get()
+        while span is not None:
+            span.counters[name] = span.counters.get(name, 0) + value
+            span = span.parent
+        with self._lock:
+            self._totals[name] = self._totals.get(name, 0) + value
+
+    def totals(self) -> Dict[str, float]:
+        """Counter totals since creation."""
+        with self._lock:
+            return dict(self._totals)
+
+    def _finish(self, span: Span, duration_ms: float):
+        record = {
+            "name": span.name,
+            "start": span._wall,
+            "duration_ms": round(duration_ms, 3),
+            "parent": span.parent.name if span.parent else None,
+            "attributes": span.attributes,
+            "counters": span.counters,
+        }
+        if span.error:
+            record["error"] = span.error
+        for exporter in self.exporters:
+            exporter.export(record)
+
+
+class NoopInstrumentation(Instrumentation):
+    """Disabled instrumentation: spans and counters do nothing."""
+
+    enabled = False
+
+    def __init__(self):
+        super().__init__(())
+
+    def span(self, name: str, **attributes) -> _NoopSpan:
+        return _NOOP_SPAN
+
+    def count(self, name: str, value: float = 1):
+        pass
+
+
+NOOP = NoopInstrumentation()
+
+
+class JsonLinesExporter:
+    """Writes one JSON object per finished span to a file path or text stream."""
+
+    def __init__(self, target: Union[str, IO[str]]):
+        self._owns_stream = isinstance(target, str)
+        self._stream = open(target, "a", encoding="utf-8") if self._owns_stream else target
+        self._lock = threading.Lock()
+
+    def export(self, record: Dict[str, Any]):
+        line = json.dumps(record, default=str)
+        with self._lock:
+            self._stream.write(line + "\n")
+            self._stream.flush()
+
+    def close(self):
+        if self._owns_stream:
+            self._stream.close()
+
+
+class HistogramExporter:
+    """Keeps span durations and counters in memory and summarizes them with percentiles."""
+
+    def __init__(self, max_samples: int = 10000):
+        """
+        Args:
+            max_samples: Most recent durations kept per span name
+        """
+        self.max_samples = max_samples
+        self._durations: Dict[str, List[float]] = {}
+        self._counts: Dict[str, int] = {}
+        self._counters: Dict[str, Dict[str, float]] = {}
+        self._errors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def export(self, record: Dict[str, Any]):
+        name = record["name"]
+        with self._lock:
+            self._counts[name] = self._counts.get(name, 0) + 1
+            samples = self._durations.setdefault(name, [])
+            samples.append(record["duration_ms"])
+            if len(samples) > self.max_samples:
+                del samples[:len(samples) - self.max_samples]
+            counters = self._counters.setdefault(name, {})
+            for key, value in record["counters"].items():
+                counters[key] = counters.get(key, 0) + value
+            if "error" in record:
+                self._errors[name] = self._errors.get(name, 0) + 1
+
+    @staticmethod
+    def _percentile(ordered: List[float], pct: float) -> float:
+        rank = max(1, math.ceil(pct / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per span name: count, errors, mean/p50/p95/p99/max in ms (over the
+        retained samples) and mean counters per span.
+        """
+        with self._lock:
+            durations = {name: sorted(samples) for name, samples in self._durations.items()}
+            counts = dict(self._counts)
+            counters = {name: dict(values) for name, values in self._counters.items()}
+            errors = dict(self._errors)
+
+        summary = {}
+        for name, ordered in durations.items():
+            count = counts[name]
+            summary[name] = {
+                "count": count,
+                "errors": errors.get(name, 0),
+                "mean_ms": round(sum(ordered) / len(ordered), 3),
+                "p50_ms": self._percentile(ordered, 50),
+                "p95_ms": self._percentile(ordered, 95),
+                "p99_ms": self._percentile(ordered, 99),
+                "max_ms": ordered[-1],
+                "counters_per_span": {k: round(v / count, 2) for k, v in counters.get(name, {}).items()},
+            }
+        return summary
+
+    def reset(self):
+        with self._lock:
+            self._durations.clear()
+            self._counts.clear()
+            self._counters.clear()
+            self._errors.clear()
@@ -0,0 +1,188 @@
+"""
+Network Profiles
+
+Request-blocking profiles for BrowserTool navigation. A profile fails
+unneeded requests (images, fonts, media, trackers, ads) inside the browser and
+counts what it blocked per navigation.
+
+Blocking uses the Fetch domain of a CDP session on the page, with patterns for
+the blocked resource types and URLs only: allowed requests are never paused
+and Playwright routing (which disables the HTTP cache) stays off. Requests made
+inside out-of-process iframes are not seen by the page's session.
+"""
+
+import fnmatch
+import logging
+import re
+from typing import Any, Dict, Iterable, List, Union
+
+logger = logging.getLogger(__name__)
+
+# Common analytics, tag manager and ad hosts
+TRACKER_URL_PATTERNS = (
+    "*google-analytics.com/*",
+    "*googletagmanager.com/*",
+    "*googlesyndication.com/*",
+    "*googleadservices.com/*",
+    "*doubleclick.net/*",
+    "*adservice.google.*",
+    "*amazon-adsystem.com/*",
+    "*connect.facebook.net/*",
+    "*facebook.com/tr*",
+    "*hotjar.com/*",
+    "*segment.io/*",
+    "*cdn.segment.com/*",
+    "*scorecardresearch.com/*",
+    "*taboola.com/*",
+    "*outbrain.com/*",
+    "*criteo.com/*",
+    "*newrelic.com/*",
+    "*nr-data.net/*",
+)
+
+MEDIA_RESOURCE_TYPES = ("image", "media", "font")
+
+# Playwright resource type -> CDP Network.ResourceType
+CDP_RESOURCE_TYPES = {
+    name.lower(): name for name in (
+        "Document", "Stylesheet", "Image", "Media", "Font", "Script", "TextTrack", "XHR", "Fetch", "Prefetch",
+        "EventSource", "WebSocket", "Manifest", "SignedExchange", "Ping", "CSPViolationReport", "Preflight", "Other",
+    )
+}
+
+
+class NetworkProfile:
+    """A set of resource types and URL glob patterns to block."""
+
+    def __init__(self, name: str = "custom", block_resource_types: Iterable[str] = (),
+                 block_url_patterns: Iterable[str] = ()):
+        """
+        Args:
+            name: Profile name reported in navigation stats
+            block_resource_types: Playwright resource types to block
+                (image, media, font, stylesheet, script, xhr, fetch, ...)
+            block_url_patterns: Globs matched against the full URL; only the
+                * and ? wildcards are supported
+        """
+        unknown = set(block_resource_types) - set(CDP_RESOURCE_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown resource types: {', '.join(sorted(unknown))}")
+        self.name = name
+        self.block_resource_types = frozenset(block_resource_types)
+        self.block_url_patterns = tuple(block_url_patterns)
+        self._url_regex = (
+            re.compile("|".join(fnmatch.translate(p) for p in self.block_url_patterns), re.IGNORECASE)
+            if self.block_url_patterns else None
+        )
+
+    @property
+    def blocks_anything(self) -> bool:
+        return bool(self.block_resource_types or self._url_regex)
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        if resource_type in self.block_resource_types:
+            return True
+        return self._url_regex is not None and self._url_regex.match(url) is not None
+
+    def fetch_patterns(self) -> List[Dict[str, str]]:
+        """CDP Fetch.enable patterns pausing only the requests this profile blocks."""
+        patterns = [
+            {"resourceType": CDP_RESOURCE_TYPES[resource_type], "requestStage": "Request"}
+            for resource_type in sorted(self.block_resource_types)
+        ]
+        patterns += [{"urlPattern": pattern, "requestStage": "Request"} for pattern in self.block_url_patterns]
+        return patterns
+
+
+NETWORK_PROFILES: Dict[str, NetworkProfile] = {
+    "full": NetworkProfile("full"),
+    "no-media": NetworkProfile("no-media", MEDIA_RESOURCE_TYPES),
+    # Stylesheets stay: innerText depends on CSS visibility
+    "text-only": NetworkProfile(
+        "text-only", MEDIA_RESOURCE_TYPES + ("texttrack", "manifest"), TRACKER_URL_PATTERNS
+    ),
+}
+
+
+def get_profile(profile: Union[str, NetworkProfile, None]) -> NetworkProfile:
+    """Resolve a profile name (or pass through a NetworkProfile)."""
+    if profile is None:
+        return NETWORK_PROFILES["full"]
+    if isinstance(profile, NetworkProfile):
+        return profile
+    if profile not in NETWORK_PROFILES:
+        raise ValueError(
+            f"Unknown network profile '{profile}', expected one of: {', '.join(NETWORK_PROFILES)} "
+            "or a NetworkProfile instance"
+        )
+    return NETWORK_PROFILES[profile]
+
+
+class RequestBlocker:
+    """Applies a NetworkProfile to one page and counts blocked and allowed traffic."""
+
+    def __init__(self, profile: NetworkProfile):
+        self.profile = profile
+        self._session = None
+        self.reset()
+
+    def reset(self):
+        """Start counting for a new navigation."""
+        self.requests_total = 0
+        self.requests_blocked = 0
+        self.bytes_received = 0
+        self.blocked_by_type: Dict[str, int] = {}
+
+    async def install(self, page) -> int:
+        """
+        Open a CDP session on the page that counts its traffic and, unless the
+        profile blocks nothing, fails the profile's requests in the browser.
+
+        Returns:
+            The CDP round trips made (0 if already installed)
+        """
+        if self._session is not None:
+            return 0
+        self._session = await page.context.new_cdp_session(page)
+        self._session.on("Network.requestWillBeSent", self._on_request)
+        self._session.on("Network.loadingFinished", self._on_loading_finished)
+        await self._session.send("Network.enable")
+        if not self.profile.blocks_anything:
+            return 2
+        self._session.on("Fetch.requestPaused", self._on_request_paused)
+        await self._session.send("Fetch.enable", {"patterns": self.profile.fetch_patterns()})
+        return 3
+
+    async def _on_request_paused(self, event: Dict[str, Any]):
+        resource_type = event.get("resourceType", "Other").lower()
+        url = event["request"]["url"]
+        try:
+            if self.profile.should_block(resource_type, url):
+                self.requests_blocked += 1
+                self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + 1
+                await self._session.send(
+                    "Fetch.failRequest", {"requestId": event["requestId"], "errorReason": "BlockedByClient"}
+                )
+            else:
+                # Matched a CDP pattern but not the profile's case-insensitive check
+                await self._session.send("Fetch.continueRequest", {"requestId": event["requestId"]})
+        except Exception as e:
+            # The page or request may already be gone
+            logger.debug(f"Request interception failed for {url}: {e}")
+
+    def _on_request(self, event: Dict[str, Any]):
+        self.requests_total += 1
+
+    def _on_loading_finished(self, event: Dict[str, Any]):
+        # Bytes on the wire, headers included; set for chunked and compressed responses too
+        self.bytes_received += int(event.get("encodedDataLength", 0))
+
+    def report(self) -> Dict[str, Any]:
+        """Counters since the last reset()."""
+        return {
+            "profile": self.profile.name,
+            "requests_blocked": self.requests_blocked,
+            "blocked_by_type": dict(self.blocked_by_type),
+            "requests_allowed": self.requests_total - self.requests_blocked,
+            "bytes_received": self.bytes_received,
+        }
@@ -0,0 +1,131 @@
+"""
+Page Readiness
+
+Event-driven replacements for fixed sleeps after navigation. Each strategy
+returns as soon as the page is ready, with the caller's wait_time acting as an
+upper bound, and reports how long the wait actually took.
+"""
+
+import asyncio
+import time
+from typing import Dict, Any, Optional
+
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+READINESS_STRATEGIES = ("dom-quiescence", "network-idle", "selector", "load", "fixed", "none")
+DEFAULT_READINESS = "dom-quiescence"
+
+# How long the DOM must stay unchanged before it is considered settled
+DEFAULT_QUIET_PERIOD_MS = 300
+
+DOM_QUIESCENCE_SCRIPT = """
+([quietMs, maxMs]) => new Promise((resolve) => {
+    let mutations = 0;
+    let quietTimer = null;
+    let capTimer = null;
+    let observer = null;
+    const finish = (timedOut) => {
+        if (observer) observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(capTimer);
+        resolve({ mutations, timedOut });
+    };
+    observer = new MutationObserver((records) => {
+        mutations += records.length;
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(() => finish(false), quietMs);
+    });
+    observer.observe(document.documentElement || document, {
+        childList: true, subtree: true, attributes: true, characterData: true
+    });
+    quietTimer = setTimeout(() => finish(false), quietMs);
+    capTimer = setTimeout(() => finish(true), maxMs);
+})
+"""
+
+
+def validate_strategy(strategy: str) -> str:
+    """Return strategy if it is known, otherwise raise ValueError."""
+    if strategy not in READINESS_STRATEGIES:
+        raise ValueError(
+            f"Unknown readiness strategy '{strategy}', expected one of: {', '.join(READINESS_STRATEGIES)}"
+        )
+    return strategy
+
+
+async def _wait_for_dom_quiescence(page, quiet_ms: int, deadline: float, report: Dict[str, Any]):
+    # Navigations can replace the execution context mid-wait; retry on the new
+    # document until the budget runs out
+    while True:
+        remaining_ms = int((deadline - time.perf_counter()) * 1000)
+        if remaining_ms <= 0:
+            report["timed_out"] = True
+            return
+        try:
+            report["round_trips"] += 1
+            result = await page.evaluate(DOM_QUIESCENCE_SCRIPT, [quiet_ms, remaining_ms])
+            report.update(timed_out=result["timedOut"], mutations=result["mutations"])
+            return
+        except PlaywrightError as e:
+            if "context was destroyed" not in str(e) and "navigation" not in str(e):
+                raise
+            report["round_trips"] += 1
+            await page.wait_for_load_state("domcontentloaded", timeout=max(remaining_ms, 1))
+
+
+async def wait_until_ready(
+    page,
+    strategy: str = DEFAULT_READINESS,
+    max_wait: float = 3,
+    selector: Optional[str] = None,
+    quiet_period_ms: int = DEFAULT_QUIET_PERIOD_MS,
+) -> Dict[str, Any]:
+    """
+    Wait until the page is ready according to strategy, capped at max_wait.
+
+    Hitting the cap is not an error: the page is used as-is, matching the old
+    fixed-sleep behaviour, and the report records timed_out=True.
+
+    Args:
+        page: Playwright page
+        strategy: One of READINESS_STRATEGIES
+        max_wait: Upper bound in seconds
+        selector: CSS selector to wait for (required for the "selector" strategy)
+        quiet_period_ms: DOM silence required by "dom-quiescence"
+
+    Returns:
+        Report with strategy, elapsed_ms, max_wait_ms, timed_out and
+        round_trips (Playwright calls made while waiting)
+    """
+    validate_strategy(strategy)
+    if strategy == "selector" and not selector:
+        raise ValueError("The 'selector' readiness strategy requires wait_selector")
+
+    max_wait_ms = int(max_wait * 1000)
+    start = time.perf_counter()
+    deadline = start + max_wait
+    report: Dict[str, Any] = {"strategy": strategy, "max_wait_ms": max_wait_ms, "timed_out": False, "round_trips": 0}
+
+    try:
+        if strategy == "none" or max_wait_ms <= 0:
+            pass
+        elif strategy == "fixed":
+            await asyncio.sleep(max_wait)
+        elif strategy == "load":
+            report["round_trips"] = 1
+            await page.wait_for_load_state("load", timeout=max_wait_ms)
+        elif strategy == "network-idle":
+            report["round_trips"] = 1
+            await page.wait_for_load_state("networkidle", timeout=max_wait_ms)
+        elif strategy == "selector":
+            report["selector"] = selector
+            report["round_trips"] = 1
+            await page.wait_for_selector(selector, state="attached", timeout=max_wait_ms)
+        else:
+            await _wait_for_dom_quiescence(page, quiet_period_ms, deadline, report)
+    except PlaywrightTimeoutError:
+        report["timed_out"] = True
+
+    report["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    return report
@@ -0,0 +1,427 @@
+"""
+In-page extraction scripts
+
+JavaScript evaluated inside the page so that a whole structured payload comes
+back in a single CDP round trip instead of one round trip per element.
+"""
+
+TRUNCATION_MARKER = "... [Content truncated]"
+
+# Shared helper: cut text to maxChars without splitting a surrogate pair
+_TRUNCATE_JS = """
+    const truncate = (text, maxChars) => {
+        if (maxChars === null || text.length <= maxChars) return text;
+        let end = maxChars;
+        const code = text.charCodeAt(end - 1);
+        if (code >= 0xD800 && code <= 0xDBFF) end -= 1;
+        return text.slice(0, end) + marker;
+    };
+"""
+
+PAGE_TEXT_SCRIPT = """
+([maxChars, marker]) => {
+""" + _TRUNCATE_JS + """
+    const body = document.body;
+    const text = body ? body.innerText : '';
+    return { title: document.title, text: truncate(text, maxChars), textLength: text.length };
+}
+"""
+
+EXTRACT_CONTENT_SCRIPT = """
+([maxLinks, maxImages, maxChars, marker]) => {
+""" + _TRUNCATE_JS + """
+    const headings = [];
+    for (let level = 1; level <= 6; level++) {
+        for (const el of document.querySelectorAll('h' + level)) {
+            const text = (el.innerText || '').trim();
+            if (text) headings.push({ level, text });
+        }
+    }
+
+    const links = [];
+    for (const el of Array.from(document.querySelectorAll('a[href]')).slice(0, maxLinks)) {
+        const text = (el.innerText || '').trim();
+        const href = el.getAttribute('href');
+        if (text && href) links.push({ text, url: href });
+    }
+
+    const images = [];
+    for (const el of Array.from(document.querySelectorAll('img[src]')).slice(0, maxImages)) {
+        const src = el.getAttribute('src');
+        if (src) images.push({ src, alt: el.getAttribute('alt') || '' });
+    }
+
+    const body = document.body;
+    const text = body ? body.innerText : '';
+    return {
+        title: document.title,
+        headings,
+        links,
+        images,
+        text_content: truncate(text, maxChars)
+    };
+}
+"""
+
+SEARCH_RESULTS_SCRIPT = """
+([maxResults]) => {
+    const results = [];
+    for (const result of Array.from(document.querySelectorAll('div.g')).slice(0, maxResults)) {
+        const title = result.querySelector('h3');
+        const link = result.querySelector('a');
+        if (!title || !link) continue;
+        const snippet = result.querySelector('span');
+        results.push({
+            title: title.innerText,
+            url: link.getAttribute('href'),
+            snippet: snippet ? snippet.innerText : ''
+        });
+    }
+    return results;
+}
+"""
+
+FILL_FORM_SCRIPT = """
+(fields) => {
+    const escape = (value) => (window.CSS && CSS.escape) ? CSS.escape(value) : value.replace(/["\\\\]/g, '\\\\$&');
+    const resolve = (name) => {
+        for (const tag of ['input', 'textarea', 'select']) {
+            for (const attr of ['name', 'id']) {
+                const el = document.querySelector(`${tag}[${attr}="${escape(name)}"]`);
+                if (el) return el;
+            }
+        }
+        return null;
+    };
+    const fire = (el, type) => el.dispatchEvent(new Event(type, { bubbles: true }));
+    const truthy = (value, text) => typeof value === 'boolean'
+        ? value
+        : !['', 'false', '0', 'off', 'no', 'none', 'null'].includes(text.trim().toLowerCase());
+    const setValue = (el, value) => {
+        // Use the prototype setter so framework-managed inputs (React) see the change
+        const proto = Object.getPrototypeOf(el);
+        const descriptor = Object.getOwnPropertyDescriptor(proto, 'value');
+        if (descriptor && descriptor.set) descriptor.set.call(el, value); else el.value = value;
+    };
+    const setChecked = (el, checked) => {
+        if (el.checked !== checked) el.click();
+        if (el.checked !== checked) throw new Error('checked state was not applied');
+    };
+
+    const fill = (el, field) => {
+        if (el.disabled) throw new Error('field is disabled');
+        if (el instanceof HTMLSelectElement) {
+            const wanted = (Array.isArray(field.value) ? field.value : [field.text]).map(String);
+            let matched = 0;
+            for (const option of el.options) {
+                const hit = wanted.includes(option.value) || wanted.includes(option.text.trim());
+                if (hit && !el.multiple && matched) continue;
+                option.selected = hit;
+                if (hit) matched += 1;
+            }
+            if (!matched) throw new Error(`no option matching '${wanted.join(', ')}'`);
+            fire(el, 'input');
+            fire(el, 'change');
+            return 'select';
+        }
+        const type = (el.type || '').toLowerCase();
+        if (type === 'checkbox') {
+            setChecked(el, truthy(field.value, field.text));
+            return 'checkbox';
+        }
+        if (type === 'radio') {
+            const group = el.name
+                ? Array.from(document.querySelectorAll(`input[type="radio"][name="${escape(el.name)}"]`))
+                : [el];
+            const target = group.length > 1 || el.value !== 'on'
+                ? group.find((radio) => radio.value === field.text)
+                : (truthy(field.value, field.text) ? el : null);
+            if (!target) throw new Error(`no radio option with value '${field.text}'`);
+            setChecked(target, true);
+            return 'radio';
+        }
+        if (type === 'file') throw new Error('file inputs are not supported');
+        if (el.readOnly) throw new Error('field is read-only');
+        el.focus();
+        setValue(el, field.text);
+        fire(el, 'input');
+        fire(el, 'change');
+        return el instanceof HTMLTextAreaElement ? 'textarea' : 'input';
+    };
+
+    return fields.map((field) => {
+        const el = resolve(field.name);
+        if (!el) return { name: field.name, found: false, filled: false };
+        try {
+            return { name: field.name, found: true, filled: true, type: fill(el, field) };
+        } catch (e) {
+            return { name: field.name, found: true, filled: false, error: String(e && e.message || e) };
+        }
+    });
+}
+"""
+
+# Text cursors snapshot innerText once so offsets stay stable while the caller
+# pages through it; the snapshot lives until the page navigates away
+TEXT_CURSOR_OPEN_SCRIPT = """
+([cursor]) => {
+    const store = window.__agentcoreTextCursors || (window.__agentcoreTextCursors = {});
+    const text = document.body ? document.body.innerText : '';
+    store[cursor] = text;
+    return { title: document.title, totalLength: text.length };
+}
+"""
+
+TEXT_CURSOR_READ_SCRIPT = """
+([cursor, offset, size]) => {
+    const store = window.__agentcoreTextCursors;
+    const text = store ? store[cursor] : undefined;
+    if (text === undefined) return null;
+    let end = Math.min(offset + size, text.length);
+    if (end < text.length && end - offset > 1) {
+        const code = text.charCodeAt(end - 1);
+        if (code >= 0xD800 && code <= 0xDBFF) end -= 1;
+    }
+    return { text: text.slice(offset, end), nextOffset: end, totalLength: text.length };
+}
+"""
+
+TEXT_CURSOR_CLOSE_SCRIPT = """
+([cursor]) => {
+    const store = window.__agentcoreTextCursors;
+    if (store) delete store[cursor];
+}
+"""
+
+# Readability-style extraction: pick the main content root, drop boilerplate
+# (navigation, footers, fixed banners, hidden nodes), render blocks as compact
+# markdown or text and fit them into a UTF-8 byte budget by dropping whole
+# blocks, then list items/table rows, then sentences - never mid-sentence
+MAIN_CONTENT_SCRIPT = """
+([format, budgetBytes]) => {
+    const NEGATIVE = /(^|[-_\\s])(nav|navbar|menu|footer|masthead|sidebar|comments?|cookies?|consent|banner|advert|ads|promo|share|social|related|recommended|newsletter|subscribe|popup|modal|breadcrumbs?|pagination|toolbar|skip)([-_\\s]|$)/i;
+    const POSITIVE = /(^|[-_\\s])(article|content|main|post|entry|story|body|text|prose|markdown|docs?|documentation)([-_\\s]|$)/i;
+    const SKIP_TAGS = new Set([
+        'SCRIPT', 'STYLE', 'NOSCRIPT', 'TEMPLATE', 'SVG', 'CANVAS', 'IFRAME', 'OBJECT', 'EMBED',
+        'FORM', 'BUTTON', 'INPUT', 'SELECT', 'TEXTAREA', 'NAV', 'FOOTER', 'ASIDE', 'DIALOG'
+    ]);
+    const SKIP_ROLES = new Set([
+        'navigation', 'banner', 'contentinfo', 'complementary', 'dialog', 'alertdialog', 'search', 'menu', 'menubar'
+    ]);
+    const BLOCK_SELECTOR = 'p,h1,h2,h3,h4,h5,h6,ul,ol,pre,blockquote,table,dl,div,section,article,main,figure,header,details,li';
+    const encoder = new TextEncoder();
+    const bytes = (text) => encoder.encode(text).length;
+    const squash = (text) => (text || '').replace(/\\s+/g, ' ').trim();
+    const hint = (el) => `${el.id || ''} ${typeof el.className === 'string' ? el.className : ''}`;
+
+    const skip = (el) => {
+        if (SKIP_TAGS.has(el.tagName)) return true;
+        if (el.tagName === 'HEADER' && !el.querySelector('h1')) return true;
+        if (SKIP_ROLES.has(el.getAttribute('role'))) return true;
+        if (el.hidden || el.getAttribute('aria-hidden') === 'true') return true;
+        const h = hint(el);
+        if (NEGATIVE.test(h) && !POSITIVE.test(h)) return true;
+        const style = getComputedStyle(el);
+        return style.display === 'none' || style.visibility === 'hidden' || style.position === 'fixed';
+    };
+
+    // Score paragraph-like nodes into their ancestors; the best-scoring
+    // container with little link text is the main content
+    const pickRoot = () => {
+        const scores = new Map();
+        for (const node of document.querySelectorAll('p, pre, blockquote, li, td')) {
+            const length = squash(node.textContent).length;
+            if (length < 25) continue;
+            const points = 1 + Math.min(length / 100, 3);
+            let parent = node.parentElement;
+            for (let weight = 1; parent && weight >= 0.25; weight /= 2, parent = parent.parentElement) {
+                scores.set(parent, (scores.get(parent) || 0) + points * weight);
+            }
+        }
+        const ranked = Array.from(scores.entries())
+            .filter(([el]) => el !== document.documentElement)
+            .sort((a, b) => b[1] - a[1])
+            .slice(0, 8);
+        let root = null;
+        let best = 0;
+        for (const [el, raw] of ranked) {
+            const textLength = squash(el.textContent).length || 1;
+            let linkLength = 0;
+            for (const a of el.querySelectorAll('a')) linkLength += squash(a.textContent).length;
+            let score = raw * (1 - Math.min(linkLength / textLength, 1));
+            const h = hint(el);
+            if (POSITIVE.test(h)) score *= 1.25;
+            if (NEGATIVE.test(h)) score *= 0.5;
+            if (el.tagName === 'ARTICLE' || el.tagName === 'MAIN' || el.getAttribute('role') === 'main') score *= 1.5;
+            if (score > best) {
+                best = score;
+                root = el;
+            }
+        }
+        // A semantic container around the winner usually also holds its title
+        const semantic = root && root.closest('article, main, [role="main"]');
+        return semantic || root || document.querySelector('article, main, [role="main"]') || document.body;
+    };
+
+    const blocks = [];
+    const listItems = (list) => Array.from(list.children)
+        .filter((li) => li.tagName === 'LI' && !skip(li))
+        .map((li) => squash(li.innerText))
+        .filter(Boolean);
+    const walk = (el) => {
+        let loose = '';
+        const flush = () => {
+            const text = squash(loose);
+            if (text) blocks.push({ kind: 'p', text });
+            loose = '';
+        };
+        for (const node of el.childNodes) {
+            if (node.nodeType === Node.TEXT_NODE) {
+                loose += node.textContent;
+                continue;
+            }
+            if (node.nodeType !== Node.ELEMENT_NODE || skip(node)) continue;
+            const tag = node.tagName;
+            if (tag === 'BR') {
+                loose += ' ';
+                continue;
+            }
+            if (!node.matches(BLOCK_SELECTOR) && !node.querySelector(BLOCK_SELECTOR)) {
+                loose += ' ' + (node.innerText || node.textContent || '') + ' ';
+                continue;
+            }
+            flush();
+            if (/^H[1-6]$/.test(tag)) {
+                const text = squash(node.innerText);
+                if (text) blocks.push({ kind: 'h', level: Number(tag[1]), text });
+            } else if (tag === 'P') {
+                const text = squash(node.innerText);
+                if (text) blocks.push({ kind: 'p', text });
+            } else if (tag === 'UL' || tag === 'OL') {
+                const items = listItems(node);
+                if (items.length) blocks.push({ kind: 'list', ordered: tag === 'OL', items });
+            } else if (tag === 'PRE') {
+                const text = (node.innerText || '').replace(/\\s+$/, '');
+                if (text) blocks.push({ kind: 'code', text });
+            } else if (tag === 'BLOCKQUOTE') {
+                const text = squash(node.innerText);
+                if (text) blocks.push({ kind: 'quote', text });
+            } else if (tag === 'TABLE') {
+                const items = Array.from(node.rows)
+                    .map((row) => Array.from(row.cells).map((cell) => squash(cell.innerText).replace(/\\|/g, '/')))
+                    .filter((cells) => cells.some(Boolean));
+                if (items.length) blocks.push({ kind: 'table', items });
+            } else if (tag === 'DL') {
+                const items = [];
+                for (const child of node.children) {
+                    const text = squash(child.innerText);
+                    if (!text) continue;
+                    if (child.tagName === 'DD' && items.length) items[items.length - 1] += ': ' + text;
+                    else items.push(text);
+                }
+                if (items.length) blocks.push({ kind: 'list', ordered: false, items });
+            } else {
+                walk(node);
+            }
+        }
+        flush();
+    };
+
+    const markdown = format === 'markdown';
+    const renderItems = (block, items) => {
+        if (block.kind === 'table') {
+            const rows = items.map((cells) => markdown ? `| ${cells.join(' | ')} |` : cells.join(' | '));
+            if (markdown && block.items.length > 1 && items.length) {
+                rows.splice(1, 0, `|${' --- |'.repeat(items[0].length)}`);
+            }
+            return rows.join('\\n');
+        }
+        return items.map((item, i) => (block.ordered ? `${i + 1}. ` : '- ') + item).join('\\n');
+    };
+    const render = (block) => {
+        switch (block.kind) {
+            case 'h': return markdown ? '#'.repeat(block.level) + ' ' + block.text : block.text;
+            case 'code': return markdown ? '```\\n' + block.text + '\\n```' : block.text;
+            case 'quote': return markdown ? '> ' + block.text : block.text;
+            case 'list':
+            case 'table': return renderItems(block, block.items);
+            default: return block.text;
+        }
+    };
+    // Largest structural prefix of a block that fits in the remaining bytes
+    const partial = (block, available) => {
+        if (block.kind === 'list' || block.kind === 'table') {
+            let text = null;
+            for (let n = 1; n <= block.items.length; n++) {
+                const candidate = renderItems(block, block.items.slice(0, n));
+                if (bytes(candidate) > available) break;
+                text = candidate;
+            }
+            return text;
+        }
+        if (block.kind === 'p' || block.kind === 'quote') {
+            const sentences = block.text.match(/[^.!?]+(?:[.!?]+|$)\\s*/g) || [];
+            let text = null;
+            let kept = '';
+            for (const sentence of sentences) {
+                const candidate = render({ ...block, text: (kept + sentence).trim() });
+                if (bytes(candidate) > available) break;
+                kept += sentence;
+                text = candidate;
+            }
+            return text;
+        }
+        return null;
+    };
+
+    const root = pickRoot();
+    walk(root);
+
+    const parts = [];
+    let used = 0;
+    let kept = 0;
+    let cut = blocks.length;
+    for (let i = 0; i < blocks.length; i++) {
+        const text = render(blocks[i]);
+        const cost = bytes(text) + (parts.length ? 2 : 0);
+        if (budgetBytes === null || used + cost <= budgetBytes) {
+            parts.push(text);
+            used += cost;
+            kept += 1;
+            continue;
+        }
+        const rest = budgetBytes - used - (parts.length ? 2 : 0);
+        const piece = rest > 0 ? partial(blocks[i], rest) : null;
+        if (piece) {
+            parts.push(piece);
+            kept += 1;
+        } else if (kept && blocks[i - 1].kind === 'h') {
+            // Do not end on a heading whose body was cut
+            parts.pop();
+            kept -= 1;
+            i -= 1;
+        }
+        cut = i;
+        break;
+    }
+    const omittedSections = blocks.slice(cut)
+        .filter((block) => block.kind === 'h' && block.level <= 3)
+        .map((block) => block.text);
+
+    const content = parts.join('\\n\\n');
+    const sourceText = document.body ? document.body.innerText : '';
+    const describe = (el) => el.tagName.toLowerCase() + (el.id ? '#' + el.id : '') +
+        (typeof el.className === 'string' && el.className.trim() ? '.' + el.className.trim().split(/\\s+/).join('.') : '');
+    return {
+        title: document.title,
+        content,
+        mainElement: describe(root),
+        truncated: cut < blocks.length,
+        omittedSections,
+        blocksTotal: blocks.length,
+        blocksKept: kept,
+        contentBytes: bytes(content),
+        sourceBytes: bytes(sourceText)
+    };
+}
+"""
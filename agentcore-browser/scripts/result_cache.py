@@ -0,0 +1,205 @@
+"""
+Result Cache
+
+TTL + LRU caches for BrowserTool results, keyed on normalized URL, operation,
+extraction limits and fetch settings. MemoryResultCache serves hits without
+any I/O; SqliteResultCache persists results across processes.
+"""
+
+import copy
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL for cache lookups.
+
+    Lowercases scheme and host, drops default ports, fragments and userinfo,
+    sorts query parameters and uses "/" for an empty path.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, parts.path or "/", query, ""))
+
+
+def cache_key(operation: str, url: str, limits: Optional[Dict[str, Any]] = None,
+              settings: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Build the cache key for an operation on url.
+
+    Args:
+        operation: Tool operation, e.g. "browse_url"
+        url: Requested URL
+        limits: Extraction limits that shape the result
+        settings: Fetch settings that change what the page shows, e.g. the
+            network profile and readiness strategy
+
+    Returns:
+        SHA-256 hex digest. URLs with different credentials get different
+        keys, but the credentials are never written to a cache as plain text
+    """
+    userinfo = urlsplit(url.strip()).netloc.rpartition("@")[0]
+    payload = json.dumps([operation, normalize_url(url), userinfo, limits or {}, settings or {}],
+                         sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache(ABC):
+    """Base class: TTL and size bounds plus hit/miss counters."""
+
+    def __init__(self, ttl_seconds: float = 300, max_entries: int = 256):
+        """
+        Args:
+            ttl_seconds: How long an entry stays valid
+            max_entries: Least recently used entries are evicted beyond this size
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0}
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the live entry for key, or None on a miss or expiry."""
+
+    @abstractmethod
+    def set(self, key: str, value: Dict[str, Any]):
+        """Store value under key, evicting least recently used entries beyond max_entries."""
+
+    @abstractmethod
+    def clear(self):
+        """Remove every entry."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of stored entries, including expired ones not yet evicted."""
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss/expiry/eviction counters, current size and hit rate."""
+        with self._lock:
+            counters = dict(self._counters)
+        lookups = counters["hits"] + counters["misses"]
+        counters["size"] = len(self)
+        counters["hit_rate"] = round(counters["hits"] / lookups, 3) if lookups else 0.0
+        return counters
+
+
+class MemoryResultCache(ResultCache):
+    """In-process cache backed by an OrderedDict."""
+
+    def __init__(self, ttl_seconds: float = 300, max_entries: int = 256):
+        super().__init__(ttl_seconds, max_entries)
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._counters["misses"] += 1
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                self._counters["expired"] += 1
+                self._counters["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._counters["hits"] += 1
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Dict[str, Any]):
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SqliteResultCache(ResultCache):
+    """On-disk cache stored in a sqlite database, shareable between processes."""
+
+    def __init__(self, path: str, ttl_seconds: float = 3600, max_entries: int = 10000):
+        """
+        Args:
+            path: sqlite database file (created if missing)
+            ttl_seconds: How long an entry stays valid
+            max_entries: Least recently used entries are evicted beyond this size
+        """
+        super().__init__(ttl_seconds, max_entries)
+        self.path = path
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed_at)")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._lock:
+            row = self._db.execute("SELECT value, expires_at FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self._counters["misses"] += 1
+                return None
+            if now >= row[1]:
+                self._db.execute("DELETE FROM results WHERE key = ?", (key,))
+                self._counters["expired"] += 1
+                self._counters["misses"] += 1
+                return None
+            self._db.execute("UPDATE results SET accessed_at = ? WHERE key = ?", (now, key))
+            self._counters["hits"] += 1
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Dict[str, Any]):
+        now = time.time()
+        payload = json.dumps(value)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, payload, now + self.ttl_seconds, now)
+            )
+            overflow = self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0] - self.max_entries
+            if overflow > 0:
+                self._db.execute(
+                    "DELETE FROM results WHERE key IN "
+                    "(SELECT key FROM results ORDER BY accessed_at LIMIT ?)", (overflow,)
+                )
+                self._counters["evictions"] += overflow
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM results")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._db.close()
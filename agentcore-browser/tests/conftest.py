@@ -0,0 +1,82 @@
+"""
+Shared stubs for the session manager and pool tests.
+
+Run from the agentcore-browser directory:
+    python -m pytest tests
+"""
+
+import itertools
+import threading
+
+import pytest
+
+
+class StubDataPlane:
+    """Records the boto3 calls BrowserSessionManager makes."""
+
+    def __init__(self):
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self.started = []
+        self.stopped = []
+        self.statuses = {}
+
+    def start_browser_session(self, **params):
+        with self._lock:
+            session_id = f"session-{next(self._ids)}"
+            self.started.append(params)
+        return {"sessionId": session_id}
+
+    def stop_browser_session(self, browserIdentifier, sessionId):
+        with self._lock:
+            self.stopped.append(sessionId)
+
+    def get_browser_session(self, browserIdentifier, sessionId):
+        return {"status": self.statuses.get(sessionId, "READY")}
+
+
+class StubBrowserClient:
+    """Current bedrock-agentcore shape: the boto3 client is data_plane_client."""
+
+    def __init__(self, region):
+        self.region = region
+        self.identifier = None
+        self.session_id = None
+        self.data_plane_client = StubDataPlane()
+
+    @property
+    def calls(self):
+        return self.data_plane_client
+
+    def generate_ws_headers(self):
+        return f"wss://browser.test/{self.session_id}", {"Authorization": f"signed {self.session_id}"}
+
+    def generate_live_view_url(self, expires):
+        return f"https://browser.test/{self.session_id}/live?expires={expires}"
+
+
+class LegacyBrowserClient(StubBrowserClient):
+    """Older bedrock-agentcore shape: the boto3 client is client."""
+
+    def __init__(self, region):
+        super().__init__(region)
+        self.client = self.__dict__.pop("data_plane_client")
+
+    @property
+    def calls(self):
+        return self.client
+
+
+@pytest.fixture(params=[StubBrowserClient, LegacyBrowserClient], ids=["data_plane_client", "client"])
+def stub_client(request):
+    """A factory for BrowserSessionManager that remembers every client it built."""
+    built = []
+
+    def factory(region):
+        client = request.param(region)
+        built.append(client)
+        return client
+
+    factory.built = built
+    return factory
+
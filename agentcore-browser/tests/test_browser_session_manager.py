@@ -0,0 +1,57 @@
+import pytest
+
+pytest.importorskip("bedrock_agentcore")
+
+from scripts.browser_session_manager import (  # noqa: E402
+    BROWSER_IDENTIFIER, DEFAULT_SESSION_TIMEOUT_SECONDS, BrowserSessionManager,
+)
+
+
+def test_init_browser_session_starts_and_signs(stub_client):
+    manager = BrowserSessionManager(client_factory=stub_client)
+
+    session = manager.init_browser_session()
+
+    assert session["success"], session
+    assert session["session_id"] == "session-1"
+    assert session["ws_url"] == "wss://browser.test/session-1"
+    assert session["ws_headers"] == {"Authorization": "signed session-1"}
+    [params] = stub_client.built[0].calls.started
+    assert params["browserIdentifier"] == BROWSER_IDENTIFIER
+    assert params["sessionTimeoutSeconds"] == DEFAULT_SESSION_TIMEOUT_SECONDS
+
+
+def test_init_browser_session_passes_timeout(stub_client):
+    manager = BrowserSessionManager(client_factory=stub_client)
+
+    assert manager.init_browser_session(session_timeout_seconds=600)["success"]
+
+    [params] = stub_client.built[0].calls.started
+    assert params["sessionTimeoutSeconds"] == 600
+
+
+def test_calls_share_one_client(stub_client):
+    manager = BrowserSessionManager(client_factory=stub_client)
+
+    batch = manager.start_sessions(3)
+    status = manager.get_session_status("session-1")
+    closed = manager.close_sessions(["session-1", "session-2", "session-3"])
+
+    assert batch["success"] and closed["success"]
+    assert status["session_status"] == "READY"
+    assert len(stub_client.built) == 1
+    assert sorted(stub_client.built[0].calls.stopped) == ["session-1", "session-2", "session-3"]
+
+
+def test_close_browser_session_reports_errors(stub_client):
+    manager = BrowserSessionManager(client_factory=stub_client)
+    manager.init_browser_session()
+
+    def fail(**_):
+        raise RuntimeError("service unavailable")
+
+    stub_client.built[0].calls.stop_browser_session = fail
+    result = manager.close_browser_session("session-1")
+
+    assert not result["success"]
+    assert result["error"] == "service unavailable"
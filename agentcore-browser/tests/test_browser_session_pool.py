@@ -0,0 +1,74 @@
+import time
+
+import pytest
+
+pytest.importorskip("bedrock_agentcore")
+
+from scripts.browser_session_manager import BrowserSessionManager  # noqa: E402
+
+
+def wait_for(predicate, timeout=5.0):
+    """Poll predicate until it is true; fail the test after timeout seconds."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() >= deadline:
+            pytest.fail(f"Condition not met within {timeout}s")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def manager(stub_client):
+    manager = BrowserSessionManager(client_factory=stub_client)
+    yield manager
+    manager.shutdown_session_pool(close_leased=True)
+
+
+def test_pool_warms_up_and_leases(manager, stub_client):
+    pool = manager.start_session_pool(size=2, wait=True, wait_timeout=5)
+    calls = stub_client.built[0].calls
+
+    with pool.lease() as session:
+        assert session["success"] and session["pooled"]
+        assert session["ws_url"] == f"wss://browser.test/{session['session_id']}"
+        leased = session["session_id"]
+
+    # Leases end with reuse=False: the session is stopped and replaced
+    wait_for(lambda: leased in calls.stopped and pool.stats()["idle"] == 2)
+    assert all(params["sessionTimeoutSeconds"] == 900 for params in calls.started)
+
+
+def test_init_and_release_go_through_pool(manager, stub_client):
+    pool = manager.start_session_pool(size=1, wait=True, wait_timeout=5)
+
+    session = manager.init_browser_session()
+    assert session["pooled"] and pool.owns(session["session_id"])
+    assert manager.release_browser_session(session["session_id"])["success"]
+
+    assert pool.stats()["sessions_reused"] == 1
+    assert not pool.owns(session["session_id"])
+
+
+def test_unhealthy_session_is_replaced(manager, stub_client):
+    pool = manager.start_session_pool(size=2, wait=True, wait_timeout=5, health_check_interval_seconds=0.05)
+    calls = stub_client.built[0].calls
+    sick = "session-1"
+
+    calls.statuses[sick] = "TERMINATED"
+
+    wait_for(lambda: sick in calls.stopped and pool.stats()["idle"] == 2)
+    assert pool.stats()["sessions_unhealthy"] == 1
+    assert len(calls.started) == 3
+
+
+def test_shutdown_closes_idle_and_leased(manager, stub_client):
+    pool = manager.start_session_pool(size=2, wait=True, wait_timeout=5)
+    calls = stub_client.built[0].calls
+    leased = manager.init_browser_session()["session_id"]
+    wait_for(lambda: pool.stats()["idle"] == 2)
+
+    result = manager.shutdown_session_pool(close_leased=True)
+
+    assert result["closed_sessions"] == 3
+    assert sorted(calls.stopped) == ["session-1", "session-2", "session-3"]
+    assert leased in calls.stopped
+    assert not pool.acquire(timeout=0)["success"]
@@ -0,0 +1,82 @@
+import asyncio
+import threading
+
+import pytest
+
+from scripts import connection_registry
+from scripts.connection_registry import ConnectionRegistry
+
+
+class FakeBrowser:
+    """Stands in for a connect_over_cdp Browser; close() can hang or fail."""
+
+    def __init__(self, close="ok"):
+        self.close_mode = close
+        self.closed = False
+
+    def is_connected(self):
+        return not self.closed
+
+    def on(self, event, handler):
+        pass
+
+    async def close(self):
+        if self.close_mode == "hang":
+            await asyncio.get_running_loop().create_future()
+        if self.close_mode == "fail":
+            raise RuntimeError("connection already closed")
+        self.closed = True
+
+
+class FakeDriver:
+    def __init__(self, browser):
+        self.chromium = self
+        self.browser = browser
+        self.stopped = False
+
+    async def connect_over_cdp(self, endpoint_url, headers):
+        return self.browser
+
+    async def stop(self):
+        self.stopped = True
+
+
+@pytest.fixture
+def fake_driver(monkeypatch, request):
+    driver = FakeDriver(FakeBrowser(close=getattr(request, "param", "ok")))
+
+    class Starter:
+        async def start(self):
+            return driver
+
+    monkeypatch.setattr(connection_registry, "async_playwright", Starter)
+    monkeypatch.setattr(connection_registry, "SHUTDOWN_CLOSE_TIMEOUT_SECONDS", 0.2)
+    return driver
+
+
+def run_with_borrowed_connection(registry):
+    """asyncio.run() a coroutine that borrows a connection and never releases it."""
+    async def main():
+        await registry.borrow("session-1", "wss://browser.test/session-1", {})
+
+    thread = threading.Thread(target=asyncio.run, args=(main(),), daemon=True)
+    thread.start()
+    thread.join(timeout=5)
+    return not thread.is_alive()
+
+
+def test_loop_shutdown_closes_borrowed_connection(fake_driver):
+    registry = ConnectionRegistry(idle_timeout_seconds=60)
+
+    assert run_with_borrowed_connection(registry)
+    assert fake_driver.browser.closed
+    assert fake_driver.stopped
+    assert registry.stats()["connections"] == 0
+
+
+@pytest.mark.parametrize("fake_driver", ["hang", "fail"], indirect=True)
+def test_loop_shutdown_returns_when_close_does_not(fake_driver):
+    registry = ConnectionRegistry(idle_timeout_seconds=60)
+
+    assert run_with_borrowed_connection(registry)
+    assert not fake_driver.browser.closed
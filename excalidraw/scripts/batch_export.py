@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Export many Excalidraw files to PNG with one browser.
+
+Files, directories (searched recursively for *.excalidraw and
+*.excalidraw.json) and glob patterns are expanded into one job list. The
+browser is launched once per worker process and a pool of pre-loaded pages
+renders the files concurrently.
+
+Usage:
+    python scripts/batch_export.py docs/diagrams 'notes/**/*.excalidraw.json' --output-dir build/png
+"""
+import argparse
+import asyncio
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from playwright.async_api import async_playwright
+
+from export_cache import scene_key
+from export_excalidraw import (
+    RENDERERS, STEP_TIMEOUT_SECONDS, ExportPagePool, add_cache_arguments, cache_from_arguments,
+    default_output_file, renderer_version, resolve_renderer,
+)
+from local_renderer import renderer_installed
+
+EXCALIDRAW_SUFFIXES = ('.excalidraw', '.excalidraw.json')
+DEFAULT_POOL_SIZE = 4
+
+
+def expand_inputs(patterns):
+    """
+    Expand files, directories and glob patterns into a sorted, de-duplicated
+    list of Excalidraw files. Raises FileNotFoundError for a path that does
+    not exist or a pattern that matches nothing.
+    """
+    found = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for root, _, names in os.walk(pattern):
+                found += [os.path.join(root, name) for name in names if name.endswith(EXCALIDRAW_SUFFIXES)]
+        elif os.path.isfile(pattern):
+            found.append(pattern)
+        elif glob.has_magic(pattern):
+            matches = [path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path)]
+            if not matches:
+                raise FileNotFoundError(f"No files match {pattern}")
+            found += matches
+        else:
+            raise FileNotFoundError(f"No such file or directory: {pattern}")
+    return sorted({os.path.abspath(path) for path in found})
+
+
+def plan_outputs(input_files, output_dir=None):
+    """
+    Pair each input with its PNG path: next to the input, or under output_dir
+    keeping the inputs' paths relative to their common parent directory.
+    Raises ValueError when two inputs would write the same PNG, e.g.
+    a.excalidraw and a.excalidraw.json in one directory.
+    """
+    if output_dir is None or not input_files:
+        jobs = [(path, default_output_file(path)) for path in input_files]
+    else:
+        common = os.path.commonpath([os.path.dirname(path) for path in input_files])
+        jobs = [
+            (path, os.path.join(output_dir, default_output_file(os.path.relpath(path, common))))
+            for path in input_files
+        ]
+
+    claimed = {}
+    for input_file, output_file in jobs:
+        other = claimed.setdefault(os.path.normcase(os.path.abspath(output_file)), input_file)
+        if other != input_file:
+            raise ValueError(f"{other} and {input_file} would both be exported to {output_file}")
+    return jobs
+
+
+def _load_cached(jobs, scale, renderer, cache, force):
+    """
+    Serve jobs from the cache without a browser; returns (results for hits
+    and unreadable files, remaining jobs as (input, output, cache key)).
+    """
+    done, misses = [], []
+    version = renderer_version(renderer)
+    for input_file, output_file in jobs:
+        started = time.perf_counter()
+        try:
+            with open(input_file, 'r', encoding='utf-8') as f:
+                key = scene_key(json.load(f), scale, 'png', version)
+        except (OSError, ValueError) as e:
+            done.append({
+                'input': input_file, 'output': output_file, 'success': False, 'cached': False,
+                'error': f"{type(e).__name__}: {e}", 'timings': {},
+                'elapsed_ms': round((time.perf_counter() - started) * 1000, 1),
+            })
+            continue
+        if not force and cache.fetch(key, output_file):
+            done.append({
+                'input': input_file, 'output': output_file, 'success': True, 'cached': True,
+                'bytes': os.path.getsize(output_file), 'timings': {},
+                'elapsed_ms': round((time.perf_counter() - started) * 1000, 1),
+            })
+        else:
+            misses.append((input_file, output_file, key))
+    return done, misses
+
+
+async def _export_one(pool, input_file, output_file, key, scale, cache):
+    started = time.perf_counter()
+    timings = {}
+    result = {'input': input_file, 'output': output_file, 'success': False, 'cached': False}
+    try:
+        with open(input_file, 'r', encoding='utf-8') as f:
+            excalidraw_data = json.load(f)
+        size = await pool.export(excalidraw_data, output_file, scale, timings)
+        if size is None:
+            result['error'] = "Could not extract PNG"
+        else:
+            if cache is not None and key is not None:
+                cache.store(key, output_file)
+            result['bytes'] = size
+            result['success'] = True
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    result['timings'] = timings
+    result['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 1)
+    return result
+
+
+async def export_jobs(jobs, scale=2, renderer='local', pool_size=DEFAULT_POOL_SIZE,
+                      step_timeout=STEP_TIMEOUT_SECONDS, on_result=None, cache=None):
+    """
+    Export jobs on one browser with a pool of pool_size pages.
+
+    Args:
+        jobs: List of (input_file, output_file, cache key or None)
+        scale: Export scale for every file
+        renderer: 'local' or 'remote'
+        pool_size: Number of pre-loaded pages rendering concurrently
+        step_timeout: Seconds each export phase may take
+        on_result: Optional callback invoked with each result as it finishes
+        cache: Optional ExportCache that successful exports are stored in
+
+    Returns:
+        One result per job, in job order:
+        {input, output, success, cached, [bytes], [error], timings, elapsed_ms}
+    """
+    results = [None] * len(jobs)
+    pending = iter(enumerate(jobs))
+
+    async def worker(pool):
+        for index, (input_file, output_file, key) in pending:
+            results[index] = await _export_one(pool, input_file, output_file, key, scale, cache)
+            if on_result is not None:
+                on_result(results[index])
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True, timeout=step_timeout * 1000)
+        try:
+            pool = await ExportPagePool(browser, renderer, min(pool_size, len(jobs)) or 1, step_timeout).start()
+            try:
+                await asyncio.gather(*(worker(pool) for _ in range(pool.size)))
+            finally:
+                await pool.close()
+        finally:
+            await browser.close()
+    return results
+
+
+def _export_chunk(jobs, scale, renderer, pool_size, step_timeout, cache):
+    return asyncio.run(export_jobs(jobs, scale, renderer, pool_size, step_timeout, _print_result, cache))
+
+
+def _print_result(result):
+    if result['success'] and result['cached']:
+        print(f"CACHED  {result['input']} -> {result['output']}", flush=True)
+    elif result['success']:
+        print(f"OK      {result['input']} -> {result['output']} ({result['elapsed_ms']:.0f} ms)", flush=True)
+    else:
+        print(f"FAILED  {result['input']}: {result['error']}", flush=True)
+
+
+def export_batch(inputs, output_dir=None, scale=2, renderer='auto', pool_size=DEFAULT_POOL_SIZE,
+                 workers=1, step_timeout=STEP_TIMEOUT_SECONDS, cache=None, force=False):
+    """
+    Export files, directories and globs to PNG, reusing one browser per worker.
+
+    Args:
+        inputs: Files, directories or glob patterns
+        output_dir: Directory for the PNGs (default: next to each input)
+        scale: Export scale (1, 2, or 3)
+        renderer: 'local', 'remote' or 'auto'
+        pool_size: Pre-loaded pages per worker
+        workers: Worker processes, each with its own browser and pool
+        step_timeout: Seconds each export phase may take
+        cache: Optional ExportCache; files it already has are copied without
+            launching a browser and new exports are stored in it
+        force: Export every file even if the cache has it
+
+    Returns:
+        One result per file, in input order (see export_jobs)
+    """
+    renderer = resolve_renderer(renderer)
+    all_jobs = plan_outputs(expand_inputs(inputs), output_dir)
+    if cache is not None:
+        results, jobs = _load_cached(all_jobs, scale, renderer, cache, force)
+        for result in results:
+            _print_result(result)
+    else:
+        results, jobs = [], [(input_file, output_file, None) for input_file, output_file in all_jobs]
+
+    if jobs:
+        if renderer == 'local' and not renderer_installed():
+            raise RuntimeError("Local renderer is not installed. Run: python scripts/local_renderer.py")
+        workers = max(1, min(workers, len(jobs)))
+        if workers == 1:
+            results = results + _export_chunk(jobs, scale, renderer, pool_size, step_timeout, cache)
+        else:
+            # Interleave so every worker gets a similar mix of files
+            chunks = [jobs[i::workers] for i in range(workers)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(_export_chunk, chunk, scale, renderer, pool_size, step_timeout, cache)
+                           for chunk in chunks]
+                results = results + [result for future in futures for result in future.result()]
+
+    by_input = {result['input']: result for result in results}
+    return [by_input[input_file] for input_file, _ in all_jobs]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export many Excalidraw files to PNG with one browser.")
+    parser.add_argument('inputs', nargs='+', help="files, directories or glob patterns")
+    parser.add_argument('--output-dir', help="write PNGs here instead of next to each input")
+    parser.add_argument('--scale', type=int, choices=(1, 2, 3), default=2)
+    parser.add_argument('--renderer', choices=RENDERERS, default='auto')
+    parser.add_argument('--pool-size', type=int, default=DEFAULT_POOL_SIZE,
+                        help="pre-loaded pages rendering concurrently per worker (default: %(default)s)")
+    parser.add_argument('--workers', type=int, default=1, help="worker processes, each with its own browser")
+    parser.add_argument('--step-timeout', type=float, default=STEP_TIMEOUT_SECONDS)
+    parser.add_argument('--json', metavar='FILE', help="also write the per-file results as JSON")
+    add_cache_arguments(parser)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    try:
+        results = export_batch(args.inputs, args.output_dir, args.scale, args.renderer, args.pool_size,
+                               args.workers, args.step_timeout, cache_from_arguments(args), args.force)
+    except (FileNotFoundError, RuntimeError, ValueError) as e:
+        print(e)
+        sys.exit(2)
+    elapsed = time.perf_counter() - started
+    failed = [result for result in results if not result['success']]
+    cached = sum(1 for result in results if result.get('cached'))
+    print(f"Exported {len(results) - len(failed)}/{len(results)} files ({cached} from cache) in {elapsed:.2f}s")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,158 @@
+"""
+Content-addressed cache for exported diagrams.
+
+Keys hash the normalized scene (deleted elements, edit bookkeeping and view
+state removed) together with the scale, output format and renderer version,
+so an unchanged diagram maps to the same cached image wherever it lives.
+"""
+import filecmp
+import hashlib
+import json
+import os
+import shutil
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache')), 'excalidraw-export'
+)
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Eviction trims to this fraction of max_bytes, so a full cache is walked once
+# per tenth of its size stored rather than on every store
+EVICT_TO_FRACTION = 0.9
+
+# Bump when normalization changes so old entries are not reused
+CACHE_KEY_VERSION = 2
+
+# Element fields that change on every edit or save without changing the drawing;
+# isDeleted is always false once deleted elements are dropped
+IGNORED_ELEMENT_KEYS = ('version', 'versionNonce', 'updated', 'isDeleted')
+
+# appState fields that affect an export; the rest is editor view state and is
+# not passed to the renderers (see export_app_state)
+EXPORT_APP_STATE_KEYS = ('viewBackgroundColor', 'exportBackground', 'exportWithDarkMode', 'exportEmbedScene',
+                         'theme')
+
+
+def export_app_state(scene):
+    """The appState renderers receive and scene_key hashes: EXPORT_APP_STATE_KEYS only."""
+    app_state = scene.get('appState') or {}
+    return {key: app_state[key] for key in EXPORT_APP_STATE_KEYS if key in app_state}
+
+
+def normalize_scene(scene):
+    """The parts of a scene that affect its rendering, in a canonical form."""
+    elements = [
+        {key: value for key, value in element.items() if key not in IGNORED_ELEMENT_KEYS}
+        for element in scene.get('elements', []) if not element.get('isDeleted')
+    ]
+    return {
+        'elements': elements,
+        'appState': export_app_state(scene),
+        'files': scene.get('files') or {},
+    }
+
+
+def scene_key(scene, scale, output_format, renderer_version):
+    """SHA-256 hex key for rendering scene at scale to output_format with renderer_version."""
+    payload = json.dumps(
+        [CACHE_KEY_VERSION, normalize_scene(scene), scale, output_format, renderer_version],
+        sort_keys=True, separators=(',', ':'), ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ExportCache:
+    """Exported images stored by key under cache_dir, evicted least recently used first."""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir: Directory holding the cached images
+            max_bytes: Total size the cache is trimmed to after each store
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._stats = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+        # Running size of the cache, so stores only walk the directory when over
+        # max_bytes; None until first needed. Entries written by other processes
+        # are picked up by the next walk.
+        self._total_bytes = None
+
+    def _path(self, key, output_format):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.{output_format}")
+
+    def fetch(self, key, output_file, output_format='png'):
+        """
+        Copy the cached image for key to output_file; returns False on a miss.
+
+        An output that already holds the same bytes is left untouched, so its
+        modification time only changes when the image does.
+        """
+        path = self._path(key, output_format)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            self._stats['misses'] += 1
+            return False
+        if not (os.path.isfile(output_file) and filecmp.cmp(path, output_file, shallow=False)):
+            os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
+            shutil.copyfile(path, output_file)
+        self._stats['hits'] += 1
+        return True
+
+    def store(self, key, output_file, output_format='png'):
+        """Add a freshly exported output_file under key, then trim the cache to max_bytes if it grew past it."""
+        if self._total_bytes is None:
+            self._total_bytes = sum(size for _, size, _ in self._entries())
+        path = self._path(key, output_format)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            replaced = os.path.getsize(path)
+        except FileNotFoundError:
+            replaced = 0
+        # Copy then rename, so concurrent exporters never see a partial entry
+        partial_path = f"{path}.{os.getpid()}.part"
+        shutil.copyfile(output_file, partial_path)
+        os.replace(partial_path, path)
+        self._stats['stores'] += 1
+        self._total_bytes += os.path.getsize(path) - replaced
+        if self._total_bytes > self.max_bytes:
+            self.evict()
+
+    def _entries(self):
+        entries = []
+        for root, _, names in os.walk(self.cache_dir):
+            for name in names:
+                if name.endswith('.part'):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(root, name))
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, os.path.join(root, name)))
+        return entries
+
+    def evict(self):
+        """Delete least recently used entries once the cache exceeds max_bytes, down to EVICT_TO_FRACTION of it."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * EVICT_TO_FRACTION if total > self.max_bytes else self.max_bytes
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                self._stats['evictions'] += 1
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._total_bytes = total
+
+    def clear(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        self._total_bytes = 0
+
+    def stats(self):
+        """Hit/miss/store/eviction counters for this instance plus current entries and size."""
+        entries = self._entries()
+        return {**self._stats, 'entries': len(entries), 'bytes': sum(size for _, size, _ in entries)}
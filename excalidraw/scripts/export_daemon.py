@@ -0,0 +1,526 @@
+#!/usr/bin/env python3
+"""
+Long-running export daemon with a warm browser.
+
+The daemon launches Chromium once, keeps a pool of pages with the renderer
+loaded and runs export jobs sent over a local Unix socket (one JSON object
+per line) or HTTP on 127.0.0.1. Jobs run concurrently up to the pool size;
+the rest wait in a queue.
+
+Usage:
+    python scripts/export_daemon.py serve [--socket PATH | --port 8765] [--pool-size 4]
+    python scripts/export_daemon.py submit diagram.excalidraw.json --scale 2 --scale 3 --format svg
+    cat diagram.excalidraw.json | python scripts/export_daemon.py submit - > diagram.png
+    python scripts/export_daemon.py stats
+    python scripts/export_daemon.py stop
+"""
+import argparse
+import asyncio
+import base64
+import getpass
+import hmac
+import http.client
+import json
+import math
+import os
+import secrets
+import signal
+import socket
+import sys
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from playwright.async_api import async_playwright
+
+from export_cache import scene_key
+from export_excalidraw import (
+    FORMATS, RENDERERS, STEP_TIMEOUT_SECONDS, ExportPagePool, add_cache_arguments, cache_from_arguments,
+    default_output_file, renderer_version, resolve_renderer,
+)
+from local_renderer import renderer_installed
+
+DEFAULT_SOCKET = os.path.join(
+    os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir(), f"excalidraw-export-{getpass.getuser()}.sock"
+)
+DEFAULT_POOL_SIZE = 4
+LATENCY_SAMPLES = 1000
+
+# Largest request accepted; inline scenes with embedded images can be large
+MAX_REQUEST_BYTES = 64 * 1024 * 1024
+
+# Host headers accepted over HTTP; anything else is a DNS-rebinding attempt
+LOOPBACK_HOSTS = ('127.0.0.1', 'localhost', '[::1]')
+
+
+def token_path(socket_path):
+    """Where an HTTP daemon writes its access token: next to the Unix socket path, mode 0600."""
+    return f"{socket_path}.token"
+
+
+def _write_token(path):
+    token = secrets.token_urlsafe(32)
+    if os.path.exists(path):
+        os.remove(path)
+    # O_EXCL: never follow a link planted in a shared temp directory
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, 'w') as f:
+        f.write(token)
+    return token
+
+
+def _socket_in_use(socket_path):
+    """True if a daemon is accepting connections on socket_path."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+        except OSError:
+            return False
+    return True
+
+
+def _parse_request(data):
+    request = json.loads(data) if data else {}
+    if not isinstance(request, dict):
+        raise ValueError("Request must be a JSON object")
+    return request
+
+
+def _percentile(ordered, pct):
+    if not ordered:
+        return None
+    return round(ordered[max(1, math.ceil(pct / 100 * len(ordered))) - 1], 1)
+
+
+def _scaled_output(output_file, scale, multiple):
+    """diagram.png -> diagram@2x.png when a job renders several scales."""
+    if not multiple:
+        return output_file
+    base, extension = os.path.splitext(output_file)
+    return f"{base}@{scale:g}x{extension}"
+
+
+class ExportDaemon:
+    """Runs export jobs on one browser and a pool of pre-loaded pages."""
+
+    def __init__(self, renderer='auto', pool_size=DEFAULT_POOL_SIZE, step_timeout=STEP_TIMEOUT_SECONDS, cache=None):
+        """
+        Args:
+            renderer: 'local', 'remote' or 'auto'
+            pool_size: Pre-loaded pages, i.e. jobs rendering at once
+            step_timeout: Seconds each export phase may take
+            cache: Optional ExportCache consulted per output before rendering
+        """
+        self.renderer = resolve_renderer(renderer)
+        self.pool_size = pool_size
+        self.step_timeout = step_timeout
+        self.cache = cache
+        self._playwright = None
+        self._browser = None
+        self._pool = None
+        # Created in start(), on the loop that runs the jobs
+        self._slots = None
+        self._waiting = 0
+        self._running = 0
+        self._started = None
+        self._counters = {'jobs': 0, 'failed': 0, 'outputs_rendered': 0, 'outputs_cached': 0}
+        self._latency_ms = deque(maxlen=LATENCY_SAMPLES)
+        self._queue_ms = deque(maxlen=LATENCY_SAMPLES)
+
+    async def start(self):
+        if self.renderer == 'local' and not renderer_installed():
+            raise RuntimeError("Local renderer is not installed. Run: python scripts/local_renderer.py")
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(headless=True, timeout=self.step_timeout * 1000)
+        self._pool = await ExportPagePool(self._browser, self.renderer, self.pool_size, self.step_timeout).start()
+        self._slots = asyncio.Semaphore(self.pool_size)
+        self._started = time.time()
+        return self
+
+    async def stop(self):
+        if self._pool is not None:
+            await self._pool.close()
+        if self._browser is not None:
+            await self._browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+
+    def _plan(self, job):
+        """Validate a job; returns (scene, [(scale, output or None)], format)."""
+        output_format = job.get('format', 'png')
+        if output_format not in FORMATS:
+            raise ValueError(f"Unknown format '{output_format}', expected one of: {', '.join(FORMATS)}")
+        scales = job.get('scales') or [job.get('scale', 2)]
+        if not all(isinstance(scale, (int, float)) and scale > 0 for scale in scales):
+            raise ValueError(f"Invalid scales: {scales}")
+        # 2.0 and 2 must share a cache key with batch and single-file exports
+        scales = [int(scale) if float(scale).is_integer() else scale for scale in scales]
+
+        if 'scene' in job:
+            scene = job['scene']
+            output_file = job.get('output')
+        elif 'input' in job:
+            with open(job['input'], 'r', encoding='utf-8') as f:
+                scene = json.load(f)
+            output_file = job.get('output') or default_output_file(job['input'], output_format)
+        else:
+            raise ValueError("Job needs an 'input' path or an inline 'scene'")
+        if not isinstance(scene, dict):
+            raise ValueError("Scene must be a JSON object")
+
+        multiple = len(scales) > 1
+        outputs = [(scale, _scaled_output(output_file, scale, multiple) if output_file else None) for scale in scales]
+        return scene, outputs, output_format
+
+    async def run_job(self, job):
+        """
+        Export one job; returns {success, outputs[], queue_ms, elapsed_ms} or
+        {success: False, error}.
+
+        Each output is {scale, format, bytes, cached} plus 'output' (the file
+        written) or 'data' (base64, for inline scenes without an output path).
+        """
+        started = time.perf_counter()
+        self._counters['jobs'] += 1
+        try:
+            # Reads the scene file; kept off the loop so other jobs keep streaming
+            scene, outputs, output_format = await asyncio.get_running_loop().run_in_executor(None, self._plan, job)
+            results = {}
+            version = renderer_version(self.renderer)
+            keys = {}
+            if self.cache is not None:
+                for scale, output_file in outputs:
+                    keys[scale] = scene_key(scene, scale, output_format, version)
+                    if output_file and not job.get('force') and self.cache.fetch(keys[scale], output_file,
+                                                                                 output_format):
+                        results[scale] = {'scale': scale, 'format': output_format, 'output': output_file,
+                                          'bytes': os.path.getsize(output_file), 'cached': True}
+
+            pending = [(scale, output_file) for scale, output_file in outputs if scale not in results]
+            queue_ms = 0.0
+            if pending:
+                with tempfile.TemporaryDirectory(prefix='excalidraw-export-') as scratch:
+                    targets = [(scale, output_file or os.path.join(scratch, f"{scale}.{output_format}"))
+                               for scale, output_file in pending]
+                    queued = time.perf_counter()
+                    self._waiting += 1
+                    acquired = False
+                    try:
+                        async with self._slots:
+                            self._waiting -= 1
+                            acquired = True
+                            queue_ms = (time.perf_counter() - queued) * 1000
+                            self._running += 1
+                            try:
+                                sizes = await self._pool.export_scales(scene, targets, output_format=output_format)
+                            finally:
+                                self._running -= 1
+                    finally:
+                        if not acquired:
+                            self._waiting -= 1
+
+                    for (scale, output_file), (_, target), size in zip(pending, targets, sizes):
+                        if size is None:
+                            raise RuntimeError(f"Could not export {output_format.upper()} at scale {scale}")
+                        result = {'scale': scale, 'format': output_format, 'bytes': size, 'cached': False}
+                        if output_file:
+                            result['output'] = output_file
+                            if self.cache is not None:
+                                self.cache.store(keys[scale], output_file, output_format)
+                        else:
+                            with open(target, 'rb') as f:
+                                result['data'] = base64.b64encode(f.read()).decode('ascii')
+                        results[scale] = result
+
+            self._counters['outputs_rendered'] += len(pending)
+            self._counters['outputs_cached'] += len(outputs) - len(pending)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self._latency_ms.append(elapsed_ms)
+            self._queue_ms.append(queue_ms)
+            return {
+                'success': True,
+                'outputs': [results[scale] for scale, _ in outputs],
+                'queue_ms': round(queue_ms, 1),
+                'elapsed_ms': round(elapsed_ms, 1),
+            }
+        except Exception as e:
+            self._counters['failed'] += 1
+            return {'success': False, 'error': f"{type(e).__name__}: {e}"}
+
+    def stats(self):
+        """Queue depth, running jobs, counters and job latency percentiles in ms."""
+        latency = sorted(self._latency_ms)
+        queue = sorted(self._queue_ms)
+        return {
+            'renderer': self.renderer,
+            'pool_size': self.pool_size,
+            'queue_depth': self._waiting,
+            'running': self._running,
+            'uptime_s': round(time.time() - self._started, 1) if self._started else 0,
+            **self._counters,
+            'latency_ms': {
+                'p50': _percentile(latency, 50), 'p95': _percentile(latency, 95), 'p99': _percentile(latency, 99),
+                'max': round(latency[-1], 1) if latency else None,
+            },
+            'queue_ms': {'p50': _percentile(queue, 50), 'p95': _percentile(queue, 95)},
+        }
+
+
+async def _dispatch(daemon, request, stop_event):
+    op = request.get('op', 'export')
+    if op == 'export':
+        return await daemon.run_job(request)
+    if op == 'stats':
+        return {'success': True, 'stats': daemon.stats()}
+    if op == 'shutdown':
+        stop_event.set()
+        return {'success': True, 'status': "Shutting down"}
+    return {'success': False, 'error': f"Unknown op '{op}'"}
+
+
+async def _handle_socket(daemon, stop_event, reader, writer):
+    """One JSON request per line, answered with one JSON line; jobs on a connection run in order."""
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            try:
+                response = await _dispatch(daemon, _parse_request(line), stop_event)
+            except ValueError as e:
+                response = {'success': False, 'error': f"Invalid request: {e}"}
+            writer.write(json.dumps(response).encode('utf-8') + b'\n')
+            await writer.drain()
+    except (ConnectionError, asyncio.LimitOverrunError, asyncio.IncompleteReadError, asyncio.CancelledError):
+        pass
+    finally:
+        writer.close()
+
+
+HTTP_ROUTES = {('POST', '/export'): 'export', ('GET', '/stats'): 'stats', ('POST', '/shutdown'): 'shutdown'}
+
+
+def _reject_http(method, headers, token):
+    """
+    Status and error for a request that must not reach the daemon, or None.
+
+    Browsers can send simple cross-origin POSTs to localhost without a
+    preflight. Requiring a JSON Content-Type forces one, requests carrying an
+    Origin or a non-loopback Host (DNS rebinding) are refused, and the bearer
+    token can only be read by the user running the daemon.
+    """
+    if 'origin' in headers:
+        return 403, "Requests from web pages are not allowed"
+    if headers.get('host', '').rsplit(':', 1)[0] not in LOOPBACK_HOSTS:
+        return 403, f"Host '{headers.get('host', '')}' is not a loopback address"
+    if not hmac.compare_digest(headers.get('authorization', ''), f"Bearer {token}"):
+        return 401, "Missing or wrong token; it is in the token file next to the daemon socket"
+    if method == 'POST' and headers.get('content-type', '').split(';', 1)[0].strip() != 'application/json':
+        return 415, "Content-Type must be application/json"
+    return None
+
+
+async def _handle_http(daemon, stop_event, token, reader, writer):
+    """Minimal HTTP/1.1: POST /export (JSON job), GET /stats, POST /shutdown; all need the daemon's token."""
+    try:
+        method, path, _ = (await reader.readline()).decode('latin-1').split(' ', 2)
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode('latin-1').strip()
+            if not line:
+                break
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get('content-length', 0))
+        op = HTTP_ROUTES.get((method, path.split('?', 1)[0]))
+        # Checked before the body is read, so unauthenticated clients cannot make the daemon buffer it
+        rejected = _reject_http(method, headers, token)
+        if rejected is not None:
+            status, response = rejected[0], {'success': False, 'error': rejected[1]}
+        elif length > MAX_REQUEST_BYTES:
+            status, response = 413, {'success': False, 'error': "Request too large"}
+        elif op is None:
+            status, response = 404, {'success': False, 'error': f"No route for {method} {path}"}
+        else:
+            body = await reader.readexactly(length) if length else b''
+            try:
+                request = _parse_request(body)
+                request['op'] = op
+                response = await _dispatch(daemon, request, stop_event)
+                status = 200 if response['success'] else 422
+            except ValueError as e:
+                status, response = 400, {'success': False, 'error': f"Invalid request: {e}"}
+        payload = json.dumps(response).encode('utf-8')
+        writer.write(
+            f"HTTP/1.1 {status} {http.client.responses[status]}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(payload)}\r\nConnection: close\r\n\r\n".encode('latin-1') + payload
+        )
+        await writer.drain()
+    except (ConnectionError, ValueError, asyncio.IncompleteReadError, asyncio.CancelledError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(daemon, socket_path=None, port=None):
+    """Run daemon behind a Unix socket (default) or HTTP on 127.0.0.1:port until shutdown or a signal."""
+    if port is None and os.path.exists(socket_path) and _socket_in_use(socket_path):
+        raise RuntimeError(f"Another export daemon is already listening on {socket_path}")
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except (NotImplementedError, RuntimeError):
+            pass
+
+    await daemon.start()
+    # Only files this daemon created are removed on the way out, so a failed
+    # start never deletes another daemon's socket or token
+    created = None
+    try:
+        if port is not None:
+            token = None
+            server = await asyncio.start_server(
+                lambda r, w: _handle_http(daemon, stop_event, token, r, w), '127.0.0.1', port, start_serving=False
+            )
+            token = _write_token(token_path(socket_path))
+            created = token_path(socket_path)
+            where = f"http://127.0.0.1:{port} (token in {created})"
+        else:
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
+            # Bind under a private umask so the socket is never reachable by other users
+            umask = os.umask(0o077)
+            try:
+                server = await asyncio.start_unix_server(
+                    lambda r, w: _handle_socket(daemon, stop_event, r, w), socket_path, limit=MAX_REQUEST_BYTES,
+                    start_serving=False
+                )
+            finally:
+                os.umask(umask)
+            created = where = socket_path
+        async with server:
+            await server.start_serving()
+            print(f"Export daemon ready on {where} ({daemon.renderer} renderer, {daemon.pool_size} pages)", flush=True)
+            await stop_event.wait()
+    finally:
+        await daemon.stop()
+        if created is not None and os.path.exists(created):
+            os.remove(created)
+
+
+def request(payload, socket_path=DEFAULT_SOCKET, port=None, timeout=600):
+    """Send one request to a running daemon and return its JSON response."""
+    if port is not None:
+        op = payload.get('op', 'export')
+        method, path = next(route for route, name in HTTP_ROUTES.items() if name == op)
+        with open(token_path(socket_path), 'r', encoding='utf-8') as f:
+            token = f.read().strip()
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=timeout)
+        try:
+            connection.request(method, path, body=json.dumps(payload),
+                               headers={'Content-Type': 'application/json', 'Authorization': f"Bearer {token}"})
+            return json.loads(connection.getresponse().read())
+        finally:
+            connection.close()
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(socket_path)
+        client.sendall(json.dumps(payload).encode('utf-8') + b'\n')
+        with client.makefile('rb') as stream:
+            return json.loads(stream.readline())
+
+
+def _submit(args, input_file):
+    job = {'op': 'export', 'format': args.format, 'scales': args.scale or [2], 'force': args.force}
+    if input_file == '-':
+        job['scene'] = json.load(sys.stdin)
+    else:
+        job['input'] = os.path.abspath(input_file)
+    if args.output:
+        job['output'] = os.path.abspath(args.output)
+    return input_file, request(job, args.socket, args.port)
+
+
+def _client(args):
+    if args.command == 'stats':
+        response = request({'op': 'stats'}, args.socket, args.port)
+        print(json.dumps(response.get('stats', response), indent=2))
+        return 0 if response['success'] else 1
+    if args.command == 'stop':
+        response = request({'op': 'shutdown'}, args.socket, args.port)
+        print(response.get('status') or response.get('error'))
+        return 0 if response['success'] else 1
+
+    if args.output and len(args.inputs) > 1:
+        print("--output can only be used with a single input")
+        return 2
+    # Separate connections let the daemon run the jobs concurrently
+    with ThreadPoolExecutor(max_workers=min(len(args.inputs), 8)) as executor:
+        responses = list(executor.map(lambda input_file: _submit(args, input_file), args.inputs))
+
+    failed = 0
+    for input_file, response in responses:
+        if not response['success']:
+            failed += 1
+            print(f"FAILED  {input_file}: {response['error']}", file=sys.stderr)
+            continue
+        for output in response['outputs']:
+            if 'data' in output:
+                sys.stdout.buffer.write(base64.b64decode(output['data']))
+                sys.stdout.flush()
+            else:
+                tag = 'CACHED' if output['cached'] else 'OK'
+                print(f"{tag:<7} {input_file} -> {output['output']} ({response['elapsed_ms']:.0f} ms)",
+                      file=sys.stderr)
+    return 1 if failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Excalidraw export daemon and client.")
+    transport = argparse.ArgumentParser(add_help=False)
+    transport.add_argument('--socket', default=DEFAULT_SOCKET, help="Unix socket path (default: %(default)s)")
+    transport.add_argument('--port', type=int, help="use HTTP on 127.0.0.1:PORT instead of the Unix socket")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve_parser = commands.add_parser('serve', parents=[transport], help="run the daemon")
+    serve_parser.add_argument('--renderer', choices=RENDERERS, default='auto')
+    serve_parser.add_argument('--pool-size', type=int, default=DEFAULT_POOL_SIZE,
+                              help="pre-loaded pages, i.e. jobs rendering at once (default: %(default)s)")
+    serve_parser.add_argument('--step-timeout', type=float, default=STEP_TIMEOUT_SECONDS)
+    add_cache_arguments(serve_parser)
+
+    submit_parser = commands.add_parser('submit', parents=[transport], help="submit export jobs")
+    submit_parser.add_argument('inputs', nargs='+', help="Excalidraw files, or - to read a scene from stdin")
+    submit_parser.add_argument('--output', help="output path (single input; for - the image goes to stdout)")
+    submit_parser.add_argument('--scale', type=float, action='append',
+                               help="export scale; repeat to render several scales in one job (default: 2)")
+    submit_parser.add_argument('--format', choices=FORMATS, default='png')
+    submit_parser.add_argument('--force', action='store_true', help="re-export even when the cache has the image")
+
+    commands.add_parser('stats', parents=[transport], help="show queue depth and latency stats")
+    commands.add_parser('stop', parents=[transport], help="shut the daemon down")
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        daemon = ExportDaemon(args.renderer, args.pool_size, args.step_timeout, cache_from_arguments(args))
+        try:
+            asyncio.run(serve(daemon, args.socket, args.port))
+        except (RuntimeError, OSError) as e:
+            print(e)
+            sys.exit(2)
+        return
+    try:
+        sys.exit(_client(args))
+    except (FileNotFoundError, ConnectionRefusedError) as e:
+        print(f"Export daemon is not running ({e}). Start it with: python scripts/export_daemon.py serve",
+              file=sys.stderr)
+        sys.exit(2)
+
+
+if __name__ == '__main__':
+    main()
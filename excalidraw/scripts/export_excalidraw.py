@@ -1,75 +1,197 @@
 #!/usr/bin/env python3
 """
 Export Excalidraw JSON file to PNG using headless browser.
+
+Renders with the offline renderer (see local_renderer.py) when it is
+installed, otherwise by driving excalidraw.com.
 """
+import argparse
 import asyncio
 import json
 import os
 import base64
-from playwright.async_api import async_playwright
+import time
+from contextlib import contextmanager
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError, async_playwright
+
+from export_cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES, ExportCache, export_app_state, scene_key
+from local_renderer import (
+    EXPORT_PADDING, PUBLIC_ASSET_PATH, RENDER_SCRIPT, RENDERER_URL, RENDERER_VERSION, renderer_installed,
+    serve_renderer,
+)
+
+RENDERERS = ('auto', 'local', 'remote')
+FORMATS = ('png', 'svg')
+
+# Upper bound for each export phase; phases end as soon as their signal fires
+STEP_TIMEOUT_SECONDS = 30
+
+# Bytes of the exported blob moved from the page per round trip
+TRANSFER_CHUNK_BYTES = 1024 * 1024
+
+# Reads one slice of a blob parked in window.__exportBlobs as base64
+READ_CHUNK_SCRIPT = '''async ([key, offset, length]) => {
+    const chunk = window.__exportBlobs[key].slice(offset, offset + length);
+    const dataUrl = await new Promise((resolve, reject) => {
+        const reader = new FileReader();
+        reader.onload = () => resolve(reader.result);
+        reader.onerror = () => reject(reader.error);
+        reader.readAsDataURL(chunk);
+    });
+    return dataUrl.slice(dataUrl.indexOf(',') + 1);
+}'''
 
 
-async def export_excalidraw_to_png(input_file: str, output_file: str = None, scale: int = 2):
+@contextmanager
+def _phase(timings, name, timeout):
+    """Record the duration of one export phase in timings[name] (ms)."""
+    start = time.perf_counter()
+    try:
+        yield
+    except (PlaywrightTimeoutError, asyncio.TimeoutError) as e:
+        raise TimeoutError(f"Export phase '{name}' did not complete within {timeout}s") from e
+    finally:
+        timings[name] = round((time.perf_counter() - start) * 1000, 1)
+
+
+def _silent(message):
+    pass
+
+
+async def _save_blob(page, blob, output_file, timings, timeout, chunk_bytes=TRANSFER_CHUNK_BYTES):
     """
-    Export an Excalidraw JSON file to PNG via excalidraw.com
+    Stream a blob parked in the page to output_file in chunk_bytes slices and
+    release it; returns the number of bytes written.
 
-    Args:
-        input_file: Path to the .excalidraw.json file
-        output_file: Output PNG path (default: same name with .png)
-        scale: Export scale (1, 2, or 3). Default is 2 for good quality.
+    Only one chunk is held in Python and in the page at a time. The file is
+    written under a temporary name and renamed once complete.
     """
-    if output_file is None:
-        base = os.path.splitext(input_file)[0]
-        if base.endswith('.excalidraw'):
-            base = base[:-11]
-        output_file = base + '.png'
+    with _phase(timings, 'save', timeout):
+        download_path = os.path.abspath(output_file)
+        os.makedirs(os.path.dirname(download_path), exist_ok=True)
+        partial_path = download_path + '.part'
+        try:
+            with open(partial_path, 'wb') as f:
+                for offset in range(0, blob['size'], chunk_bytes):
+                    chunk = await asyncio.wait_for(
+                        page.evaluate(READ_CHUNK_SCRIPT, [blob['key'], offset, chunk_bytes]), timeout
+                    )
+                    f.write(base64.b64decode(chunk))
+            os.replace(partial_path, download_path)
+        except BaseException:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            raise
+        await page.evaluate('(key) => { delete window.__exportBlobs[key]; }', blob['key'])
+    return blob['size']
 
-    with open(input_file, 'r', encoding='utf-8') as f:
-        excalidraw_data = json.load(f)
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            accept_downloads=True
-        )
-
-        # Mock File System Access API
-        await context.add_init_script('''
-            window.__savedBlobData = null;
-            Object.defineProperty(window, 'showSaveFilePicker', {
-                value: async function(options) {
-                    return {
-                        createWritable: async function() {
-                            return {
-                                write: async function(blob) {
-                                    const arrayBuffer = await blob.arrayBuffer();
-                                    const uint8Array = new Uint8Array(arrayBuffer);
-                                    let binary = '';
-                                    for (let i = 0; i < uint8Array.length; i++) {
-                                        binary += String.fromCharCode(uint8Array[i]);
-                                    }
-                                    window.__savedBlobData = btoa(binary);
-                                },
-                                close: async function() {}
-                            };
-                        }
-                    };
-                },
-                writable: false,
-                configurable: false
-            });
-        ''')
+def resolve_renderer(renderer):
+    """Map 'auto' to 'local' or 'remote'; raises ValueError for unknown names."""
+    if renderer not in RENDERERS:
+        raise ValueError(f"Unknown renderer '{renderer}', expected one of: {', '.join(RENDERERS)}")
+    if renderer == 'auto':
+        return 'local' if renderer_installed() else 'remote'
+    return renderer
+
+
+def renderer_version(renderer):
+    """Version string cached exports of renderer are keyed by; excalidraw.com is not pinned."""
+    return RENDERER_VERSION if renderer == 'local' else 'excalidraw.com'
+
 
+def default_output_file(input_file, output_format='png'):
+    """input.excalidraw.json / input.excalidraw / input.json -> input.png"""
+    base = os.path.splitext(input_file)[0]
+    if base.endswith('.excalidraw'):
+        base = base[:-11]
+    return f"{base}.{output_format}"
+
+
+async def _new_context(browser):
+    return await browser.new_context(
+        viewport={'width': 1920, 'height': 1080},
+        accept_downloads=True
+    )
+
+
+async def _load_local(context, timings, timeout, log=print):
+    """Open a page with the pinned local Excalidraw build loaded."""
+    with _phase(timings, 'load', timeout):
+        log("Loading local renderer...")
+        await serve_renderer(context)
         page = await context.new_page()
+        await page.goto(RENDERER_URL, timeout=timeout * 1000)
+        await page.wait_for_function('() => window.rendererLoaded === true', timeout=timeout * 1000)
+    return page
+
+
+async def _render_local(page, excalidraw_data, scales, timings, timeout, output_format='png', log=print):
+    """
+    Render on a local renderer page once per scale; returns [{key, size}] of
+    the blobs parked in the page (see _save_blob). The page can be reused.
+    """
+    with _phase(timings, 'render', timeout):
+        log("Rendering scene...")
+        return await asyncio.wait_for(page.evaluate(RENDER_SCRIPT, {
+            'scene': dict(excalidraw_data, appState=export_app_state(excalidraw_data)),
+            'scales': list(scales),
+            'format': output_format,
+            'padding': EXPORT_PADDING,
+            'publicAssetPath': PUBLIC_ASSET_PATH,
+        }), timeout * len(scales))
+
+
+async def _load_remote(context, timings, timeout, log=print):
+    """Open a page with excalidraw.com loaded and the save-file hook installed."""
+    # Mock File System Access API
+    await context.add_init_script('''
+        window.__exportBlobs = {};
+        Object.defineProperty(window, 'showSaveFilePicker', {
+            value: async function(options) {
+                return {
+                    createWritable: async function() {
+                        return {
+                            write: async function(blob) {
+                                // Kept as a Blob; _save_blob reads it in chunks
+                                window.__exportBlobs.saved = blob;
+                            },
+                            close: async function() {}
+                        };
+                    }
+                };
+            },
+            writable: false,
+            configurable: false
+        });
+    ''')
 
-        print("Opening excalidraw.com...")
-        await page.goto('https://excalidraw.com/')
-        await page.wait_for_selector('canvas', timeout=30000)
-        await asyncio.sleep(3)
+    page = await context.new_page()
+    timeout_ms = timeout * 1000
 
-        print("Importing JSON data...")
+    with _phase(timings, 'load', timeout):
+        log("Opening excalidraw.com...")
+        await page.goto('https://excalidraw.com/', timeout=timeout_ms)
+        await page.wait_for_selector('canvas', timeout=timeout_ms)
+        await page.wait_for_function('''() => document.querySelector('.excalidraw')
+            && !document.querySelector('.LoadingMessage')
+            && document.fonts.status === "loaded"''', timeout=timeout_ms)
+    return page
+
+
+async def _render_remote(page, excalidraw_data, scale, timings, timeout, output_format='png', log=print):
+    """
+    Import the scene into a freshly loaded excalidraw.com page and export it;
+    returns {key, size} of the blob parked in the page, or None. The page
+    keeps the scene afterwards.
+    """
+    timeout_ms = timeout * 1000
+
+    with _phase(timings, 'import', timeout):
+        log("Importing JSON data...")
         await page.evaluate('''async (data) => {
+            // Cleared so the wait below only sees the scene saved after this import
+            localStorage.removeItem('excalidraw');
             const jsonStr = JSON.stringify(data);
             const blob = new Blob([jsonStr], { type: 'application/json' });
             const file = new File([blob], 'import.excalidraw.json', { type: 'application/json' });
@@ -79,75 +201,303 @@ async def export_excalidraw_to_png(input_file: str, output_file: str = None, sca
             canvas.dispatchEvent(new DragEvent('dragenter', { bubbles: true, cancelable: true, dataTransfer }));
             canvas.dispatchEvent(new DragEvent('dragover', { bubbles: true, cancelable: true, dataTransfer }));
             canvas.dispatchEvent(new DragEvent('drop', { bubbles: true, cancelable: true, dataTransfer }));
-        }''', excalidraw_data)
-        await asyncio.sleep(2)
-        print("Import complete.")
+        }''', dict(excalidraw_data, appState=export_app_state(excalidraw_data)))
+        # The app saves the scene to localStorage once the import has been applied.
+        # restore() may drop, repair or re-id elements, so wait for a saved scene
+        # sharing any element with the file rather than an exact match
+        live_elements = [element for element in excalidraw_data.get('elements', []) if not element.get('isDeleted')]
+        await page.wait_for_function('''({ ids, count }) => {
+            if (count === 0) {
+                return true;
+            }
+            try {
+                const saved = localStorage.getItem('excalidraw');
+                const live = saved === null ? [] : JSON.parse(saved).filter((element) => !element.isDeleted);
+                if (ids.length === 0) {
+                    return live.length > 0;
+                }
+                const expected = new Set(ids);
+                return live.some((element) => expected.has(element.id));
+            } catch (e) {
+                return false;
+            }
+        }''', arg={'ids': [element['id'] for element in live_elements if element.get('id')],
+                  'count': len(live_elements)}, timeout=timeout_ms)
+        log("Import complete.")
 
-        print("Opening export dialog...")
+    with _phase(timings, 'dialog', timeout):
+        log("Opening export dialog...")
         await page.keyboard.press('Control+Shift+e')
-        await asyncio.sleep(2)
+        await page.wait_for_selector('.ImageExportModal', state='visible', timeout=timeout_ms)
 
-        # Select scale using Playwright's native click (better for React apps)
-        if scale in [2, 3]:
+    # Select scale using Playwright's native click (better for React apps)
+    if scale in [2, 3]:
+        with _phase(timings, 'scale', timeout):
             scale_text = f"{scale}×"
-            print(f"Selecting scale: {scale_text}")
+            log(f"Selecting scale: {scale_text}")
+            await page.locator(f'.RadioGroup__choice:has-text("{scale_text}")').click(timeout=timeout_ms)
+            await page.wait_for_function('''(text) => [...document.querySelectorAll('.RadioGroup__choice')]
+                .some((choice) => choice.textContent.includes(text)
+                    && (choice.classList.contains('active') || choice.querySelector('input:checked')))''',
+                arg=scale_text, timeout=timeout_ms)
+            log(f"Selected {scale}x scale")
+
+    with _phase(timings, 'export', timeout):
+        # Click PNG/SVG button using Playwright
+        label = output_format.upper()
+        log(f"Clicking {label} button...")
+        await page.locator(f'button:has-text("{label}")').click(timeout=timeout_ms)
+        try:
+            await page.wait_for_function('() => window.__exportBlobs.saved !== undefined', timeout=timeout_ms)
+            blob = {'key': 'saved', 'size': await page.evaluate('() => window.__exportBlobs.saved.size')}
+        except PlaywrightTimeoutError:
+            blob = None
+
+    if blob:
+        log(f"Got blob data, size: {blob['size']} bytes")
+        return blob
+    if output_format != 'png':
+        return None
+
+    log("No blob captured. Falling back to preview canvas...")
+    return await page.evaluate('''() => new Promise((resolve) => {
+        const modal = document.querySelector('.ImageExportModal');
+        const canvas = modal && modal.querySelector('canvas');
+        if (!canvas) {
+            resolve(null);
+            return;
+        }
+        canvas.toBlob((blob) => {
+            if (!blob) {
+                resolve(null);
+                return;
+            }
+            window.__exportBlobs.saved = blob;
+            resolve({ key: 'saved', size: blob.size });
+        }, 'image/png');
+    })''')
+
 
-            # Find and click using Playwright locator
+class ExportPagePool:
+    """
+    Warm, pre-loaded pages on one browser, shared by concurrent exports.
+
+    Local renderer pages are stateless and reused for every export.
+    excalidraw.com pages keep the imported scene, so each one is closed after
+    use and replaced by a freshly loaded page in the background.
+    """
+
+    def __init__(self, browser, renderer='local', size=4, step_timeout=STEP_TIMEOUT_SECONDS):
+        """
+        Args:
+            browser: Playwright Browser the pages are opened in
+            renderer: 'local' or 'remote'
+            size: Number of pages, i.e. how many exports run at once
+            step_timeout: Seconds each phase may take
+        """
+        self.browser = browser
+        self.renderer = renderer
+        self.size = size
+        self.step_timeout = step_timeout
+        self._idle = asyncio.Queue()
+        self._refills = set()
+
+    async def _open_page(self, timings=None):
+        context = await _new_context(self.browser)
+        load = _load_local if self.renderer == 'local' else _load_remote
+        try:
+            return await load(context, {} if timings is None else timings, self.step_timeout, log=_silent)
+        except Exception:
+            await context.close()
+            raise
+
+    async def start(self):
+        """Load all pages concurrently."""
+        for page in await asyncio.gather(*(self._open_page() for _ in range(self.size))):
+            self._idle.put_nowait(page)
+        return self
+
+    def _refill(self):
+        async def refill():
             try:
-                scale_locator = page.locator(f'.RadioGroup__choice:has-text("{scale_text}")')
-                await scale_locator.click()
-                print(f"Clicked {scale}x scale button")
-                await asyncio.sleep(2)
+                page = await self._open_page()
             except Exception as e:
-                print(f"Failed to click scale button: {e}")
-
-        # Click PNG button using Playwright
-        print("Clicking PNG button...")
-        await page.locator('button:has-text("PNG")').click()
-        await asyncio.sleep(3)
-
-        # Get the saved blob data
-        png_data = await page.evaluate('() => window.__savedBlobData')
-        if png_data:
-            print(f"Got blob data, length: {len(png_data)}")
-            download_path = os.path.abspath(output_file)
-            with open(download_path, 'wb') as f:
-                f.write(base64.b64decode(png_data))
-            print(f"Saved PNG to: {download_path}")
-        else:
-            print("No blob captured. Falling back to preview canvas...")
-            png_data = await page.evaluate('''() => {
-                const modal = document.querySelector('.ImageExportModal');
-                if (modal) {
-                    const canvas = modal.querySelector('canvas');
-                    if (canvas) {
-                        return canvas.toDataURL('image/png').split(',')[1];
-                    }
-                }
-                return null;
-            }''')
-
-            if png_data:
-                download_path = os.path.abspath(output_file)
-                with open(download_path, 'wb') as f:
-                    f.write(base64.b64decode(png_data))
-                print(f"Saved PNG from preview to: {download_path}")
+                print(f"Failed to preload page: {e}")
+                page = None  # opened on demand by the next export
+            self._idle.put_nowait(page)
+
+        task = asyncio.ensure_future(refill())
+        self._refills.add(task)
+        task.add_done_callback(self._refills.discard)
+
+    async def export(self, excalidraw_data, output_file, scale=2, timings=None, output_format='png'):
+        """
+        Render a scene on the next free page and write it to output_file;
+        returns the number of bytes written, or None if nothing was produced.
+
+        timings receives 'queue' (waiting for a page) plus the render phases.
+        """
+        sizes = await self.export_scales(excalidraw_data, [(scale, output_file)], timings, output_format)
+        return sizes[0]
+
+    async def export_scales(self, excalidraw_data, outputs, timings=None, output_format='png'):
+        """
+        Render a scene at several scales and write each to its file; returns
+        the bytes written per output (None where nothing was produced).
+
+        Args:
+            outputs: List of (scale, output_file)
+
+        The local renderer draws every scale in one call on one page;
+        excalidraw.com needs a freshly loaded page per scale.
+        """
+        if timings is None:
+            timings = {}
+        if self.renderer == 'local':
+            return await self._export_on_page(excalidraw_data, outputs, timings, output_format)
+        sizes = []
+        for output in outputs:
+            sizes += await self._export_on_page(excalidraw_data, [output], timings, output_format)
+        return sizes
+
+    async def _export_on_page(self, excalidraw_data, outputs, timings, output_format):
+        with _phase(timings, 'queue', None):
+            page = await self._idle.get()
+        reusable = False
+        try:
+            if page is None:
+                page = await self._open_page(timings)
+            if self.renderer == 'local':
+                blobs = await _render_local(page, excalidraw_data, [scale for scale, _ in outputs], timings,
+                                            self.step_timeout, output_format, log=_silent)
             else:
-                print("Could not extract PNG")
-                return None
+                blobs = [await _render_remote(page, excalidraw_data, outputs[0][0], timings, self.step_timeout,
+                                              output_format, log=_silent)]
+            sizes = []
+            for blob, (_, output_file) in zip(blobs, outputs):
+                sizes.append(await _save_blob(page, blob, output_file, timings, self.step_timeout) if blob else None)
+            reusable = self.renderer == 'local'
+            return sizes
+        finally:
+            if reusable:
+                self._idle.put_nowait(page)
+            else:
+                if page is not None:
+                    try:
+                        await page.context.close()
+                    except Exception as e:
+                        print(f"Error closing page: {e}")
+                self._refill()
+
+    async def close(self):
+        """Close every idle page; the browser itself is left to the caller."""
+        if self._refills:
+            await asyncio.gather(*self._refills, return_exceptions=True)
+        while not self._idle.empty():
+            page = self._idle.get_nowait()
+            if page is not None:
+                await page.context.close()
 
-        await browser.close()
 
+async def export_excalidraw_to_png(input_file: str, output_file: str = None, scale: int = 2,
+                                   renderer: str = 'auto', step_timeout: float = STEP_TIMEOUT_SECONDS,
+                                   timings: dict = None, cache: ExportCache = None, force: bool = False):
+    """
+    Export an Excalidraw JSON file to PNG
+
+    Args:
+        input_file: Path to the .excalidraw.json file
+        output_file: Output PNG path (default: same name with .png)
+        scale: Export scale (1, 2, or 3). Default is 2 for good quality.
+        renderer: 'local' renders offline with the installed Excalidraw build,
+            'remote' drives excalidraw.com, 'auto' uses local when installed.
+        step_timeout: Seconds each phase may take before the export fails
+        timings: Optional dict that receives the duration of each phase in ms
+            (launch, load, import/dialog/scale/export or render, save, total)
+        cache: Optional ExportCache; a hit copies the cached PNG without
+            launching a browser
+        force: Export even if the cache has the PNG (the result is still stored)
+    """
+    renderer = resolve_renderer(renderer)
+    if output_file is None:
+        output_file = default_output_file(input_file)
+
+    if timings is None:
+        timings = {}
+    started = time.perf_counter()
+    with open(input_file, 'r', encoding='utf-8') as f:
+        excalidraw_data = json.load(f)
+
+    key = None
+    if cache is not None:
+        key = scene_key(excalidraw_data, scale, 'png', renderer_version(renderer))
+        if not force and cache.fetch(key, output_file):
+            timings['total'] = round((time.perf_counter() - started) * 1000, 1)
+            print(f"Cache hit, saved PNG to: {os.path.abspath(output_file)}")
+            return output_file
+
+    if renderer == 'local' and not renderer_installed():
+        print("Local renderer is not installed. Run: python scripts/local_renderer.py")
+        return None
+
+    async with async_playwright() as p:
+        with _phase(timings, 'launch', step_timeout):
+            browser = await p.chromium.launch(headless=True, timeout=step_timeout * 1000)
+            context = await _new_context(browser)
+
+        try:
+            if renderer == 'local':
+                page = await _load_local(context, timings, step_timeout)
+                blob = (await _render_local(page, excalidraw_data, [scale], timings, step_timeout))[0]
+            else:
+                page = await _load_remote(context, timings, step_timeout)
+                blob = await _render_remote(page, excalidraw_data, scale, timings, step_timeout)
+            if blob:
+                await _save_blob(page, blob, output_file, timings, step_timeout)
+        finally:
+            await browser.close()
+
+    if not blob:
+        print("Could not extract PNG")
+        return None
+
+    if cache is not None:
+        cache.store(key, output_file)
+    timings['total'] = round((time.perf_counter() - started) * 1000, 1)
+    print(f"Saved PNG to: {os.path.abspath(output_file)}")
+    print("Phase timings: " + ", ".join(f"{name} {ms:.0f} ms" for name, ms in timings.items()))
     return output_file
 
 
+def add_cache_arguments(parser):
+    """Add the export cache options shared by the command-line tools."""
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help="export cache directory (default: %(default)s)")
+    parser.add_argument('--cache-max-mb', type=float, default=DEFAULT_MAX_BYTES / (1024 * 1024),
+                        help="trim the cache to this size after each store (default: %(default)s)")
+    parser.add_argument('--no-cache', action='store_true', help="neither read nor write the export cache")
+    parser.add_argument('--force', action='store_true', help="re-export even when the cache has the image")
+
+
+def cache_from_arguments(args):
+    if args.no_cache:
+        return None
+    return ExportCache(args.cache_dir, int(args.cache_max_mb * 1024 * 1024))
+
+
 async def main():
-    import sys
-    input_file = sys.argv[1] if len(sys.argv) > 1 else 'vllm_architecture.excalidraw.json'
-    output_file = sys.argv[2] if len(sys.argv) > 2 else None
-    scale = int(sys.argv[3]) if len(sys.argv) > 3 else 2
+    parser = argparse.ArgumentParser(description="Export an Excalidraw JSON file to PNG.")
+    parser.add_argument('input_file', nargs='?', default='vllm_architecture.excalidraw.json')
+    parser.add_argument('output_file', nargs='?', default=None)
+    parser.add_argument('scale', nargs='?', type=int, default=2)
+    parser.add_argument('--renderer', choices=RENDERERS, default='auto',
+                        help="local (offline), remote (excalidraw.com) or auto (local when installed)")
+    parser.add_argument('--step-timeout', type=float, default=STEP_TIMEOUT_SECONDS,
+                        help="seconds each export phase may take (default: %(default)s)")
+    add_cache_arguments(parser)
+    args = parser.parse_args()
 
-    result = await export_excalidraw_to_png(input_file, output_file, scale)
+    result = await export_excalidraw_to_png(args.input_file, args.output_file, args.scale, args.renderer,
+                                            args.step_timeout, cache=cache_from_arguments(args), force=args.force)
     print(f"Export complete: {result}")
 
 
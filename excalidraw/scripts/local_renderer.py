@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Offline Excalidraw renderer.
+
+Installs a pinned Excalidraw build into renderer/vendor/ and serves it to a
+Playwright context from disk, so exports call Excalidraw's exportToBlob
+directly instead of driving the excalidraw.com UI.
+
+Install once (the only step that needs network):
+    python scripts/local_renderer.py
+    python scripts/local_renderer.py --from-node-modules path/to/node_modules
+"""
+import argparse
+import base64
+import hashlib
+import io
+import json
+import mimetypes
+import os
+import shutil
+import sys
+import tarfile
+import urllib.request
+
+SKILL_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RENDERER_DIR = os.path.join(SKILL_DIR, 'renderer')
+VENDOR_DIR = os.path.join(RENDERER_DIR, 'vendor')
+
+# Origin the renderer page is served from; requests to it never leave the browser
+RENDERER_ORIGIN = 'http://excalidraw-renderer.local'
+RENDERER_URL = RENDERER_ORIGIN + '/index.html'
+
+NPM_REGISTRY = 'https://registry.npmjs.org'
+
+# package -> (version, {path inside the package tarball: path under vendor/})
+PACKAGES = {
+    'react': ('18.2.0', {
+        'umd/react.production.min.js': 'react.production.min.js',
+    }),
+    'react-dom': ('18.2.0', {
+        'umd/react-dom.production.min.js': 'react-dom.production.min.js',
+    }),
+    '@excalidraw/excalidraw': ('0.17.6', {
+        'dist/excalidraw.production.min.js': 'excalidraw.production.min.js',
+        'dist/excalidraw-assets/Virgil.woff2': 'excalidraw-assets/Virgil.woff2',
+        'dist/excalidraw-assets/Cascadia.woff2': 'excalidraw-assets/Cascadia.woff2',
+        'dist/excalidraw-assets/Assistant-Regular.woff2': 'excalidraw-assets/Assistant-Regular.woff2',
+    }),
+}
+
+# Identifies the rendering pipeline; changes whenever the pinned build changes
+RENDERER_VERSION = 'excalidraw-' + PACKAGES['@excalidraw/excalidraw'][0]
+
+# Excalidraw's own default padding around exported scenes
+EXPORT_PADDING = 10
+
+# Where exported SVGs load their fonts from, instead of the local renderer origin
+PUBLIC_ASSET_PATH = f"https://unpkg.com/@excalidraw/excalidraw@{PACKAGES['@excalidraw/excalidraw'][0]}/dist/"
+
+# Renders the scene once per scale as PNG (exportToBlob) or SVG (exportToSvg)
+# and parks each blob in window.__exportBlobs; returns [{key, size}] for
+# chunked reads
+RENDER_SCRIPT = '''async ({ scene, scales, format, padding, publicAssetPath }) => {
+    await window.rendererReady;
+    const appState = Object.assign(
+        { exportBackground: true, exportWithDarkMode: false, viewBackgroundColor: '#ffffff' },
+        scene.appState || {}
+    );
+    const assetUrl = new RegExp('url\\\\((["\\\\x27]?)' + window.EXCALIDRAW_ASSET_PATH, 'g');
+    window.__exportBlobs = window.__exportBlobs || {};
+    const results = [];
+    for (const scale of scales) {
+        let blob;
+        if (format === 'svg') {
+            const svg = await ExcalidrawLib.exportToSvg({
+                elements: scene.elements || [],
+                appState: Object.assign({}, appState, { exportScale: scale }),
+                files: scene.files || null,
+                exportPadding: padding,
+            });
+            const markup = svg.outerHTML.replace(assetUrl, 'url($1' + publicAssetPath);
+            blob = new Blob([markup], { type: 'image/svg+xml' });
+        } else {
+            blob = await ExcalidrawLib.exportToBlob({
+                elements: scene.elements || [],
+                appState,
+                files: scene.files || null,
+                mimeType: 'image/png',
+                exportPadding: padding,
+                getDimensions: (width, height) => ({ width: width * scale, height: height * scale, scale }),
+            });
+        }
+        window.__exportCount = (window.__exportCount || 0) + 1;
+        const key = 'export-' + window.__exportCount;
+        window.__exportBlobs[key] = blob;
+        results.push({ key, size: blob.size });
+    }
+    return results;
+}'''
+
+
+def vendor_files():
+    """Paths under vendor/ that a complete install provides."""
+    return [target for _, files in PACKAGES.values() for target in files.values()]
+
+
+def renderer_installed() -> bool:
+    """True if every pinned asset is present in renderer/vendor/."""
+    return all(os.path.isfile(os.path.join(VENDOR_DIR, path)) for path in vendor_files())
+
+
+def _verify_integrity(data: bytes, integrity: str, name: str):
+    algorithm, _, expected = integrity.partition('-')
+    actual = base64.b64encode(hashlib.new(algorithm, data).digest()).decode('ascii')
+    if actual != expected:
+        raise ValueError(f"Integrity check failed for {name}")
+
+
+def _download_package(name: str, version: str, registry: str) -> tarfile.TarFile:
+    with urllib.request.urlopen(f"{registry}/{name}/{version}", timeout=60) as response:
+        dist = json.load(response)['dist']
+    with urllib.request.urlopen(dist['tarball'], timeout=120) as response:
+        data = response.read()
+    if dist.get('integrity'):
+        _verify_integrity(data, dist['integrity'], f"{name}@{version}")
+    return tarfile.open(fileobj=io.BytesIO(data), mode='r:gz')
+
+
+def install_renderer(node_modules: str = None, registry: str = NPM_REGISTRY) -> str:
+    """
+    Install the pinned Excalidraw build into renderer/vendor/.
+
+    Args:
+        node_modules: Copy from an existing node_modules directory instead of
+            downloading (its package versions must match PACKAGES)
+        registry: npm registry to download from
+
+    Returns:
+        The vendor directory
+    """
+    for name, (version, files) in PACKAGES.items():
+        if node_modules:
+            package_dir = os.path.join(node_modules, name)
+            with open(os.path.join(package_dir, 'package.json'), 'r', encoding='utf-8') as f:
+                found = json.load(f)['version']
+            if found != version:
+                raise ValueError(f"{name} in {node_modules} is {found}, expected {version}")
+            for source, target in files.items():
+                destination = os.path.join(VENDOR_DIR, target)
+                os.makedirs(os.path.dirname(destination), exist_ok=True)
+                shutil.copyfile(os.path.join(package_dir, source), destination)
+        else:
+            print(f"Downloading {name}@{version}...")
+            with _download_package(name, version, registry) as archive:
+                for source, target in files.items():
+                    # npm tarballs put package contents under package/
+                    member = archive.extractfile(f"package/{source}")
+                    destination = os.path.join(VENDOR_DIR, target)
+                    os.makedirs(os.path.dirname(destination), exist_ok=True)
+                    with open(destination, 'wb') as f:
+                        shutil.copyfileobj(member, f)
+    print(f"Installed {RENDERER_VERSION} to {VENDOR_DIR}")
+    return VENDOR_DIR
+
+
+async def serve_renderer(context):
+    """Serve renderer/ at RENDERER_ORIGIN in a Playwright context, straight from disk."""
+    root = os.path.realpath(RENDERER_DIR)
+
+    async def handle(route):
+        path = route.request.url[len(RENDERER_ORIGIN):].split('?', 1)[0].lstrip('/') or 'index.html'
+        file_path = os.path.realpath(os.path.join(root, path))
+        if not file_path.startswith(root + os.sep) or not os.path.isfile(file_path):
+            await route.fulfill(status=404, body='Not found')
+            return
+        content_type = mimetypes.guess_type(file_path)[0] or 'application/octet-stream'
+        if file_path.endswith('.woff2'):
+            content_type = 'font/woff2'
+        await route.fulfill(path=file_path, headers={'Content-Type': content_type})
+
+    await context.route(RENDERER_ORIGIN + '/**', handle)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Install the offline Excalidraw renderer.")
+    parser.add_argument('--from-node-modules', metavar='DIR',
+                        help="copy the pinned packages from an existing node_modules instead of downloading")
+    parser.add_argument('--registry', default=NPM_REGISTRY, help="npm registry URL")
+    parser.add_argument('--check', action='store_true', help="only report whether the renderer is installed")
+    args = parser.parse_args()
+
+    if args.check:
+        installed = renderer_installed()
+        print(f"{RENDERER_VERSION}: {'installed' if installed else 'not installed'} ({VENDOR_DIR})")
+        sys.exit(0 if installed else 1)
+    install_renderer(args.from_node_modules, args.registry)
+
+
+if __name__ == '__main__':
+    main()